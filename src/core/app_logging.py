@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 
 from src.core.runtime_paths import logs_dir
@@ -11,20 +11,27 @@ def default_log_file() -> Path:
     return logs_dir() / "sludre.log"
 
 
+def _file_handler_of(handler: logging.Handler) -> logging.Handler | None:
+    if isinstance(handler, MemoryHandler):
+        return handler.target
+    return handler
+
+
 def configure_logging(log_file: Path | None = None) -> Path:
     target = log_file or default_log_file()
-    target.parent.mkdir(parents=True, exist_ok=True)
 
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
 
-    if any(
-        isinstance(handler, RotatingFileHandler)
-        and Path(handler.baseFilename) == target
-        for handler in root_logger.handlers
-    ):
-        return target
+    for handler in root_logger.handlers:
+        file_handler = _file_handler_of(handler)
+        if (
+            isinstance(file_handler, RotatingFileHandler)
+            and Path(file_handler.baseFilename) == target
+        ):
+            return target
 
+    target.parent.mkdir(parents=True, exist_ok=True)
     formatter = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -36,5 +43,13 @@ def configure_logging(log_file: Path | None = None) -> Path:
         encoding="utf-8",
     )
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    # Batch INFO records; warnings and errors flush immediately. logging.shutdown()
+    # at interpreter exit flushes whatever is still buffered.
+    buffered_handler = MemoryHandler(
+        capacity=256,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    root_logger.addHandler(buffered_handler)
     return target
@@ -8,6 +8,11 @@ import numpy as np
 import sounddevice as sd
 
 
+SILENCE_THRESHOLD = 0.01
+INT16_SCALE = 32768.0
+_SILENCE_THRESHOLD_INT16 = int(SILENCE_THRESHOLD * INT16_SCALE)
+
+
 class AudioCapture:
     def __init__(
         self,
@@ -21,7 +26,12 @@ class AudioCapture:
         self.max_record_seconds = max_record_seconds
         self.silence_trim = silence_trim
         self._stream: sd.InputStream | None = None
-        self._frames: list[np.ndarray] = []
+        self._buffer = np.empty(0, dtype=np.int16)
+        self._cursor = 0
+        self._voiced_end = 0
+        # Scratch masks reused by the audio callback so it does not allocate per block.
+        self._mask_high = np.empty(0, dtype=np.bool_)
+        self._mask_low = np.empty(0, dtype=np.bool_)
         self._lock = threading.Lock()
         self._is_recording = False
         self._started_at = 0.0
@@ -35,18 +45,45 @@ class AudioCapture:
             # Stream status is informational and not fatal by itself.
             pass
         mono = cast(np.ndarray, indata[:, 0] if indata.ndim > 1 else indata)
+        mask = self._voiced_mask(mono) if self.silence_trim else None
+        voiced = self._voiced_span(mask) if mask is not None else (0, mono.shape[0])
         with self._lock:
-            self._frames.append(mono.copy())
+            start = self._cursor
+            offset = 0
+            if start == 0:
+                # Leading silence is never stored.
+                if voiced is None:
+                    return
+                offset = voiced[0]
+            end = min(start + mono.shape[0] - offset, self._buffer.shape[0])
+            if end <= start:
+                return
+            stored = mono[offset : offset + end - start]
+            np.copyto(self._buffer[start:end], stored)
+            self._cursor = end
+            if stored.shape[0] < mono.shape[0] - offset:
+                # Block was cut at max_record_seconds; only the kept part counts.
+                if mask is not None:
+                    voiced = self._voiced_span(mask[offset : offset + stored.shape[0]])
+                else:
+                    voiced = (0, stored.shape[0])
+                offset = 0
+            if voiced is not None:
+                self._voiced_end = start + voiced[1] - offset
 
     def start(self) -> None:
         if self._is_recording:
             return
+        max_samples = int(self.sample_rate * self.max_record_seconds)
         with self._lock:
-            self._frames.clear()
+            if self._buffer.shape[0] != max_samples:
+                self._buffer = np.empty(max_samples, dtype=np.int16)
+            self._cursor = 0
+            self._voiced_end = 0
         self._stream = sd.InputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
-            dtype="float32",
+            dtype="int16",
             callback=self._callback,
         )
         self._stream.start()
@@ -63,23 +100,44 @@ class AudioCapture:
             self._stream.close()
             self._stream = None
 
+        # Detach the buffer under the lock and convert it outside, so a new
+        # recording's callback never waits on the float conversion.
         with self._lock:
-            if not self._frames:
-                return np.array([], dtype=np.float32)
-            audio = np.concatenate(self._frames).astype(np.float32, copy=False)
-            self._frames.clear()
+            buffer = self._buffer
+            voiced_end = self._voiced_end
+            self._buffer = np.empty(0, dtype=np.int16)
+            self._cursor = 0
+            self._voiced_end = 0
 
-        max_samples = int(self.sample_rate * self.max_record_seconds)
-        if audio.shape[0] > max_samples:
-            audio = audio[:max_samples]
+        # Trailing silence after the last voiced sample is dropped here; the
+        # int16 -> float32 cast and the scaling run as one fused ufunc pass.
+        audio = np.multiply(buffer[:voiced_end], np.float32(1.0 / INT16_SCALE), dtype=np.float32)
 
-        if self.silence_trim and audio.shape[0] > 0:
-            audio = self._trim_silence(audio)
+        with self._lock:
+            if self._buffer.shape[0] == 0:
+                # Hand the allocation back for the next recording.
+                self._buffer = buffer
         return audio
 
+    def _voiced_mask(self, block: np.ndarray) -> np.ndarray:
+        size = block.shape[0]
+        if self._mask_high.shape[0] < size:
+            self._mask_high = np.empty(size, dtype=np.bool_)
+            self._mask_low = np.empty(size, dtype=np.bool_)
+        high = self._mask_high[:size]
+        low = self._mask_low[:size]
+        # Two comparisons instead of np.abs: abs(-32768) overflows int16.
+        np.greater(block, _SILENCE_THRESHOLD_INT16, out=high)
+        np.less(block, -_SILENCE_THRESHOLD_INT16, out=low)
+        np.logical_or(high, low, out=high)
+        return high
+
     @staticmethod
-    def _trim_silence(audio: np.ndarray, threshold: float = 0.01) -> np.ndarray:
-        idx = np.where(np.abs(audio) > threshold)[0]
-        if idx.size == 0:
-            return np.array([], dtype=np.float32)
-        return audio[idx[0] : idx[-1] + 1]
+    def _voiced_span(mask: np.ndarray) -> tuple[int, int] | None:
+        if mask.shape[0] == 0:
+            return None
+        first = int(mask.argmax())
+        if not mask[first]:
+            return None
+        last = mask.shape[0] - int(mask[::-1].argmax())
+        return first, last
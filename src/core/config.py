@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
+from src.core import json_io
 from src.core.runtime_paths import (
     config_path_default,
     models_dir,
@@ -17,8 +21,14 @@ DEFAULT_LLM_SYSTEM_PROMPT = (
     "You clean up Danish speech-to-text output. "
     "Return only the cleaned final text without explanations."
 )
+# Stamped into every config.json write; files without it (from earlier releases)
+# are rewritten once on load.
+CONFIG_VERSION = 2
 DEFAULT_PROMPT_PRESET_NAME = "Standard"
 DEFAULT_MISTRAL_BASE_URL = "https://api.mistral.ai/v1"
+QUANTIZATION_MODES = ["auto", "int8_float16", "int8", "float16"]
+# "type_short" types text shorter than DIRECT_TYPING_MAX_CHARS instead of pasting.
+INSERT_MODES = ["clipboard_paste", "type_short"]
 MISTRAL_MODEL_PRESETS = [
     "mistral-small-latest",
     "mistral-large-latest",
@@ -26,6 +36,7 @@ MISTRAL_MODEL_PRESETS = [
 ]
 
 
+@lru_cache(maxsize=1)
 def _default_app_dir() -> Path:
     appdata = os.getenv("APPDATA")
     if appdata:
@@ -33,6 +44,7 @@ def _default_app_dir() -> Path:
     return Path.home() / f".{APP_DIR_NAME.lower()}"
 
 
+@lru_cache(maxsize=1)
 def _legacy_default_model_cache_dir() -> Path:
     local_app_data = os.getenv("LOCALAPPDATA")
     if local_app_data:
@@ -40,25 +52,31 @@ def _legacy_default_model_cache_dir() -> Path:
     return _default_app_dir() / "models"
 
 
+@lru_cache(maxsize=1)
 def _default_model_cache_dir() -> Path:
     return models_dir()
 
 
+@lru_cache(maxsize=1)
 def _default_wordlist_path() -> Path:
     return wordlist_path_default()
 
 
+@lru_cache(maxsize=1)
 def _legacy_default_config_path() -> Path:
     return _default_app_dir() / "config.json"
 
 
-def _same_path(a: str | Path, b: str | Path) -> bool:
-    left = os.path.normcase(os.path.abspath(str(a)))
-    right = os.path.normcase(os.path.abspath(str(b)))
-    return left == right
+def _normalize_path(path: str | Path) -> str:
+    return os.path.normcase(os.path.abspath(str(path)))
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _legacy_default_model_cache_dir_normalized() -> str:
+    return _normalize_path(_legacy_default_model_cache_dir())
+
+
+@dataclass(slots=True)
 class AppConfig:
     hotkey: str = "ctrl+space"
     language: str = "da"
@@ -69,6 +87,7 @@ class AppConfig:
     model_repo_id: str = "syvai/hviske-v2"
     model_cache_dir: str = ""
     manual_model_path: str = ""
+    quantization_mode: str = "auto"
     hf_token: str = ""
     llm_enabled: bool = False
     llm_provider: str = "openai_compatible"
@@ -91,97 +110,142 @@ class AppConfig:
 
     @classmethod
     def defaults(cls) -> "AppConfig":
-        cfg = cls()
-        cfg.model_cache_dir = str(_default_model_cache_dir())
-        cfg.wordlist_path = str(_default_wordlist_path())
-        cfg.llm_prompt_presets = [
+        template = _defaults_template()
+        return replace(
+            template,
+            llm_prompt_presets=[dict(preset) for preset in template.llm_prompt_presets],
+        )
+
+
+@lru_cache(maxsize=1)
+def _defaults_template() -> AppConfig:
+    return AppConfig(
+        model_cache_dir=str(_default_model_cache_dir()),
+        wordlist_path=str(_default_wordlist_path()),
+        llm_prompt_presets=[
             {
                 "name": DEFAULT_PROMPT_PRESET_NAME,
                 "prompt": DEFAULT_LLM_SYSTEM_PROMPT,
             }
-        ]
-        cfg.llm_selected_prompt_name = DEFAULT_PROMPT_PRESET_NAME
-        return cfg
+        ],
+    )
+
+
+def _field_map(config: AppConfig) -> dict[str, Any]:
+    # Shallow field map: serialization and change checks only read the values, so
+    # the nested preset list does not need the deep copy asdict() would make.
+    return {item.name: getattr(config, item.name) for item in fields(config)}
 
 
 class ConfigStore:
     def __init__(self, path: Path):
         self.path = path
+        self._cache: tuple[tuple[int, int], AppConfig] | None = None
 
     @classmethod
     def default(cls) -> "ConfigStore":
         return cls(config_path_default())
 
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def load(self) -> AppConfig:
+        signature = self._file_signature()
+        if signature is not None and self._cache is not None and self._cache[0] == signature:
+            return copy.deepcopy(self._cache[1])
+        cfg, saved = self._load_uncached(file_exists=signature is not None)
+        if saved:
+            signature = self._file_signature()
+        if signature is not None:
+            self._cache = (signature, copy.deepcopy(cfg))
+        return cfg
+
+    def _load_uncached(self, file_exists: bool) -> tuple[AppConfig, bool]:
         source_path = self.path
-        if not source_path.exists():
+        if not file_exists:
             legacy_path = _legacy_default_config_path()
             if legacy_path.exists():
                 source_path = legacy_path
             else:
                 cfg = AppConfig.defaults()
-                self.save(cfg)
-                return cfg
+                self._write(cfg)
+                return cfg, True
 
-        raw = json.loads(source_path.read_text(encoding="utf-8"))
+        raw = json.loads(source_path.read_bytes())
         cfg = AppConfig.defaults()
-        should_save = source_path != self.path
+        migrated = source_path != self.path
         for key, value in raw.items():
             if hasattr(cfg, key):
                 setattr(cfg, key, value)
+        before = _field_map(cfg)
+        self._sanitize(cfg)
+        # A file is only rewritten when sanitizing repaired something, or when it
+        # predates the current version stamp.
+        if (
+            not migrated
+            and raw.get("_version") == CONFIG_VERSION
+            and _field_map(cfg) == before
+        ):
+            return cfg, False
+        self._write(cfg)
+        return cfg, True
+
+    @staticmethod
+    def _sanitize(cfg: AppConfig) -> None:
         if not cfg.model_cache_dir:
             cfg.model_cache_dir = str(_default_model_cache_dir())
-            should_save = True
-        elif _same_path(cfg.model_cache_dir, _legacy_default_model_cache_dir()):
+        elif _normalize_path(cfg.model_cache_dir) == _legacy_default_model_cache_dir_normalized():
             cfg.model_cache_dir = str(_default_model_cache_dir())
-            should_save = True
         if not cfg.wordlist_path:
             cfg.wordlist_path = str(_default_wordlist_path())
-            should_save = True
-        if cfg.llm_timeout_seconds < 1 or cfg.llm_timeout_seconds > 60:
+        if cfg.quantization_mode not in QUANTIZATION_MODES:
+            cfg.quantization_mode = "auto"
+        if cfg.insert_mode not in INSERT_MODES:
+            cfg.insert_mode = "clipboard_paste"
+        if (
+            not isinstance(cfg.llm_timeout_seconds, int)
+            or cfg.llm_timeout_seconds < 1
+            or cfg.llm_timeout_seconds > 60
+        ):
             cfg.llm_timeout_seconds = 5
-            should_save = True
         if not isinstance(cfg.llm_prompt_presets, list):
             cfg.llm_prompt_presets = AppConfig.defaults().llm_prompt_presets
-            should_save = True
         sanitized_presets: list[dict[str, str]] = []
+        prompts_by_name: dict[str, str] = {}
         for preset in cfg.llm_prompt_presets:
             if not isinstance(preset, dict):
                 continue
             name = str(preset.get("name", "")).strip()
             prompt = str(preset.get("prompt", "")).strip()
-            if not name or not prompt:
+            if not name or not prompt or name in prompts_by_name:
                 continue
             sanitized_presets.append({"name": name, "prompt": prompt})
+            prompts_by_name[name] = prompt
         if not sanitized_presets:
             sanitized_presets = AppConfig.defaults().llm_prompt_presets
-            should_save = True
-        if sanitized_presets != cfg.llm_prompt_presets:
-            should_save = True
+            prompts_by_name = {
+                preset["name"]: preset["prompt"] for preset in sanitized_presets
+            }
         cfg.llm_prompt_presets = sanitized_presets
-        selected_names = {preset["name"] for preset in cfg.llm_prompt_presets}
-        if cfg.llm_selected_prompt_name not in selected_names:
-            cfg.llm_selected_prompt_name = cfg.llm_prompt_presets[0]["name"]
-            should_save = True
-        selected_prompt_text = ""
-        for preset in cfg.llm_prompt_presets:
-            if preset["name"] == cfg.llm_selected_prompt_name:
-                selected_prompt_text = preset["prompt"]
-                break
-        if selected_prompt_text and cfg.llm_system_prompt != selected_prompt_text:
-            cfg.llm_system_prompt = selected_prompt_text
-            should_save = True
-        if should_save:
-            self.save(cfg)
-        return cfg
+        if cfg.llm_selected_prompt_name not in prompts_by_name:
+            cfg.llm_selected_prompt_name = sanitized_presets[0]["name"]
+        cfg.llm_system_prompt = prompts_by_name[cfg.llm_selected_prompt_name]
 
     def save(self, config: AppConfig, persist_secrets: bool = False) -> None:
-        payload = asdict(config)
+        self._write(config, persist_secrets=persist_secrets)
+
+    def _write(self, config: AppConfig, persist_secrets: bool = False) -> None:
+        payload = _field_map(config)
         if not persist_secrets:
             payload["hf_token"] = ""
             payload["llm_api_key"] = ""
+        payload["_version"] = CONFIG_VERSION
+        # The (mtime_ns, size) signature can miss a same-size rewrite within the
+        # filesystem's timestamp granularity, so a write always drops the cache.
+        self._cache = None
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=True),
-            encoding="utf-8",
-        )
+        json_io.write_atomic(self.path, json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8"))
@@ -6,25 +6,29 @@ from pathlib import Path
 from src.core.runtime_paths import project_env_path
 
 
-_KEY_PATTERN = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
+# KEY=value lines; keys are ASCII identifiers, anything else is ignored.
+_ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$", re.MULTILINE)
 
 
 class EnvSecretsStore:
     def __init__(self, path: Path):
         self.path = path
+        self._cache: tuple[tuple[int, int], dict[str, str], list[str]] | None = None
 
     @classmethod
     def default(cls) -> "EnvSecretsStore":
         return cls(project_env_path())
 
     def ensure_exists(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        if self.path.exists():
+        try:
+            handle = self.path.open("x", encoding="utf-8")
+        except FileExistsError:
             return
-        self.path.write_text(
-            "# Sludre local secrets\n",
-            encoding="utf-8",
-        )
+        except FileNotFoundError:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle = self.path.open("x", encoding="utf-8")
+        with handle:
+            handle.write("# Sludre local secrets\n")
 
     def get_secret(self, key: str) -> str:
         values, _ = self._read_values()
@@ -34,31 +38,63 @@ class EnvSecretsStore:
         values, order = self._read_values()
         clean = value.strip()
         if clean:
+            if values.get(key) == clean:
+                return
             if key not in values:
-                order.append(key)
+                self._append_value(key, clean)
+                return
             values[key] = clean
         else:
+            if key not in values:
+                return
             values.pop(key, None)
             order = [existing for existing in order if existing != key]
         self._write_values(values, order)
 
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def _read_values(self) -> tuple[dict[str, str], list[str]]:
-        if not self.path.exists():
-            return {}, []
+        signature = self._file_signature()
+        if signature is not None and self._cache is not None and self._cache[0] == signature:
+            return dict(self._cache[1]), list(self._cache[2])
         values: dict[str, str] = {}
         order: list[str] = []
-        for line in self.path.read_text(encoding="utf-8").splitlines():
-            match = _KEY_PATTERN.match(line)
-            if not match:
-                continue
-            key = match.group(1)
-            raw_value = match.group(2)
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return values, order
+        for match in _ENV_LINE_RE.finditer(text):
+            key, raw_value = match.groups()
             if key not in values:
                 order.append(key)
             values[key] = self._decode_value(raw_value)
+        if signature is not None:
+            self._cache = (signature, dict(values), list(order))
         return values, order
 
+    def _append_value(self, key: str, value: str) -> None:
+        self._cache = None
+        self.ensure_exists()
+        with self.path.open("rb") as handle:
+            handle.seek(0, 2)
+            needs_newline = False
+            if handle.tell() > 0:
+                handle.seek(-1, 2)
+                needs_newline = handle.read(1) != b"\n"
+        with self.path.open("a", encoding="utf-8") as handle:
+            if needs_newline:
+                handle.write("\n")
+            handle.write(f"{key}={self._encode_value(value)}\n")
+
     def _write_values(self, values: dict[str, str], order: list[str]) -> None:
+        # A same-size rewrite within the mtime granularity keeps the old
+        # signature, so writes never trust the cache.
+        self._cache = None
         self.ensure_exists()
         lines = ["# Sludre local secrets\n"]
         for key in order:
@@ -13,33 +13,37 @@ class HotkeyController:
     ) -> None:
         self.on_start = on_start
         self.on_stop = on_stop
-        self._space_press_hook = None
+        self._chord_hotkey = None
         self._space_release_hook = None
         self._active = False
 
     def register(self) -> None:
-        if self._space_press_hook is not None:
+        if self._chord_hotkey is not None:
             return
-        self._space_press_hook = keyboard.on_press_key("space", self._on_space_down)
+        self._chord_hotkey = keyboard.add_hotkey(
+            "ctrl+space",
+            self._on_chord_down,
+            suppress=False,
+            trigger_on_release=False,
+        )
         self._space_release_hook = keyboard.on_release_key(
             "space", self._on_space_up
         )
 
     def unregister(self) -> None:
-        if self._space_press_hook is not None:
-            keyboard.unhook(self._space_press_hook)
-            self._space_press_hook = None
+        if self._chord_hotkey is not None:
+            keyboard.remove_hotkey(self._chord_hotkey)
+            self._chord_hotkey = None
         if self._space_release_hook is not None:
             keyboard.unhook(self._space_release_hook)
             self._space_release_hook = None
         self._active = False
 
-    def _on_space_down(self, _event) -> None:
+    def _on_chord_down(self) -> None:
         if self._active:
             return
-        if keyboard.is_pressed("ctrl"):
-            self._active = True
-            self.on_start()
+        self._active = True
+        self.on_start()
 
     def _on_space_up(self, _event) -> None:
         if not self._active:
@@ -1,27 +1,140 @@
 from __future__ import annotations
 
+import http.client
 import json
 import logging
 import os
+import threading
 import time
+import urllib.parse
+import urllib.request
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
+from urllib.error import HTTPError
 
 from src.core.config import AppConfig, DEFAULT_MISTRAL_BASE_URL
 from src.core.env_secrets import EnvSecretsStore
 
 
+_CONNECTIONS: dict[tuple[str, str], Any] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+@dataclass
+class _BufferedResponse:
+    status: int
+    body: bytes
+
+    def read(self) -> bytes:
+        return self.body
+
+
+def _open_connection(scheme: str, netloc: str, timeout: int) -> Any:
+    if scheme == "https":
+        return http.client.HTTPSConnection(netloc, timeout=timeout)
+    return http.client.HTTPConnection(netloc, timeout=timeout)
+
+
 def _urlopen(request: Any, timeout: int):
-    from urllib.request import urlopen
+    scheme = request.type
+    netloc = request.host
+    if scheme not in {"http", "https"} or scheme in urllib.request.getproxies():
+        return urllib.request.urlopen(request, timeout=timeout)
 
-    return urlopen(request, timeout=timeout)
+    key = (scheme, netloc)
+    with _CONNECTIONS_LOCK:
+        connection = _CONNECTIONS.pop(key, None)
+    reused = connection is not None
+    while True:
+        if connection is None:
+            connection = _open_connection(scheme, netloc, timeout)
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        try:
+            connection.request(
+                request.get_method(),
+                request.selector,
+                body=request.data,
+                headers=dict(request.header_items()),
+            )
+            response = connection.getresponse()
+            body = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            connection.close()
+            connection = None
+            if not reused:
+                raise
+            # Keep-alive connection was dropped by the server while idle; retry once.
+            reused = False
+            continue
+        except Exception:
+            connection.close()
+            raise
+        break
+
+    if response.will_close:
+        connection.close()
+    else:
+        with _CONNECTIONS_LOCK:
+            previous = _CONNECTIONS.pop(key, None)
+            _CONNECTIONS[key] = connection
+        if previous is not None:
+            previous.close()
+    if 300 <= response.status < 400:
+        # http.client does not follow redirects; hand the request to urllib so
+        # they are handled exactly as before the connection pool existed.
+        return urllib.request.urlopen(request, timeout=timeout)
+    if response.status >= 400:
+        raise HTTPError(
+            request.full_url,
+            response.status,
+            response.reason,
+            response.headers,
+            None,
+        )
+    return _BufferedResponse(status=response.status, body=body)
+
+
+def _preconnect(url: str, timeout: int) -> None:
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme
+    netloc = parts.netloc
+    if scheme not in {"http", "https"} or scheme in urllib.request.getproxies():
+        return
+    key = (scheme, netloc)
+    with _CONNECTIONS_LOCK:
+        if key in _CONNECTIONS:
+            return
+    connection = _open_connection(scheme, netloc, timeout)
+    try:
+        connection.connect()
+    except Exception:
+        connection.close()
+        raise
+    with _CONNECTIONS_LOCK:
+        if key not in _CONNECTIONS:
+            _CONNECTIONS[key] = connection
+            return
+    connection.close()
 
 
 def _request(url: str, data: bytes, headers: dict[str, str]) -> Any:
-    from urllib.request import Request
+    return urllib.request.Request(url=url, data=data, headers=headers, method="POST")
+
 
-    return Request(url=url, data=data, headers=headers, method="POST")
+@lru_cache(maxsize=8)
+def _compose_system_prompt(system_prompt: str, preferred_terms: tuple[str, ...]) -> str:
+    system_content = system_prompt.strip()
+    if preferred_terms:
+        joined = ", ".join(preferred_terms)
+        system_content += (
+            "\n\nPrefer these terms when appropriate: "
+            f"{joined}"
+        )
+    return system_content
 
 
 class LlmRefineError(RuntimeError):
@@ -93,15 +206,15 @@ class LlmRefiner:
         self._emit_ui_log(
             f"LLM input preview: {self._preview_text(text)}"
         )
-        started = time.perf_counter()
+        started = time.perf_counter_ns()
         try:
             response = _urlopen(
                 _request(endpoint, body, headers),
                 timeout=config.llm_timeout_seconds,
             )
             status = getattr(response, "status", None) or getattr(response, "code", None)
-            raw = response.read().decode("utf-8")
-            latency_ms = int((time.perf_counter() - started) * 1000)
+            raw = response.read()
+            latency_ms = (time.perf_counter_ns() - started) // 1_000_000
             self.logger.info(
                 "LLM refine response received. provider=%s model=%s status=%s latency_ms=%s",
                 config.llm_provider,
@@ -135,6 +248,14 @@ class LlmRefiner:
             )
             raise LlmRefineError(str(exc)) from exc
 
+    def preconnect(self, config: AppConfig) -> None:
+        # Opens the TCP/TLS connection ahead of the request so the handshake
+        # overlaps recording and transcription instead of adding to latency.
+        try:
+            _preconnect(self._resolve_endpoint(config), config.llm_timeout_seconds)
+        except (LlmRefineError, OSError) as exc:
+            self.logger.debug("LLM preconnect skipped: %s", exc)
+
     @staticmethod
     def _resolve_api_key(config: AppConfig) -> str:
         api_key = config.llm_api_key.strip()
@@ -173,22 +294,16 @@ class LlmRefiner:
     def _build_messages(
         text: str,
         system_prompt: str,
-        preferred_terms: list[str],
+        preferred_terms: list[str] | tuple[str, ...],
     ) -> list[dict[str, str]]:
-        system_content = system_prompt.strip()
-        if preferred_terms:
-            joined = ", ".join(preferred_terms)
-            system_content += (
-                "\n\nPrefer these terms when appropriate: "
-                f"{joined}"
-            )
+        system_content = _compose_system_prompt(system_prompt, tuple(preferred_terms))
         return [
             {"role": "system", "content": system_content},
             {"role": "user", "content": text},
         ]
 
     @staticmethod
-    def _extract_text_from_response(raw: str) -> str:
+    def _extract_text_from_response(raw: bytes | str) -> str:
         try:
             payload = json.loads(raw)
         except json.JSONDecodeError as exc:
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-import importlib.util
+import fnmatch
+import hashlib
+import inspect
+import json
 import logging
 import os
+import re
+import shlex
 import shutil
+import subprocess
 import sys
-import threading
+import tempfile
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Any, Literal
+
+from src.core import json_io
 
 
 INFERENCE_ALLOW_PATTERNS = [
@@ -23,8 +36,43 @@ INFERENCE_ALLOW_PATTERNS = [
     "merges.txt",
     "added_tokens.json",
     "normalizer.json",
+    "model.bin",
+    "vocabulary.*",
 ]
 
+# Transformers checkpoints with a published CTranslate2 build; downloading the
+# mirror skips the local conversion step entirely.
+CT2_MIRROR_MAP: dict[str, str] = {
+    "openai/whisper-tiny": "Systran/faster-whisper-tiny",
+    "openai/whisper-tiny.en": "Systran/faster-whisper-tiny.en",
+    "openai/whisper-base": "Systran/faster-whisper-base",
+    "openai/whisper-base.en": "Systran/faster-whisper-base.en",
+    "openai/whisper-small": "Systran/faster-whisper-small",
+    "openai/whisper-small.en": "Systran/faster-whisper-small.en",
+    "openai/whisper-medium": "Systran/faster-whisper-medium",
+    "openai/whisper-medium.en": "Systran/faster-whisper-medium.en",
+    "openai/whisper-large-v2": "Systran/faster-whisper-large-v2",
+    "openai/whisper-large-v3": "Systran/faster-whisper-large-v3",
+}
+
+ModelFormat = Literal["ctranslate2", "transformers", "unknown"]
+
+CONVERSION_MARKER = ".sludre-convert-ok"
+# Remembers the resolved ready directory across launches, keyed on the same
+# directory mtimes as the in-process cache.
+READY_MARKER_FILE = ".sludre-ready.json"
+
+_CLI_INCLUDE_ARGS = ("--include", *INFERENCE_ALLOW_PATTERNS)
+
+_CLI_OUTPUT_TAIL_LINES = 200
+
+PLAN_CACHE_FILE = ".plan.json"
+PLAN_CACHE_TTL_SEC = 24 * 60 * 60
+
+# Overall "Fetching N files" bar; per-file bars would make the percentage jump.
+_CLI_PROGRESS_RE = re.compile(r"Fetching \d+ files:\s*(\d{1,3})%")
+_CLI_PROGRESS_QUIET_SEC = 30.0
+
 CONVERTER_COPY_FILES = [
     "tokenizer.json",
     "tokenizer_config.json",
@@ -37,29 +85,173 @@ CONVERTER_COPY_FILES = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _hub_function(name: str) -> Callable[..., Any]:
+    # huggingface_hub resolves its public names through a lazy module
+    # __getattr__, so keep the resolved function instead of re-importing.
+    import huggingface_hub
+
+    return getattr(huggingface_hub, name)
+
+
 def _snapshot_download(*args, **kwargs) -> str:
-    from huggingface_hub import snapshot_download
+    return _hub_function("snapshot_download")(*args, **kwargs)
+
 
-    return snapshot_download(*args, **kwargs)
+def _hf_hub_download(*args, **kwargs) -> str:
+    return _hub_function("hf_hub_download")(*args, **kwargs)
 
 
-def _subprocess_run(*args, **kwargs):
-    import subprocess
+def _model_info(repo_id: str, token: str | None = None) -> Any:
+    return _hub_function("HfApi")(token=token).model_info(repo_id, files_metadata=True)
 
-    return subprocess.run(*args, **kwargs)
 
+def _subprocess_popen(*args, **kwargs) -> subprocess.Popen:
+    return subprocess.Popen(*args, **kwargs)
 
+
+@lru_cache(maxsize=None)
 def _module_available(module_name: str) -> bool:
-    return importlib.util.find_spec(module_name) is not None
+    import importlib.util
+
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@contextmanager
+def _conversion_lock(lock_path: Path) -> Iterator[None]:
+    with open(lock_path, "a+b") as handle:
+        if os.name == "nt":
+            import msvcrt
+
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(1.0)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+@lru_cache(maxsize=1)
+def _candidate_cli_bases() -> tuple[tuple[str, ...], ...]:
+    exe_dir = Path(sys.executable).resolve().parent
+    candidates = [
+        (str(exe_dir / "hf.exe"),),
+        (str(exe_dir / "hf"),),
+        (str(exe_dir / "huggingface-cli.exe"),),
+        (str(exe_dir / "huggingface-cli"),),
+        ("hf",),
+        ("huggingface-cli",),
+        (sys.executable, "-m", "huggingface_hub.cli.hf"),
+        (sys.executable, "-m", "huggingface_hub.commands.huggingface_cli"),
+    ]
+    return tuple(dict.fromkeys(candidates))
+
+
+def _cli_base_available(cli_base: tuple[str, ...]) -> bool:
+    if len(cli_base) == 3 and cli_base[1] == "-m":
+        return _module_available(cli_base[2])
+    if os.path.isabs(cli_base[0]):
+        return os.path.isfile(cli_base[0])
+    return shutil.which(cli_base[0]) is not None
+
+
+@lru_cache(maxsize=1)
+def _available_cli_bases() -> tuple[tuple[str, ...], ...]:
+    return tuple(cli for cli in _candidate_cli_bases() if _cli_base_available(cli))
+
+
+def _env_flag_enabled(value: str | None) -> bool:
+    return (value or "").upper() in {"1", "ON", "YES", "TRUE"}
+
+
+@contextmanager
+def _transfer_environment(overrides: dict[str, str]) -> Iterator[None]:
+    previous = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    # huggingface_hub snapshots HF_HUB_ENABLE_HF_TRANSFER at import time; keep
+    # an already-imported copy in sync with the environment.
+    _sync_hf_transfer_constant()
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        _sync_hf_transfer_constant()
+
+
+def _sync_hf_transfer_constant() -> None:
+    constants = sys.modules.get("huggingface_hub.constants")
+    if constants is not None and hasattr(constants, "HF_HUB_ENABLE_HF_TRANSFER"):
+        constants.HF_HUB_ENABLE_HF_TRANSFER = _env_flag_enabled(
+            os.environ.get("HF_HUB_ENABLE_HF_TRANSFER")
+        )
+
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    try:
+        import ctranslate2
+    except ImportError:
+        return False
+    return ctranslate2.get_cuda_device_count() > 0
+
+
+@lru_cache(maxsize=None)
+def _supported_compute_types(device: str) -> frozenset[str]:
+    try:
+        import ctranslate2
+
+        return frozenset(ctranslate2.get_supported_compute_types(device))
+    except (ImportError, RuntimeError, ValueError):
+        return frozenset()
+
+
+@lru_cache(maxsize=1)
+def _ctranslate2_version() -> str:
+    try:
+        import ctranslate2
+    except ImportError:
+        return "unknown"
+    return str(getattr(ctranslate2, "__version__", "unknown"))
+
+
+def _default_max_workers() -> int:
+    return max(8, min(16, (os.cpu_count() or 4) * 2))
 
 
 def _create_transformers_converter(*args, **kwargs):
     from ctranslate2.converters import TransformersConverter
 
-    return TransformersConverter(*args, **kwargs)
+    # Older ctranslate2 releases do not accept every loader option.
+    accepted = inspect.signature(TransformersConverter).parameters
+    supported = {key: value for key, value in kwargs.items() if key in accepted}
+    return TransformersConverter(*args, **supported)
 
 
 class ModelManager:
+    _resolved_cli_base: tuple[str, ...] | None = None
+    _ready_model_dirs: dict[tuple[str, str], tuple[tuple[int, int], Path]] = {}
+
     def __init__(
         self,
         repo_id: str,
@@ -67,28 +259,50 @@ class ModelManager:
         manual_model_path: str | None = None,
         hf_token: str | None = None,
         log_callback: Callable[[str], None] | None = None,
+        prefer_hf_transfer: bool = True,
+        max_workers: int | None = None,
+        quantization: str = "auto",
     ) -> None:
         self.repo_id = repo_id
         self.cache_dir = cache_dir
         self.manual_model_path = manual_model_path or ""
         self.hf_token = hf_token or None
         self.log_callback = log_callback
+        self.prefer_hf_transfer = prefer_hf_transfer
+        self.max_workers = max(1, max_workers or _default_max_workers())
+        self.quantization = quantization
+        # "auto" is resolved lazily; self.quantization keeps the configured mode
+        # so cache keys and the ready marker match across launches.
+        self._resolved_quant: str | None = None
         self.logger = logging.getLogger("sludre.model_manager")
+        mirror = None if self.manual_model_path else CT2_MIRROR_MAP.get(repo_id)
+        # A model already cached under the original id (from an earlier release)
+        # is reused rather than downloading the mirror again.
+        if mirror and self._classify_model_dir(
+            cache_dir / repo_id.replace("/", "--")
+        ) == "unknown":
+            self.repo_id = mirror
+            self._log_info(
+                f"Using pre-converted CTranslate2 mirror {mirror} for {repo_id}.",
+                notify_ui=True,
+            )
+
+    def _log(self, level: int, message: str, args: tuple, notify_ui: bool) -> None:
+        notify = notify_ui and self.log_callback is not None
+        if not notify and not self.logger.isEnabledFor(level):
+            return
+        self.logger.log(level, message, *args)
+        if notify:
+            self.log_callback(message % args if args else message)
 
-    def _log_info(self, message: str, notify_ui: bool = False) -> None:
-        self.logger.info(message)
-        if notify_ui and self.log_callback:
-            self.log_callback(message)
+    def _log_info(self, message: str, *args: object, notify_ui: bool = False) -> None:
+        self._log(logging.INFO, message, args, notify_ui)
 
-    def _log_warning(self, message: str, notify_ui: bool = False) -> None:
-        self.logger.warning(message)
-        if notify_ui and self.log_callback:
-            self.log_callback(message)
+    def _log_warning(self, message: str, *args: object, notify_ui: bool = False) -> None:
+        self._log(logging.WARNING, message, args, notify_ui)
 
-    def _log_error(self, message: str, notify_ui: bool = False) -> None:
-        self.logger.error(message)
-        if notify_ui and self.log_callback:
-            self.log_callback(message)
+    def _log_error(self, message: str, *args: object, notify_ui: bool = False) -> None:
+        self._log(logging.ERROR, message, args, notify_ui)
 
     @staticmethod
     def _format_bytes(size: int) -> str:
@@ -101,21 +315,174 @@ class ModelManager:
                 return f"{value:.1f} {unit}"
             value /= 1024.0
 
-    def _download_dir(self) -> Path:
-        safe_name = self.repo_id.replace("/", "--")
-        return self.cache_dir / safe_name
+    def _transfer_env_overrides(self) -> dict[str, str]:
+        if not self.prefer_hf_transfer:
+            return {"HF_HUB_ENABLE_HF_TRANSFER": "0"}
+        if _module_available("hf_transfer"):
+            hf_transfer = "1"
+        else:
+            hf_transfer = "0"
+            self._log_info(
+                "hf_transfer is not installed; downloads use the default HTTP client. "
+                "Install it for faster downloads: pip install hf_transfer",
+                notify_ui=True,
+            )
+        return {
+            "HF_HUB_ENABLE_HF_TRANSFER": hf_transfer,
+            "HF_XET_HIGH_PERFORMANCE": "1",
+        }
 
+    def _resolved_quantization(self) -> str:
+        if self._resolved_quant is not None:
+            return self._resolved_quant
+        if self.quantization == "auto":
+            cuda = _cuda_available()
+            supported = _supported_compute_types("cuda" if cuda else "cpu")
+            preferred = ("int8_float16", "int8")
+            self._resolved_quant = next(
+                (mode for mode in preferred if mode in supported),
+                "int8_float16" if cuda else "int8",
+            )
+            self._log_info("Auto-selected quantization: %s", self._resolved_quant)
+        else:
+            self._resolved_quant = self.quantization
+        return self._resolved_quant
+
+    def _conversion_dir(self, model_dir: Path) -> Path:
+        return model_dir / f"ctranslate2-{self._resolved_quantization()}"
+
+    def _converted_model_dir(
+        self,
+        model_dir: Path,
+        names: frozenset[str] | None = None,
+    ) -> Path | None:
+        if names is None:
+            names = self._scan_model_files(model_dir)
+        converted_dir = self._conversion_dir(model_dir)
+        if (
+            converted_dir.name in names
+            and self._is_ctranslate2_model(converted_dir)
+            and self._conversion_is_current(converted_dir, model_dir, names)
+        ):
+            return converted_dir
+        # Plain "ctranslate2" is the float16 layout written by earlier releases,
+        # which predates the conversion marker; an explicit other mode converts.
+        if self.quantization not in ("auto", "float16"):
+            return None
+        legacy_dir = model_dir / "ctranslate2"
+        if legacy_dir.name in names and self._is_ctranslate2_model(legacy_dir):
+            return legacy_dir
+        return None
+
+    def _conversion_marker(self, model_dir: Path, names: frozenset[str]) -> dict[str, str]:
+        return {
+            "rev": self._source_revision(model_dir, names),
+            "quant": self._resolved_quantization(),
+            "ct2": _ctranslate2_version(),
+        }
+
+    def _conversion_is_current(
+        self,
+        converted_dir: Path,
+        model_dir: Path,
+        names: frozenset[str],
+    ) -> bool:
+        try:
+            recorded = json.loads((converted_dir / CONVERSION_MARKER).read_bytes())
+        except (OSError, ValueError):
+            return False
+        if not isinstance(recorded, dict):
+            return False
+        expected = self._conversion_marker(model_dir, names)
+        # CTranslate2 keeps loading models converted by older releases, so a
+        # version bump alone does not warrant a multi-minute reconversion.
+        return all(recorded.get(key) == expected[key] for key in ("rev", "quant"))
+
+    @staticmethod
+    def _source_revision(model_dir: Path, names: frozenset[str]) -> str:
+        commit = ModelManager._downloaded_commit(model_dir, "config.json")
+        if commit:
+            return commit
+        digest = hashlib.sha1()
+        for name in sorted(names):
+            if name != "config.json" and not name.endswith(".safetensors"):
+                continue
+            try:
+                size = os.stat(os.path.join(model_dir, name)).st_size
+            except OSError:
+                continue
+            digest.update(f"{name}:{size};".encode("utf-8"))
+        return f"local-{digest.hexdigest()[:16]}"
+
+    @cached_property
     def download_dir(self) -> Path:
-        return self._download_dir()
+        safe_name = self.repo_id.replace("/", "--")
+        return self.cache_dir / safe_name
 
     def _resolve_ready_model_dir(self, model_dir: Path) -> Path | None:
-        if self._is_ctranslate2_model(model_dir):
+        key = (str(model_dir), self.quantization)
+        cached = ModelManager._ready_model_dirs.get(key) or self._read_ready_marker(model_dir)
+        if cached is not None and cached[0] == self._ready_dir_signature(model_dir, cached[1]):
+            ModelManager._ready_model_dirs[key] = cached
+            return cached[1]
+        ready_dir = self._scan_ready_model_dir(model_dir)
+        signature = None if ready_dir is None else self._store_ready_marker(model_dir, ready_dir)
+        if signature is None:
+            ModelManager._ready_model_dirs.pop(key, None)
+        else:
+            ModelManager._ready_model_dirs[key] = (signature, ready_dir)
+        return ready_dir
+
+    @staticmethod
+    def _ready_dir_signature(model_dir: Path, ready_dir: Path) -> tuple[int, int] | None:
+        # Directory mtimes change whenever entries are added, removed or renamed,
+        # which covers downloads, conversions and manual clean-ups.
+        try:
+            return os.stat(model_dir).st_mtime_ns, os.stat(ready_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_ready_marker(self, model_dir: Path) -> tuple[tuple[int, int], Path] | None:
+        try:
+            marker = json.loads(Path(model_dir, READY_MARKER_FILE).read_bytes())
+            if marker.get("quantization") != self.quantization:
+                return None
+            first, second = marker["signature"]
+            return (int(first), int(second)), model_dir / str(marker["ready_dir"])
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def _store_ready_marker(self, model_dir: Path, ready_dir: Path) -> tuple[int, int] | None:
+        marker = Path(model_dir, READY_MARKER_FILE)
+        try:
+            # Create the entry first: that bumps the directory mtime, while the
+            # in-place rewrite below does not, so the stored signature stays valid.
+            marker.touch(exist_ok=True)
+        except OSError:
+            return self._ready_dir_signature(model_dir, ready_dir)
+        signature = self._ready_dir_signature(model_dir, ready_dir)
+        if signature is not None:
+            payload = {
+                "quantization": self.quantization,
+                "ready_dir": os.path.relpath(ready_dir, model_dir),
+                "signature": list(signature),
+            }
+            try:
+                marker.write_bytes(json.dumps(payload).encode("utf-8"))
+            except OSError:
+                pass
+        return signature
+
+    def _scan_ready_model_dir(self, model_dir: Path) -> Path | None:
+        names = self._scan_model_files(model_dir)
+        model_format = self._classify_model_dir(model_dir, names)
+        if model_format == "ctranslate2":
             return model_dir
-        converted_dir = model_dir / "ctranslate2"
-        if self._is_ctranslate2_model(converted_dir):
+        converted_dir = self._converted_model_dir(model_dir, names)
+        if converted_dir is not None:
             return converted_dir
-        if self._looks_like_transformers_whisper_model(model_dir):
-            return self._ensure_runtime_model_format(model_dir)
+        if model_format == "transformers":
+            return self._ensure_runtime_model_format(model_dir, names)
         return None
 
     def _resolve_manual_model_path(self, for_download: bool = False) -> tuple[Path, bool] | None:
@@ -149,7 +516,7 @@ class ModelManager:
 
     def _resolve_cached_model_path(self) -> Path | None:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        target_dir = self._download_dir()
+        target_dir = self.download_dir
         if not target_dir.exists():
             target_dir.mkdir(parents=True, exist_ok=True)
             self._log_info(
@@ -164,7 +531,7 @@ class ModelManager:
                 f"Using cached CTranslate2 model: {target_dir}",
                 notify_ui=True,
             )
-        elif ready_model_path == target_dir / "ctranslate2":
+        elif ready_model_path.parent == target_dir:
             self._log_info(
                 f"Using cached converted CTranslate2 model: {ready_model_path}",
                 notify_ui=True,
@@ -188,39 +555,89 @@ class ModelManager:
             "download the model first."
         )
 
-    def _download_to_target(self, target_dir: Path) -> Path:
+    def _download_to_target(self, target_dir: Path, revalidate: bool = False) -> Path:
+        ModelManager._ready_model_dirs.clear()
         target_dir.mkdir(parents=True, exist_ok=True)
+        Path(target_dir, READY_MARKER_FILE).unlink(missing_ok=True)
         self._log_info(f"Model target directory: {target_dir}", notify_ui=True)
         self._log_info(
             "No complete local model detected. Starting download flow.",
             notify_ui=True,
         )
-        progress_plan = self._prepare_download_progress_plan(target_dir)
+        transfer_env = {
+            key: value
+            for key, value in self._transfer_env_overrides().items()
+            if key not in os.environ
+        }
+        progress_plan = self._prepare_download_progress_plan(
+            target_dir,
+            use_cached_plan=not revalidate,
+        )
         try:
-            downloaded = self._download_with_cli(target_dir, progress_plan=progress_plan)
-        except Exception as cli_exc:
+            downloaded = self._download_snapshot(
+                target_dir,
+                progress_plan=progress_plan,
+                transfer_env=transfer_env,
+            )
+        except Exception as sdk_exc:
             self._log_warning(
-                f"huggingface-cli download failed. Falling back to Python SDK. "
-                f"Error: {cli_exc}",
+                f"Python SDK download failed. Falling back to huggingface-cli. "
+                f"Error: {sdk_exc}",
                 notify_ui=True,
             )
             try:
-                downloaded = self._download_snapshot(target_dir)
-            except Exception as sdk_exc:
+                downloaded = self._download_with_cli(
+                    target_dir,
+                    progress_plan=progress_plan,
+                    transfer_env=transfer_env,
+                )
+            except Exception as cli_exc:
                 self._log_error(
-                    "Model download failed with both huggingface-cli and Python SDK.\n"
-                    f"CLI error: {cli_exc}\nSDK error: {sdk_exc}",
+                    "Model download failed with both Python SDK and huggingface-cli.\n"
+                    f"SDK error: {sdk_exc}\nCLI error: {cli_exc}",
                     notify_ui=True,
                 )
                 raise RuntimeError(
-                    "Model download failed with both huggingface-cli and "
-                    f"Python SDK fallback.\nCLI error: {cli_exc}\nSDK error: {sdk_exc}"
-                ) from sdk_exc
+                    "Model download failed with both Python SDK and "
+                    f"huggingface-cli fallback.\nSDK error: {sdk_exc}\nCLI error: {cli_exc}"
+                ) from cli_exc
         return self._ensure_runtime_model_format(downloaded)
 
-    def _download_snapshot(self, target_dir: Path) -> Path:
+    def _download_snapshot(
+        self,
+        target_dir: Path,
+        progress_plan: dict[str, int] | None = None,
+        transfer_env: dict[str, str] | None = None,
+    ) -> Path:
+        transfer_env = transfer_env or {}
+        try:
+            with _transfer_environment(transfer_env):
+                return self._download_snapshot_once(target_dir, progress_plan)
+        except Exception as exc:
+            if transfer_env.get("HF_HUB_ENABLE_HF_TRANSFER") != "1":
+                raise
+            self._log_warning(
+                "hf_transfer download failed. Retrying with the standard HTTP client. "
+                f"Error: {exc}",
+                notify_ui=True,
+            )
+        with _transfer_environment({**transfer_env, "HF_HUB_ENABLE_HF_TRANSFER": "0"}):
+            return self._download_snapshot_once(target_dir, progress_plan)
+
+    def _download_workers(self, progress_plan: dict[str, int] | None) -> int:
+        if not progress_plan:
+            return self.max_workers
+        return max(1, min(self.max_workers, len(progress_plan)))
+
+    def _download_snapshot_once(
+        self,
+        target_dir: Path,
+        progress_plan: dict[str, int] | None = None,
+    ) -> Path:
+        if progress_plan:
+            return self._download_planned_files(target_dir, progress_plan)
         self._log_info(
-            f"Starting Python SDK fallback download to: {target_dir}",
+            f"Starting Python SDK download to: {target_dir}",
             notify_ui=True,
         )
         base_kwargs = {
@@ -230,13 +647,13 @@ class ModelManager:
             "token": self.hf_token,
             "resume_download": True,
             "etag_timeout": 30,
-            "max_workers": 4,
+            "max_workers": self._download_workers(progress_plan),
             "local_dir_use_symlinks": False,
             "allow_patterns": INFERENCE_ALLOW_PATTERNS,
         }
         try:
             model_path = _snapshot_download(**base_kwargs)
-            self._log_info("Python SDK fallback download completed.", notify_ui=True)
+            self._log_info("Python SDK download completed.", notify_ui=True)
             return Path(model_path)
         except TypeError:
             # Compatibility for huggingface_hub versions that removed/renamed args.
@@ -245,46 +662,80 @@ class ModelManager:
             fallback_kwargs.pop("resume_download", None)
             model_path = _snapshot_download(**fallback_kwargs)
             self._log_info(
-                "Python SDK fallback download completed with compatibility args.",
+                "Python SDK download completed with compatibility args.",
                 notify_ui=True,
             )
             return Path(model_path)
 
-    def _prepare_download_progress_plan(self, target_dir: Path) -> dict[str, int] | None:
-        if not self.log_callback:
-            return None
+    def _download_planned_files(self, target_dir: Path, plan: dict[str, int]) -> Path:
+        # The download plan already lists what is missing, so fetch those files
+        # directly instead of letting snapshot_download query the repo again.
+        self._log_info(
+            f"Starting Python SDK download of {len(plan)} files to: {target_dir}",
+            notify_ui=True,
+        )
+        progress_state: dict[str, object] = {"percent": -1, "last_emit": 0.0}
+        executor = ThreadPoolExecutor(max_workers=self._download_workers(plan))
         try:
-            dry_run = _snapshot_download(
-                repo_id=self.repo_id,
-                local_dir=str(target_dir),
-                local_files_only=False,
-                token=self.hf_token,
-                etag_timeout=30,
-                max_workers=4,
-                allow_patterns=INFERENCE_ALLOW_PATTERNS,
-                dry_run=True,
-            )
-        except Exception as exc:
-            self._log_warning(
-                f"Could not estimate download size before starting transfer. Details: {exc}",
-                notify_ui=True,
-            )
-            return None
+            futures = [
+                executor.submit(
+                    _hf_hub_download,
+                    repo_id=self.repo_id,
+                    filename=filename,
+                    local_dir=str(target_dir),
+                    token=self.hf_token,
+                    etag_timeout=30,
+                )
+                for filename in plan
+            ]
+            for future in as_completed(futures):
+                future.result()
+                self._emit_download_progress(
+                    target_dir=target_dir,
+                    plan=plan,
+                    state=progress_state,
+                )
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        self._emit_download_progress(
+            target_dir=target_dir,
+            plan=plan,
+            state=progress_state,
+            force=True,
+        )
+        self._log_info("Python SDK download completed.", notify_ui=True)
+        return target_dir
 
-        if not isinstance(dry_run, list):
+    def _prepare_download_progress_plan(
+        self,
+        target_dir: Path,
+        use_cached_plan: bool = True,
+    ) -> dict[str, int] | None:
+        if not self.log_callback:
             return None
-        planned: dict[str, int] = {}
-        for item in dry_run:
-            filename = str(getattr(item, "filename", "")).strip()
-            if not filename:
-                continue
-            if not bool(getattr(item, "will_download", True)):
-                continue
-            planned[filename] = max(int(getattr(item, "file_size", 0) or 0), 0)
+        remote = self._cached_remote_files() if use_cached_plan else None
+        if remote is None:
+            try:
+                remote = self._fetch_remote_files()
+            except Exception as exc:
+                self._log_warning(
+                    f"Could not estimate download size before starting transfer. Details: {exc}",
+                    notify_ui=True,
+                )
+                return None
+            self._store_remote_files(*remote)
+        revision, files = remote
 
+        planned = {
+            filename: size
+            for filename, size in files.items()
+            if not self._is_downloaded(target_dir, filename, size, revision)
+        }
         if not planned:
             self._log_info(
-                "Download plan: no new files reported by dry-run (files may already be cached).",
+                "Download plan: no new files to download (files may already be cached).",
                 notify_ui=True,
             )
             return None
@@ -296,6 +747,90 @@ class ModelManager:
         )
         return planned
 
+    def _fetch_remote_files(self) -> tuple[str, dict[str, int]]:
+        info = _model_info(self.repo_id, token=self.hf_token)
+        files: dict[str, int] = {}
+        for sibling in info.siblings or ():
+            filename = str(getattr(sibling, "rfilename", "")).strip()
+            if filename and any(
+                fnmatch.fnmatch(filename, pattern) for pattern in INFERENCE_ALLOW_PATTERNS
+            ):
+                files[filename] = max(int(getattr(sibling, "size", 0) or 0), 0)
+        return str(info.sha or ""), files
+
+    @cached_property
+    def _plan_cache_path(self) -> Path:
+        return self.cache_dir / PLAN_CACHE_FILE
+
+    def _read_plan_cache(self) -> dict[str, object]:
+        try:
+            cached = json.loads(self._plan_cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return cached if isinstance(cached, dict) else {}
+
+    def _cached_remote_files(self) -> tuple[str, dict[str, int]] | None:
+        entry = self._read_plan_cache().get(self.repo_id)
+        if not isinstance(entry, dict):
+            return None
+        if time.time() - float(entry.get("saved_at", 0) or 0) > PLAN_CACHE_TTL_SEC:
+            return None
+        files = entry.get("files")
+        if not isinstance(files, dict) or not files:
+            return None
+        self._log_info("Download plan: reusing cached file list.")
+        return str(entry.get("sha", "")), {str(name): int(size) for name, size in files.items()}
+
+    def _store_remote_files(self, revision: str, files: dict[str, int]) -> None:
+        cache = self._read_plan_cache()
+        cache[self.repo_id] = {"sha": revision, "files": files, "saved_at": time.time()}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            json_io.write_atomic(self._plan_cache_path, json.dumps(cache).encode("utf-8"))
+        except OSError as exc:
+            self._log_warning("Could not store download plan cache: %s", exc)
+
+    @staticmethod
+    def _downloaded_commit(model_dir: Path, filename: str) -> str:
+        metadata = Path(model_dir, ".cache", "huggingface", "download", f"{filename}.metadata")
+        try:
+            return metadata.read_text(encoding="utf-8").split("\n", 1)[0].strip()
+        except OSError:
+            return ""
+
+    @staticmethod
+    def _is_downloaded(target_dir: Path, filename: str, size: int, revision: str) -> bool:
+        try:
+            if os.stat(os.path.join(target_dir, filename)).st_size != size:
+                return False
+        except OSError:
+            return False
+        return bool(revision) and ModelManager._downloaded_commit(target_dir, filename) == revision
+
+    @staticmethod
+    def _plan_layout(
+        target_dir: Path,
+        plan: dict[str, int],
+    ) -> dict[str, list[tuple[str, int]]]:
+        layout: dict[str, list[tuple[str, int]]] = {}
+        for rel_path, expected_size in plan.items():
+            parent, _, name = rel_path.replace("\\", "/").rpartition("/")
+            directory = os.path.join(target_dir, parent) if parent else os.fspath(target_dir)
+            layout.setdefault(directory, []).append((name, expected_size))
+        return layout
+
+    @staticmethod
+    def _scan_file_sizes(directory: str) -> dict[str, int]:
+        sizes: dict[str, int] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        sizes[entry.name] = entry.stat().st_size
+        except OSError:
+            pass
+        return sizes
+
     def _emit_download_progress(
         self,
         target_dir: Path,
@@ -309,21 +844,38 @@ class ModelManager:
         if total_bytes <= 0:
             return
 
+        layout = state.get("layout")
+        if layout is None:
+            layout = self._plan_layout(target_dir, plan)
+            state["layout"] = layout
         downloaded_bytes = 0
-        for rel_path, expected_size in plan.items():
-            file_path = target_dir / rel_path
-            try:
-                if file_path.exists():
-                    actual_size = int(file_path.stat().st_size)
-                    if expected_size > 0:
-                        downloaded_bytes += min(actual_size, expected_size)
-                    else:
-                        downloaded_bytes += max(actual_size, 0)
-            except OSError:
-                continue
+        for directory, entries in layout.items():
+            sizes = self._scan_file_sizes(directory)
+            for name, expected_size in entries:
+                actual_size = sizes.get(name)
+                if actual_size is None:
+                    continue
+                if expected_size > 0:
+                    downloaded_bytes += min(actual_size, expected_size)
+                else:
+                    downloaded_bytes += actual_size
         downloaded_bytes = min(downloaded_bytes, total_bytes)
         percent = int((downloaded_bytes * 100) / total_bytes)
 
+        self._report_progress(
+            percent,
+            f"{self._format_bytes(downloaded_bytes)} / {self._format_bytes(total_bytes)}",
+            state,
+            force=force,
+        )
+
+    def _report_progress(
+        self,
+        percent: int,
+        detail: str,
+        state: dict[str, object],
+        force: bool = False,
+    ) -> None:
         previous_percent = int(state.get("percent", -1))
         last_emit = float(state.get("last_emit", 0.0))
         now = time.monotonic()
@@ -335,61 +887,29 @@ class ModelManager:
         if force and percent == previous_percent and previous_percent >= 0:
             return
 
-        self._log_info(
-            f"Download progress: {percent}% ({self._format_bytes(downloaded_bytes)} / {self._format_bytes(total_bytes)})",
-            notify_ui=True,
-        )
+        self._log_info("Download progress: %s%% (%s)", percent, detail, notify_ui=True)
         state["percent"] = percent
         state["last_emit"] = now
 
     def _hf_cli_command(self, target_dir: Path) -> list[str]:
-        command = self._candidate_cli_bases()[0] + [
-            "download",
-            self.repo_id,
-            "--local-dir",
-            str(target_dir),
-            "--max-workers",
-            "4",
-            "--include",
-            *INFERENCE_ALLOW_PATTERNS,
-        ]
-        if self.hf_token:
-            command.extend(["--token", self.hf_token])
-        return command
+        cli_base = (_available_cli_bases() or _candidate_cli_bases())[0]
+        return self._build_cli_command(cli_base, target_dir)
 
-    @staticmethod
-    def _candidate_cli_bases() -> list[list[str]]:
-        exe_dir = Path(sys.executable).resolve().parent
-        candidates = [
-            [str(exe_dir / "hf.exe")],
-            [str(exe_dir / "hf")],
-            [str(exe_dir / "huggingface-cli.exe")],
-            [str(exe_dir / "huggingface-cli")],
-            ["hf"],
-            ["huggingface-cli"],
-            [sys.executable, "-m", "huggingface_hub.cli.hf"],
-            [sys.executable, "-m", "huggingface_hub.commands.huggingface_cli"],
-        ]
-        unique: list[list[str]] = []
-        seen: set[tuple[str, ...]] = set()
-        for cmd in candidates:
-            key = tuple(cmd)
-            if key in seen:
-                continue
-            unique.append(cmd)
-            seen.add(key)
-        return unique
-
-    def _build_cli_command(self, cli_base: list[str], target_dir: Path) -> list[str]:
-        command = cli_base + [
+    def _build_cli_command(
+        self,
+        cli_base: tuple[str, ...],
+        target_dir: Path,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        command = [
+            *cli_base,
             "download",
             self.repo_id,
             "--local-dir",
             str(target_dir),
             "--max-workers",
-            "4",
-            "--include",
-            *INFERENCE_ALLOW_PATTERNS,
+            str(max_workers or self.max_workers),
+            *_CLI_INCLUDE_ARGS,
         ]
         if self.hf_token:
             command.extend(["--token", self.hf_token])
@@ -410,38 +930,62 @@ class ModelManager:
 
     @staticmethod
     def _format_command_for_log(command: list[str], token: str | None) -> str:
-        if not token:
-            return " ".join(command)
-        return " ".join(part if part != token else "***REDACTED***" for part in command)
+        sensitive = frozenset({token}) if token else frozenset()
+        return " ".join(
+            "***REDACTED***"
+            if any(secret in part for secret in sensitive)
+            else shlex.quote(part)
+            for part in command
+        )
 
     @staticmethod
-    def _has_required_model_files(target_dir: Path) -> bool:
-        if not (target_dir / "config.json").exists():
-            return False
-        if (target_dir / "model.safetensors.index.json").exists():
-            return True
-        return any(target_dir.glob("model-*.safetensors"))
+    def _scan_model_files(path: Path) -> frozenset[str]:
+        try:
+            with os.scandir(path) as entries:
+                return frozenset(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            return frozenset()
+
+    @staticmethod
+    def _has_sharded_safetensors(names: frozenset[str]) -> bool:
+        return any(
+            name.startswith("model-") and name.endswith(".safetensors") for name in names
+        )
 
     @staticmethod
     def _is_ctranslate2_model(path: Path) -> bool:
-        return (path / "model.bin").exists()
+        return os.path.isfile(os.path.join(path, "model.bin"))
 
     @staticmethod
-    def _looks_like_transformers_whisper_model(path: Path) -> bool:
-        if not (path / "config.json").exists():
-            return False
-        if (path / "model.safetensors.index.json").exists():
-            return True
-        return (path / "model.safetensors").exists() or any(
-            path.glob("model-*.safetensors")
-        )
+    def _classify_model_dir(
+        path: Path,
+        names: frozenset[str] | None = None,
+    ) -> ModelFormat:
+        if names is None:
+            names = ModelManager._scan_model_files(path)
+        if "model.bin" in names:
+            return "ctranslate2"
+        if "config.json" in names and (
+            "model.safetensors.index.json" in names
+            or "model.safetensors" in names
+            or ModelManager._has_sharded_safetensors(names)
+        ):
+            return "transformers"
+        return "unknown"
 
-    def _ensure_runtime_model_format(self, model_dir: Path) -> Path:
-        if self._is_ctranslate2_model(model_dir):
-            self._log_info(f"CTranslate2 model detected: {model_dir}")
+    def _ensure_runtime_model_format(
+        self,
+        model_dir: Path,
+        names: frozenset[str] | None = None,
+    ) -> Path:
+        if names is None:
+            names = self._scan_model_files(model_dir)
+        model_format = self._classify_model_dir(model_dir, names)
+        if model_format == "ctranslate2":
+            self._log_info("CTranslate2 model detected: %s", model_dir)
             return model_dir
 
-        if not self._looks_like_transformers_whisper_model(model_dir):
+        if model_format != "transformers":
             self._log_warning(
                 "Model folder does not look like either CTranslate2 or "
                 f"Transformers Whisper: {model_dir}",
@@ -449,13 +993,14 @@ class ModelManager:
             )
             return model_dir
 
-        converted_dir = model_dir / "ctranslate2"
-        if self._is_ctranslate2_model(converted_dir):
+        converted_dir = self._converted_model_dir(model_dir, names)
+        if converted_dir is not None:
             self._log_info(
                 f"Using cached converted CTranslate2 model: {converted_dir}",
                 notify_ui=True,
             )
             return converted_dir
+        converted_dir = self._conversion_dir(model_dir)
 
         missing = [
             name for name in ("transformers", "torch") if not _module_available(name)
@@ -469,65 +1014,143 @@ class ModelManager:
                 "Install and retry: pip install transformers torch"
             )
 
+        with _conversion_lock(model_dir / ".convert.lock"):
+            finished = self._converted_model_dir(model_dir)
+            if finished is not None:
+                self._log_info(
+                    f"Conversion was completed by another process: {finished}",
+                    notify_ui=True,
+                )
+                return finished
+            return self._convert_to_ctranslate2(model_dir, names, converted_dir)
+
+    def _convert_to_ctranslate2(
+        self,
+        model_dir: Path,
+        names: frozenset[str],
+        converted_dir: Path,
+    ) -> Path:
         self._log_info(
             "Transformers model detected. Starting one-time conversion to "
-            f"CTranslate2 in: {converted_dir}",
+            f"CTranslate2 ({self._resolved_quantization()}) in: {converted_dir}",
             notify_ui=True,
         )
-        if converted_dir.exists() and not self._is_ctranslate2_model(converted_dir):
-            self._log_warning(
-                "Found existing incomplete conversion directory. "
-                f"Resetting: {converted_dir}",
-                notify_ui=True,
-            )
-            shutil.rmtree(converted_dir, ignore_errors=True)
-        converted_dir.mkdir(parents=True, exist_ok=True)
+        # Leftovers from an interrupted run; the lock guarantees nobody owns them.
+        for stale in model_dir.glob(f".{converted_dir.name}-*"):
+            shutil.rmtree(stale, ignore_errors=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix=f".{converted_dir.name}-", dir=model_dir))
         try:
-            converter = _create_transformers_converter(
-                str(model_dir),
-                copy_files=CONVERTER_COPY_FILES,
-                load_as_float16=True,
-            )
-            converter.convert(
-                str(converted_dir),
-                quantization="float16",
-                force=True,
-            )
-        except Exception as exc:
-            raise RuntimeError(
-                "Failed to convert model to CTranslate2 format. "
-                f"Details: {exc}"
-            ) from exc
+            try:
+                converter = _create_transformers_converter(
+                    str(model_dir),
+                    load_as_float16=True,
+                    low_cpu_mem_usage=True,
+                )
+                converter.convert(
+                    str(staging_dir),
+                    quantization=self._resolved_quantization(),
+                    force=True,
+                )
+                self._copy_converter_files(model_dir, names, staging_dir)
+            except Exception as exc:
+                raise RuntimeError(
+                    "Failed to convert model to CTranslate2 format. "
+                    f"Details: {exc}"
+                ) from exc
 
-        if not self._is_ctranslate2_model(converted_dir):
-            raise RuntimeError(
-                "Conversion finished but model.bin was not created in "
-                f"{converted_dir}"
+            if not self._is_ctranslate2_model(staging_dir):
+                raise RuntimeError(
+                    "Conversion finished but model.bin was not created in "
+                    f"{staging_dir}"
+                )
+            (staging_dir / CONVERSION_MARKER).write_bytes(
+                json.dumps(self._conversion_marker(model_dir, names)).encode("utf-8")
             )
+            self._swap_in_directory(staging_dir, converted_dir)
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
         self._log_info(
             f"CTranslate2 conversion completed successfully: {converted_dir}",
             notify_ui=True,
         )
         return converted_dir
 
-    def _download_with_cli(self, target_dir: Path, progress_plan: dict[str, int] | None = None) -> Path:
-        env = os.environ.copy()
-        env.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "0")
+    @staticmethod
+    def _swap_in_directory(staging_dir: Path, target_dir: Path) -> None:
+        # Directories cannot be replaced while non-empty, so retire the old one
+        # by rename first and keep it until the new one is in place.
+        retired_dir = None
+        if target_dir.exists():
+            retired_dir = target_dir.with_name(f".{target_dir.name}-retired-{os.getpid()}")
+            os.replace(target_dir, retired_dir)
+        try:
+            os.replace(staging_dir, target_dir)
+        except OSError:
+            if retired_dir is not None:
+                os.replace(retired_dir, target_dir)
+            raise
+        if retired_dir is not None:
+            shutil.rmtree(retired_dir, ignore_errors=True)
+
+    @staticmethod
+    def _copy_converter_files(
+        model_dir: Path,
+        names: frozenset[str],
+        converted_dir: Path,
+    ) -> None:
+        written = ModelManager._scan_model_files(converted_dir)
+        pending = [
+            name
+            for name in CONVERTER_COPY_FILES
+            if name in names and name not in written
+        ]
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=min(4, len(pending))) as executor:
+            copies = [
+                executor.submit(shutil.copyfile, model_dir / name, converted_dir / name)
+                for name in pending
+            ]
+            for copy in copies:
+                copy.result()
+
+    def _download_with_cli(
+        self,
+        target_dir: Path,
+        progress_plan: dict[str, int] | None = None,
+        transfer_env: dict[str, str] | None = None,
+    ) -> Path:
+        defaults = {
+            **(transfer_env or {"HF_HUB_ENABLE_HF_TRANSFER": "0"}),
+            "PYTHONUNBUFFERED": "1",
+        }
+        overrides = {key: value for key, value in defaults.items() if key not in os.environ}
+        env = os.environ | overrides if overrides else None
         self._log_info("Starting Hugging Face CLI download...", notify_ui=True)
         entrypoint_errors: list[str] = []
         progress_state: dict[str, object] = {"percent": -1, "last_emit": 0.0}
-        for cli_base in self._candidate_cli_bases():
-            command = self._build_cli_command(cli_base, target_dir)
+        candidates = _available_cli_bases()
+        resolved = ModelManager._resolved_cli_base
+        if resolved is not None:
+            candidates = (resolved, *(cli for cli in candidates if cli != resolved))
+        for cli_base in candidates:
+            command = self._build_cli_command(
+                cli_base,
+                target_dir,
+                max_workers=self._download_workers(progress_plan),
+            )
             cli_name = " ".join(cli_base)
             self._log_info(
                 f"Trying CLI entrypoint: {cli_name}",
                 notify_ui=True,
             )
             self._log_info(
-                f"CLI command: {self._format_command_for_log(command, self.hf_token)}"
+                "CLI command: %s",
+                self._format_command_for_log(command, self.hf_token),
             )
             try:
-                result = self._run_with_heartbeat(
+                result = self._run_cli_process(
                     command,
                     env,
                     target_dir=target_dir,
@@ -535,24 +1158,21 @@ class ModelManager:
                     progress_state=progress_state,
                 )
             except FileNotFoundError as exc:
+                self._forget_cli_base(cli_base)
                 msg = f"{cli_name}: not found ({exc})"
                 self._log_warning(msg, notify_ui=True)
                 entrypoint_errors.append(msg)
                 continue
 
-            stdout = (result.stdout or "").strip()
-            stderr = (result.stderr or "").strip()
-            if stdout:
-                self._log_info(f"CLI stdout:\n{stdout}", notify_ui=True)
-            if stderr:
-                self._log_warning(f"CLI stderr:\n{stderr}", notify_ui=True)
+            output = (result.stdout or "").strip()
             self._log_info(
                 f"{cli_name} finished with return code {result.returncode}",
                 notify_ui=True,
             )
 
             if result.returncode == 0:
-                if not self._has_required_model_files(target_dir):
+                ModelManager._resolved_cli_base = cli_base
+                if self._classify_model_dir(target_dir) == "unknown":
                     raise RuntimeError(
                         "Hugging Face CLI finished but required model files "
                         "are missing."
@@ -563,8 +1183,9 @@ class ModelManager:
                 )
                 return target_dir
 
-            details = stderr or stdout or "No output."
+            details = output or "No output."
             if self._looks_like_missing_entrypoint(details):
+                self._forget_cli_base(cli_base)
                 msg = f"{cli_name}: unavailable ({details})"
                 entrypoint_errors.append(msg)
                 self._log_warning(msg, notify_ui=True)
@@ -572,7 +1193,12 @@ class ModelManager:
             self._log_error(f"{cli_name} failed: {details}", notify_ui=True)
             raise RuntimeError(f"{cli_name} failed: {details}")
 
-        joined = "\n".join(entrypoint_errors) if entrypoint_errors else "No output."
+        if entrypoint_errors:
+            joined = "\n".join(entrypoint_errors)
+        elif not candidates:
+            joined = "No Hugging Face CLI entrypoint is installed."
+        else:
+            joined = "No output."
         self._log_error(
             "No compatible Hugging Face CLI entrypoint worked.\n"
             f"Details:\n{joined}",
@@ -583,80 +1209,124 @@ class ModelManager:
             f"Details:\n{joined}"
         )
 
-    def _run_with_heartbeat(
+    def _report_cli_percent(self, output: str, state: dict[str, object]) -> None:
+        matches = _CLI_PROGRESS_RE.findall(output)
+        if matches:
+            state["cli_progress_at"] = time.monotonic()
+            self._report_progress(min(int(matches[-1]), 100), "huggingface-cli", state)
+
+    @staticmethod
+    def _forget_cli_base(cli_base: tuple[str, ...]) -> None:
+        if ModelManager._resolved_cli_base == cli_base:
+            ModelManager._resolved_cli_base = None
+        _available_cli_bases.cache_clear()
+
+    def _run_cli_process(
         self,
         command: list[str],
-        env: dict[str, str],
+        env: dict[str, str] | None,
         target_dir: Path | None = None,
         progress_plan: dict[str, int] | None = None,
         progress_state: dict[str, object] | None = None,
-    ):
-        state: dict[str, object] = {}
-        error: dict[str, Exception] = {}
-        started = time.monotonic()
+    ) -> subprocess.CompletedProcess:
         local_progress_state = (
             progress_state
             if progress_state is not None
             else {"percent": -1, "last_emit": 0.0}
         )
-
-        def worker() -> None:
-            try:
-                state["result"] = _subprocess_run(
+        tail: deque[str] = deque(maxlen=_CLI_OUTPUT_TAIL_LINES)
+        # Output goes to a temp file that is tailed between waits; pipes cannot
+        # be polled without a reader thread on Windows.
+        with tempfile.TemporaryDirectory(prefix="sludre-cli-") as tmp:
+            output_path = Path(tmp) / "output.log"
+            with open(output_path, "wb") as sink, open(
+                output_path, "r", encoding="utf-8", errors="replace", newline=""
+            ) as source:
+                process = _subprocess_popen(
                     command,
-                    check=False,
-                    text=True,
-                    capture_output=True,
+                    stdout=sink,
+                    stderr=subprocess.STDOUT,
                     env=env,
                 )
-            except Exception as exc:
-                error["exception"] = exc
+                started = last_output = last_notice = time.monotonic()
+                pending = ""
+                try:
+                    while True:
+                        try:
+                            returncode = process.wait(timeout=1.0)
+                        except subprocess.TimeoutExpired:
+                            returncode = None
+                        chunk = source.read()
+                        pending += chunk
+                        if chunk:
+                            last_output = time.monotonic()
+                            self._report_cli_percent(chunk, local_progress_state)
+                        *lines, pending = pending.split("\n")
+                        if returncode is not None:
+                            lines.append(pending)
+                        # tqdm redraws with carriage returns; keep the last frame only.
+                        pending = pending[pending.rstrip("\r").rfind("\r") + 1 :]
+                        now = time.monotonic()
+                        for line in lines:
+                            frames = [frame for frame in line.split("\r") if frame.strip()]
+                            if not frames:
+                                continue
+                            text = frames[-1].strip()
+                            tail.append(text)
+                            self._log_info("CLI: %s", text, notify_ui=True)
+                            last_output = now
+                        # The CLI's own progress bar is cheaper than stat'ing the
+                        # target tree; only sweep the disk when it goes quiet.
+                        cli_progress_at = float(
+                            local_progress_state.get("cli_progress_at", 0.0)
+                        )
+                        if target_dir is not None and (
+                            returncode is not None
+                            or now - cli_progress_at > _CLI_PROGRESS_QUIET_SEC
+                        ):
+                            self._emit_download_progress(
+                                target_dir=target_dir,
+                                plan=progress_plan,
+                                state=local_progress_state,
+                                force=returncode is not None,
+                            )
+                        if returncode is not None:
+                            break
+                        if now - max(last_output, last_notice) >= 10.0:
+                            self._log_info(
+                                "huggingface-cli still running... "
+                                f"elapsed {int(now - started)}s",
+                                notify_ui=True,
+                            )
+                            last_notice = now
+                finally:
+                    if process.poll() is None:
+                        process.kill()
+                        process.wait()
+        return subprocess.CompletedProcess(
+            command,
+            returncode,
+            stdout="\n".join(tail),
+            stderr="",
+        )
 
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-        while thread.is_alive():
-            thread.join(timeout=10.0)
-            if target_dir is not None:
-                self._emit_download_progress(
-                    target_dir=target_dir,
-                    plan=progress_plan,
-                    state=local_progress_state,
-                )
-            if thread.is_alive():
-                elapsed = int(time.monotonic() - started)
-                self._log_info(
-                    f"huggingface-cli still running... elapsed {elapsed}s",
-                    notify_ui=True,
-                )
-        if target_dir is not None:
-            self._emit_download_progress(
-                target_dir=target_dir,
-                plan=progress_plan,
-                state=local_progress_state,
-                force=True,
-            )
-        if "exception" in error:
-            raise error["exception"]
-        result = state.get("result")
-        if result is None:
-            raise RuntimeError("No subprocess result returned.")
-        return result
-
-    def ensure_model_available(self) -> Path:
+    def ensure_model_available(self, revalidate: bool = False) -> Path:
         manual = self._resolve_manual_model_path(for_download=True)
         if manual is not None:
             manual_path, ready = manual
-            if ready:
+            if ready and not revalidate:
                 return manual_path
+            if ready:
+                manual_path = Path(self.manual_model_path).expanduser()
             self._log_info(
                 f"Manual model directory selected as download target: {manual_path}",
                 notify_ui=True,
             )
-            return self._download_to_target(manual_path)
+            return self._download_to_target(manual_path, revalidate=revalidate)
 
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        cached = self._resolve_cached_model_path()
-        if cached is not None:
-            return cached
+        if not revalidate:
+            cached = self._resolve_cached_model_path()
+            if cached is not None:
+                return cached
 
-        return self._download_to_target(self._download_dir())
+        return self._download_to_target(self.download_dir, revalidate=revalidate)
@@ -5,8 +5,12 @@ from dataclasses import dataclass
 
 from src.core.config import AppConfig
 from src.core.llm_refiner import LlmRefineError, LlmRefiner
-from src.core.text_cleaner import apply_wordlist_replacements
-from src.core.wordlist_store import WordlistStore
+from src.core.text_cleaner import (
+    CompiledReplacements,
+    apply_wordlist_replacements_compiled,
+    compile_wordlist_replacements,
+)
+from src.core.wordlist_store import WordlistData, WordlistStore
 
 
 @dataclass
@@ -27,6 +31,29 @@ class TranscriptionPostProcessor:
         self.wordlist_store = wordlist_store
         self.llm_refiner = llm_refiner
         self.logger = logging.getLogger("sludre.pipeline")
+        # (wordlist version, compiled rules), swapped as one tuple so a reader on
+        # another thread never pairs rules with the wrong version.
+        self._compiled: tuple[int, CompiledReplacements] | None = None
+
+    def _replacements_for(self, version: int, wordlist: WordlistData) -> CompiledReplacements:
+        compiled = self._compiled
+        if compiled is None or compiled[0] != version:
+            compiled = (version, compile_wordlist_replacements(wordlist.replacements))
+            self._compiled = compiled
+        return compiled[1]
+
+    def prepare(self, config: AppConfig) -> None:
+        # Compiles the replacement patterns ahead of time, so the first
+        # dictation after startup or a wordlist edit does not pay for it.
+        if config.wordlist_enabled and config.wordlist_apply_replacements:
+            self._replacements_for(*self.wordlist_store.load_versioned())
+
+    def warm_up(self, config: AppConfig) -> None:
+        # Runs while the user is still speaking: everything post-processing
+        # needs that does not depend on the transcript.
+        self.prepare(config)
+        if config.llm_enabled:
+            self.llm_refiner.preconnect(config)
 
     def process(self, raw_text: str, config: AppConfig) -> PostProcessResult:
         base_text = raw_text.strip()
@@ -37,17 +64,24 @@ class TranscriptionPostProcessor:
                 llm_used=False,
                 replacement_hits=0,
             )
+        if not config.wordlist_enabled and not config.llm_enabled:
+            return PostProcessResult(
+                raw_text=base_text,
+                text=base_text,
+                llm_used=False,
+                replacement_hits=0,
+            )
 
         working = base_text
         replacement_hits = 0
         preferred_terms: list[str] = []
 
         if config.wordlist_enabled:
-            wordlist = self.wordlist_store.load()
+            version, wordlist = self.wordlist_store.load_versioned()
             if config.wordlist_apply_replacements:
-                replacement_result = apply_wordlist_replacements(
+                replacement_result = apply_wordlist_replacements_compiled(
                     text=working,
-                    rules=wordlist.replacements,
+                    compiled=self._replacements_for(version, wordlist),
                 )
                 working = replacement_result.text
                 replacement_hits = replacement_result.replacement_hits
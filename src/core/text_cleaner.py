@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from src.core.wordlist_store import ReplacementRule
 
@@ -12,20 +13,184 @@ class ReplacementResult:
     replacement_hits: int
 
 
-def apply_wordlist_replacements(
+@dataclass(frozen=True)
+class _CompiledBucket:
+    pattern: re.Pattern[str]
+    targets: tuple[str, ...]
+    match_case: bool
+    whole_word: bool
+    # Folded with _fold for case-insensitive buckets; used to skip the regex scan
+    # when none of the sources occur in the text at all.
+    needles: tuple[str, ...] = ()
+
+
+RuleKey = tuple[tuple[str, str, str, bool, bool], ...]
+
+# re.IGNORECASE treats dotted and dotless i as plain i, which casefold() alone
+# does not; mapping them first keeps the prefilter a superset of regex matches.
+_DOTTED_I = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def _fold(text: str) -> str:
+    return text.translate(_DOTTED_I).casefold()
+
+
+def _can_overlap(first: str, first_whole: bool, second: str, second_whole: bool) -> bool:
+    # Tries every alignment in which the two strings share at least one
+    # character. A whole-word string also needs a word boundary at each of its
+    # edges that falls between two known characters.
+    def char_at(offset: int, position: int) -> str | None:
+        if 0 <= position < len(first):
+            return first[position]
+        if 0 <= position - offset < len(second):
+            return second[position - offset]
+        return None
+
+    def boundary_possible(offset: int, position: int) -> bool:
+        before = char_at(offset, position - 1)
+        after = char_at(offset, position)
+        if before is None or after is None:
+            return True
+        return _is_word_char(before) != _is_word_char(after)
+
+    for offset in range(1 - len(second), len(first)):
+        low = max(0, offset)
+        high = min(len(first), offset + len(second))
+        if first[low:high] != second[low - offset : high - offset]:
+            continue
+        if second_whole and not (
+            boundary_possible(offset, offset)
+            and boundary_possible(offset, offset + len(second))
+        ):
+            continue
+        if first_whole and not (
+            boundary_possible(offset, 0) and boundary_possible(offset, len(first))
+        ):
+            continue
+        return True
+    return False
+
+
+def _rules_interact(rules: list[tuple[str, str, str, bool, bool]]) -> bool:
+    # Rules are applied one after another, so a later rule sees earlier output.
+    # A single fused pass only gives the same result when no two sources can
+    # overlap, no source can match inside or across another rule's target,
+    # and no replacement changes a word boundary next to it.
+    if len(rules) < 2:
+        return False
+    sources = [_fold(source) for source, _, _, _, _ in rules]
+    targets = [_fold(target) for _, _, target, _, _ in rules]
+    for index, (source, _, target, _, whole_word) in enumerate(rules):
+        if not target or (
+            _is_word_char(source[0]) != _is_word_char(target[0])
+            or _is_word_char(source[-1]) != _is_word_char(target[-1])
+        ):
+            return True
+        for other in range(len(rules)):
+            if other == index:
+                continue
+            other_whole = rules[other][4]
+            if other > index and _can_overlap(
+                sources[index], whole_word, sources[other], other_whole
+            ):
+                return True
+            # Fused buckets are grouped by flags, so a later rule's bucket may
+            # run first; targets are checked against every other source. The
+            # target sits where a whole-word source matched, so the same
+            # boundaries hold at its edges.
+            if _can_overlap(targets[index], whole_word, sources[other], other_whole):
+                return True
+    return False
+
+
+@lru_cache(maxsize=8)
+def _compile_rules(rules: RuleKey) -> tuple[_CompiledBucket, ...]:
+    active = [rule for rule in rules if rule[0]]
+    sequential = _rules_interact(active)
+    buckets: dict[object, list[tuple[str, str, str]]] = {}
+    modes: dict[object, tuple[bool, bool]] = {}
+    for index, (source, escaped, target, match_case, whole_word) in enumerate(active):
+        # Interacting rules keep one bucket each, applied in list order.
+        key = index if sequential else (match_case, whole_word)
+        buckets.setdefault(key, []).append((source, escaped, target))
+        modes[key] = (match_case, whole_word)
+
+    compiled: list[_CompiledBucket] = []
+    for key, entries in buckets.items():
+        match_case, whole_word = modes[key]
+        pattern = "|".join(
+            f"(?P<g{index}>{escaped})" for index, (_, escaped, _) in enumerate(entries)
+        )
+        if whole_word:
+            pattern = rf"\b(?:{pattern})\b"
+        flags = 0 if match_case else re.IGNORECASE
+        compiled.append(
+            _CompiledBucket(
+                pattern=re.compile(pattern, flags),
+                targets=tuple(target for _, _, target in entries),
+                match_case=match_case,
+                whole_word=whole_word,
+                needles=tuple(
+                    source if match_case else _fold(source) for source, _, _ in entries
+                ),
+            )
+        )
+    return tuple(compiled)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _substitute_with_regex(bucket: _CompiledBucket, text: str) -> tuple[str, int]:
+    targets = bucket.targets
+    return bucket.pattern.subn(lambda match: targets[int(match.lastgroup[1:])], text)
+
+
+@dataclass(frozen=True)
+class CompiledReplacements:
+    buckets: tuple[_CompiledBucket, ...]
+
+
+def compile_wordlist_replacements(rules: list[ReplacementRule]) -> CompiledReplacements:
+    key = tuple(
+        (
+            rule.stripped_source,
+            rule.escaped_source,
+            rule.target,
+            rule.match_case,
+            rule.whole_word,
+        )
+        for rule in rules
+    )
+    return CompiledReplacements(buckets=_compile_rules(key))
+
+
+def apply_wordlist_replacements_compiled(
     text: str,
-    rules: list[ReplacementRule],
+    compiled: CompiledReplacements,
 ) -> ReplacementResult:
     updated = text
+    folded: str | None = None
     total_hits = 0
-    for rule in rules:
-        source = rule.source.strip()
-        if not source:
+    for bucket in compiled.buckets:
+        if bucket.match_case:
+            haystack = updated
+        else:
+            if folded is None:
+                folded = _fold(updated)
+            haystack = folded
+        if not any(needle in haystack for needle in bucket.needles):
             continue
-        target = rule.target
-        escaped = re.escape(source)
-        pattern = rf"\b{escaped}\b" if rule.whole_word else escaped
-        flags = 0 if rule.match_case else re.IGNORECASE
-        updated, hits = re.subn(pattern, target, updated, flags=flags)
+        updated, hits = _substitute_with_regex(bucket, updated)
+        if hits:
+            folded = None
         total_hits += hits
     return ReplacementResult(text=updated, replacement_hits=total_hits)
+
+
+def apply_wordlist_replacements(
+    text: str,
+    rules: list[ReplacementRule],
+) -> ReplacementResult:
+    return apply_wordlist_replacements_compiled(text, compile_wordlist_replacements(rules))
@@ -1,23 +1,37 @@
 from __future__ import annotations
 
 import time
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def _keyboard():
     import keyboard
 
     return keyboard
 
 
+@lru_cache(maxsize=1)
 def _pyperclip():
     import pyperclip
 
     return pyperclip
 
 
+DIRECT_TYPING_MAX_CHARS = 200
+CLIPBOARD_SETTLE_TIMEOUT_SEC = 0.1
+
+
 class TextInserter:
-    def __init__(self, restore_clipboard: bool = True) -> None:
+    def __init__(
+        self,
+        restore_clipboard: bool = True,
+        insert_mode: str = "clipboard_paste",
+        direct_typing_max_chars: int = DIRECT_TYPING_MAX_CHARS,
+    ) -> None:
         self.restore_clipboard = restore_clipboard
+        self.insert_mode = insert_mode
+        self.direct_typing_max_chars = direct_typing_max_chars
 
     def insert_text_at_cursor(self, text: str) -> None:
         text = text.strip()
@@ -25,6 +39,10 @@ class TextInserter:
             return
 
         keyboard = _keyboard()
+        if self.insert_mode == "type_short" and len(text) < self.direct_typing_max_chars:
+            keyboard.write(text, delay=0)
+            return
+
         pyperclip = _pyperclip()
 
         previous = None
@@ -35,9 +53,21 @@ class TextInserter:
                 previous = None
 
         pyperclip.copy(text)
-        time.sleep(0.02)
+        self._wait_for_clipboard(pyperclip, text)
         keyboard.send("ctrl+v")
+        # The target window reads the clipboard asynchronously after ctrl+v.
         time.sleep(0.02)
 
         if self.restore_clipboard and previous is not None:
             pyperclip.copy(previous)
+
+    @staticmethod
+    def _wait_for_clipboard(pyperclip, text: str) -> None:
+        deadline = time.monotonic() + CLIPBOARD_SETTLE_TIMEOUT_SEC
+        while time.monotonic() < deadline:
+            try:
+                if pyperclip.paste() == text:
+                    return
+            except Exception:
+                return
+            time.sleep(0.001)
@@ -1,23 +1,73 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
+import threading
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 
+from src.core import json_io
+
+
+COMPUTE_TYPE_CACHE_FILE = ".sludre_compute_type"
+_INT16_SCALE = 32768.0
+BATCHED_MIN_SECONDS = 30
+BATCH_SIZE = 8
+# "auto" lets CTranslate2 keep the converted model's own quantization when the
+# device supports it; the rest are explicit fallbacks.
+_CUDA_COMPUTE_TYPES = ("auto", "int8_float16", "float16", "int8")
+_CPU_COMPUTE_TYPES = ("int8", "float32")
+
+
+@lru_cache(maxsize=1)
 def _import_whisper_model() -> Any:
     from faster_whisper import WhisperModel
 
     return WhisperModel
 
 
+@lru_cache(maxsize=1)
+def _import_batched_pipeline() -> Any:
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        return None
+    return BatchedInferencePipeline
+
+
+def _prefetch_whisper_model() -> None:
+    try:
+        _import_whisper_model()
+    except Exception:
+        # load() imports again and reports the failure where it matters.
+        pass
+
+
+def _as_float32_audio(audio: Any) -> Any:
+    # CTranslate2 wants contiguous float32 samples; converting once here keeps it
+    # from copying and casting internally. AudioCapture output passes through.
+    if not isinstance(audio, np.ndarray):
+        return audio
+    if audio.dtype == np.int16:
+        # One ufunc pass casts and scales into a fresh contiguous array.
+        return np.multiply(audio, np.float32(1.0 / _INT16_SCALE), dtype=np.float32)
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
 @dataclass
 class TranscriptionResult:
     text: str
     language: str
     duration_sec: float
     latency_ms: int
+    raw_duration_sec: float = 0.0
 
 
 class Transcriber:
@@ -26,66 +76,183 @@ class Transcriber:
         model_path: Path,
         device: str = "cuda",
         compute_type: str | None = None,
+        beam_size: int = 1,
     ) -> None:
         self.model_path = model_path
         self.device = device
         self.compute_type = compute_type
+        self.beam_size = beam_size
         self._model = None
+        self._batched = None
+        self._load_lock = threading.Lock()
+        self.logger = logging.getLogger("sludre.transcriber")
+        # Importing faster-whisper loads CTranslate2 and CUDA libraries; start it
+        # now so it overlaps with the first recording instead of delaying it.
+        threading.Thread(
+            target=_prefetch_whisper_model,
+            name="whisper-import",
+            daemon=True,
+        ).start()
+
+    def _model_mtime_ns(self) -> int | None:
+        try:
+            return os.stat(os.path.join(self.model_path, "model.bin")).st_mtime_ns
+        except OSError:
+            return None
+
+    def _cached_compute_type(self) -> str | None:
+        try:
+            cached = json.loads((self.model_path / COMPUTE_TYPE_CACHE_FILE).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict):
+            return None
+        if cached.get("device") != self.device:
+            return None
+        mtime_ns = self._model_mtime_ns()
+        if mtime_ns is None or cached.get("model_mtime_ns") != mtime_ns:
+            return None
+        compute_type = cached.get("compute_type")
+        return compute_type if isinstance(compute_type, str) and compute_type else None
 
-    def _compute_type_candidates(self) -> list[str]:
+    def _store_compute_type(self, compute_type: str) -> None:
+        mtime_ns = self._model_mtime_ns()
+        if mtime_ns is None:
+            return
+        payload = {
+            "compute_type": compute_type,
+            "device": self.device,
+            "model_mtime_ns": mtime_ns,
+        }
+        try:
+            json_io.write_atomic(
+                self.model_path / COMPUTE_TYPE_CACHE_FILE, json.dumps(payload).encode("utf-8")
+            )
+        except OSError:
+            # Read-only model folders simply probe again on the next start.
+            pass
+
+    def _compute_type_candidates(self) -> tuple[str, ...]:
         if self.compute_type:
-            return [self.compute_type]
-        if self.device == "cuda":
-            return ["float16", "int8_float16", "int8"]
-        return ["int8", "float32"]
+            return (self.compute_type,)
+        candidates = _CUDA_COMPUTE_TYPES if self.device == "cuda" else _CPU_COMPUTE_TYPES
+        cached = self._cached_compute_type()
+        if cached is not None:
+            candidates = (cached, *(item for item in candidates if item != cached))
+        return candidates
 
     def load(self) -> None:
         whisper_model_cls = _import_whisper_model()
         errors: list[str] = []
-        for candidate in self._compute_type_candidates():
+        candidates = self._compute_type_candidates()
+        self._batched = None
+        for candidate in candidates:
             try:
                 self._model = whisper_model_cls(
                     str(self.model_path),
                     device=self.device,
                     compute_type=candidate,
                 )
-                self.compute_type = candidate
-                return
+                resolved = getattr(getattr(self._model, "model", None), "compute_type", None)
+                # CUDA/cuBLAS/cuDNN load failures often first show up on the
+                # first encode, so a failed warm-up falls through to the next type.
+                self._warm_up()
             except Exception as exc:  # pragma: no cover - device specific path
+                self._model = None
+                self.logger.warning(
+                    "Model load failed. compute_type=%s error=%s", candidate, exc
+                )
                 errors.append(f"{candidate}: {exc}")
+                continue
+            self.compute_type = str(resolved or candidate)
+            if len(candidates) > 1 and self.compute_type != candidates[0]:
+                self._store_compute_type(self.compute_type)
+            return
         joined = "\n".join(errors) if errors else "No compute types tried."
         raise RuntimeError(f"Failed to load model.\n{joined}")
 
+    def _warm_up(self) -> None:
+        # One second of silence runs the encoder once, so kernel selection and
+        # workspace allocation happen here instead of on the first dictation.
+        segments, _info = self._model.transcribe(
+            np.zeros(16000, dtype=np.float32),
+            language="da",
+            beam_size=1,
+            vad_filter=False,
+        )
+        for _segment in segments:
+            pass
+
     def _ensure_loaded(self) -> None:
-        if self._model is None:
-            self.load()
+        if self._model is not None:
+            return
+        with self._load_lock:
+            if self._model is None:
+                self.load()
 
-    def transcribe(
+    def _batched_pipeline(self) -> Any:
+        # Long recordings span several 30 s windows; the batched pipeline decodes
+        # those windows together instead of one after another.
+        if self.device != "cuda":
+            return None
+        if self._batched is None:
+            pipeline_cls = _import_batched_pipeline()
+            if pipeline_cls is None:
+                return None
+            self._batched = pipeline_cls(model=self._model)
+        return self._batched
+
+    def _start_transcription(
         self,
         audio: Any,
         sample_rate: int,
-        language: str = "da",
-    ) -> TranscriptionResult:
+        language: str,
+    ) -> tuple[Iterable[Any], Any]:
         self._ensure_loaded()
         if getattr(audio, "ndim", 1) != 1:
             raise ValueError("Expected mono audio as 1D array.")
         if sample_rate != 16000:
             raise ValueError("Expected sample rate of 16000 Hz.")
-
-        start = time.perf_counter()
-        segments, info = self._model.transcribe(
+        audio = _as_float32_audio(audio)
+        sample_count = int(audio.shape[0]) if hasattr(audio, "shape") else len(audio)
+        if sample_count > BATCHED_MIN_SECONDS * sample_rate:
+            batched = self._batched_pipeline()
+            if batched is not None:
+                return batched.transcribe(
+                    audio,
+                    language=language,
+                    beam_size=self.beam_size,
+                    batch_size=BATCH_SIZE,
+                )
+        return self._model.transcribe(
             audio,
             language=language,
-            beam_size=5,
+            beam_size=self.beam_size,
             vad_filter=True,
+            # Dictation clips are short; carrying decoder context between
+            # segments mostly adds repetition loops on long ones.
+            condition_on_previous_text=False,
         )
+
+    def transcribe(
+        self,
+        audio: Any,
+        sample_rate: int,
+        language: str = "da",
+    ) -> TranscriptionResult:
+        self._ensure_loaded()
+        start = time.perf_counter_ns()
+        segments, info = self._start_transcription(audio, sample_rate, language)
         text = "".join(segment.text for segment in segments).strip()
-        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start) // 1_000_000
         detected_language = getattr(info, "language", language)
         sample_count = int(audio.shape[0]) if hasattr(audio, "shape") else len(audio)
+        raw_duration = float(sample_count) / float(sample_rate)
+        # duration_sec is the speech VAD kept, i.e. what the encoder worked on.
         return TranscriptionResult(
             text=text,
             language=detected_language,
-            duration_sec=float(sample_count) / float(sample_rate),
+            duration_sec=float(getattr(info, "duration_after_vad", raw_duration)),
             latency_ms=elapsed_ms,
+            raw_duration_sec=float(getattr(info, "duration", raw_duration)),
         )
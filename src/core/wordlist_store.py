@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import asdict, dataclass, field
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from src.core import json_io
 
-@dataclass
+
+@dataclass(slots=True)
 class ReplacementRule:
     source: str
     target: str
     match_case: bool = False
     whole_word: bool = True
+    stripped_source: str = field(init=False, repr=False, compare=False)
+    escaped_source: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.stripped_source = self.source.strip()
+        self.escaped_source = re.escape(self.stripped_source)
 
 
-@dataclass
+@dataclass(slots=True)
 class WordlistData:
     replacements: list[ReplacementRule] = field(default_factory=list)
     preferred_terms: list[str] = field(default_factory=list)
@@ -22,15 +34,48 @@ class WordlistData:
 class WordlistStore:
     def __init__(self, path: Path):
         self.path = path
+        # Bumped whenever the stored wordlist may have changed, so callers can
+        # cache work derived from it.
+        self.version = 0
+        self._signature: tuple[int, int] | None = None
+        self._cached: WordlistData | None = None
+        self._saved_digest: bytes | None = None
+        # The STT, warm-up, model-init and UI threads all load the wordlist;
+        # the lock keeps the signature, version and cached data consistent.
+        self._lock = threading.RLock()
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def load(self) -> WordlistData:
-        if not self.path.exists():
-            data = WordlistData()
-            self.save(data)
-            return data
+        return self.load_versioned()[1]
+
+    def load_versioned(self) -> tuple[int, WordlistData]:
+        with self._lock:
+            signature = self._file_signature()
+            if signature is None:
+                data = WordlistData()
+                self.save(data)
+                return self.version, data
+            # Callers treat the result as read-only, so the parsed wordlist is
+            # shared until the file changes on disk.
+            if signature == self._signature and self._cached is not None:
+                return self.version, self._cached
+            if signature != self._signature:
+                self._signature = signature
+                self.version += 1
+            # An empty file is treated like an empty wordlist without parsing it.
+            self._cached = self._parse() if signature[1] else WordlistData()
+            return self.version, self._cached
+
+    def _parse(self) -> WordlistData:
         try:
-            raw = json.loads(self.path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            raw = json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
             return WordlistData()
 
         replacements: list[ReplacementRule] = []
@@ -41,18 +86,17 @@ class WordlistStore:
                 continue
             replacements.append(
                 ReplacementRule(
-                    source=source,
-                    target=target,
+                    source=sys.intern(source),
+                    target=sys.intern(target),
                     match_case=bool(item.get("match_case", False)),
                     whole_word=bool(item.get("whole_word", True)),
                 )
             )
 
-        preferred_terms: list[str] = []
-        for value in raw.get("preferred_terms", []):
-            term = str(value).strip()
-            if term:
-                preferred_terms.append(term)
+        preferred_terms = [
+            term for term in (str(value).strip() for value in raw.get("preferred_terms", []))
+            if term
+        ]
         return WordlistData(
             replacements=replacements,
             preferred_terms=preferred_terms,
@@ -61,10 +105,25 @@ class WordlistStore:
     def save(self, data: WordlistData) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         payload = {
-            "replacements": [asdict(rule) for rule in data.replacements],
+            # Plain dicts; asdict() deep-copies every field of every rule.
+            "replacements": [
+                {
+                    "source": rule.source,
+                    "target": rule.target,
+                    "match_case": rule.match_case,
+                    "whole_word": rule.whole_word,
+                }
+                for rule in data.replacements
+            ],
             "preferred_terms": data.preferred_terms,
         }
-        self.path.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=True),
-            encoding="utf-8",
-        )
+        encoded = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+        digest = hashlib.blake2b(encoded, digest_size=16).digest()
+        with self._lock:
+            if digest == self._saved_digest and self._file_signature() == self._signature:
+                return
+            json_io.write_atomic(self.path, encoded)
+            self._saved_digest = digest
+            self._signature = self._file_signature()
+            self._cached = None
+            self.version += 1
@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
 import threading
 import time
 import traceback
+from collections import deque
+from collections.abc import Callable
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Qt, Signal
-from PySide6.QtGui import QColor, QGuiApplication, QIcon, QLinearGradient, QPainter, QPixmap
+from PySide6.QtCore import QEvent, QObject, QRect, QSignalBlocker, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QGuiApplication, QIcon, QLinearGradient, QPainter, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -26,10 +31,11 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSpinBox,
     QDoubleSpinBox,
+    QStyle,
+    QStyledItemDelegate,
     QTabWidget,
     QTableWidget,
     QTableWidgetItem,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
     QHeaderView,
@@ -37,7 +43,7 @@ from PySide6.QtWidgets import (
 
 from src.core.audio_capture import AudioCapture
 from src.core.app_logging import default_log_file
-from src.core.config import AppConfig, ConfigStore, DEFAULT_LLM_SYSTEM_PROMPT, MISTRAL_MODEL_PRESETS
+from src.core.config import AppConfig, ConfigStore, DEFAULT_LLM_SYSTEM_PROMPT, MISTRAL_MODEL_PRESETS, QUANTIZATION_MODES
 from src.core.env_secrets import EnvSecretsStore
 from src.core.hotkey_controller import HotkeyController
 from src.core.llm_refiner import LlmRefiner
@@ -60,34 +66,204 @@ THEME = {
     "input_bg": "rgba(4, 12, 22, 180)",
 }
 
+LOG_MAX_LINES = 2000
+LOG_FLUSH_INTERVAL_MS = 16
+# Which of (OpenAI base URL, Mistral base URL, Mistral preset) each provider uses.
+PROVIDER_FIELDS = {
+    "openai_compatible": (True, False, False),
+    "mistral_api": (False, True, True),
+}
+
+# THEME never changes at runtime, so the stylesheet is formatted once at import;
+# placeholders name THEME keys.
+_STYLESHEET_TEMPLATE = """
+    QWidget {{
+        color: {text};
+        font-family: "Segoe UI Variable";
+        font-size: 12px;
+    }}
+    #heroCard {{
+        border: 1px solid {border};
+        border-radius: 16px;
+        background: rgba(7, 20, 37, 176);
+    }}
+    #heroLogo {{
+        border-radius: 14px;
+        background: rgba(6, 16, 30, 210);
+        border: 1px solid rgba(173, 201, 233, 105);
+        font-size: 38px;
+        font-weight: 700;
+    }}
+    #heroTitle {{
+        font-size: 28px;
+        font-weight: 700;
+        letter-spacing: 0.8px;
+    }}
+    #heroSubtitle {{
+        color: {muted};
+        font-size: 13px;
+    }}
+    #statusLabel {{
+        font-size: 16px;
+        font-weight: 650;
+        color: #E5F8FF;
+        margin-top: 2px;
+    }}
+    #mainTabs::pane {{
+        border: 1px solid {border};
+        border-radius: 14px;
+        background: {card};
+        margin-top: 8px;
+    }}
+    #mainTabs QTabBar::tab {{
+        background: rgba(6, 14, 26, 145);
+        border: 1px solid {border};
+        border-bottom: none;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+        padding: 8px 14px;
+        margin-right: 6px;
+        color: {muted};
+    }}
+    #mainTabs QTabBar::tab:selected {{
+        background: {card};
+        color: {text};
+    }}
+    QPushButton {{
+        background: {accent};
+        color: #0B2318;
+        border: none;
+        border-radius: 10px;
+        padding: 7px 12px;
+        font-weight: 600;
+    }}
+    QPushButton:hover {{
+        background: {accent_hover};
+    }}
+    QPushButton:disabled {{
+        background: rgba(140, 165, 190, 110);
+        color: rgba(11, 35, 24, 140);
+    }}
+    QLineEdit, QPlainTextEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTableWidget {{
+        background: {input_bg};
+        border: 1px solid {border};
+        border-radius: 10px;
+        selection-background-color: rgba(50, 210, 124, 80);
+        alternate-background-color: rgba(12, 21, 34, 170);
+    }}
+    QComboBox {{
+        padding-right: 8px;
+    }}
+    QComboBox QAbstractItemView {{
+        background: rgba(7, 17, 30, 245);
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 10px;
+        selection-background-color: rgba(50, 210, 124, 135);
+        selection-color: #061B12;
+        outline: 0;
+    }}
+    QComboBox QAbstractItemView::item {{
+        background: transparent;
+        color: {text};
+        min-height: 24px;
+        padding: 4px 8px;
+    }}
+    QComboBox QAbstractItemView::item:hover {{
+        background: rgba(50, 210, 124, 60);
+        color: {text};
+    }}
+    QComboBox QAbstractItemView::item:selected {{
+        background: rgba(50, 210, 124, 135);
+        color: #061B12;
+    }}
+    QHeaderView::section {{
+        background: rgba(5, 12, 24, 190);
+        color: {muted};
+        border: none;
+        padding: 6px;
+    }}
+    QCheckBox {{
+        spacing: 6px;
+    }}
+"""
+_STYLESHEET = _STYLESHEET_TEMPLATE.format_map(THEME)
+
+
+@lru_cache(maxsize=None)
+def _load_pixmap(path: str) -> QPixmap:
+    # The logo backs the window icon, the hero card and the listening overlay;
+    # decode it once and let each caller scale its own copy.
+    return QPixmap(path)
+
+
+@lru_cache(maxsize=None)
+def _asset_files(root: str) -> dict[str, str]:
+    # One directory listing per root instead of a stat per candidate name.
+    try:
+        with os.scandir(root) as entries:
+            return {entry.name.casefold(): entry.path for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
 
 class StyledBackgroundWidget(QWidget):
+    SMOOTH_RESCALE_DELAY_MS = 50
+
     def __init__(self, image_path: Path | None = None, parent: QWidget | None = None):
         super().__init__(parent)
         self._pixmap = QPixmap(str(image_path)) if image_path and image_path.exists() else QPixmap()
+        self._background: tuple[QSize, QPixmap] | None = None
+        self._gradient_strip: QPixmap | None = None
+        self._smooth = True
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(self.SMOOTH_RESCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._rescale_smoothly)
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        # Scale cheaply while the window is being dragged; redo it smoothly
+        # once the size has settled.
+        self._background = None
+        self._smooth = False
+        self._smooth_timer.start()
+        super().resizeEvent(event)
+
+    def _rescale_smoothly(self) -> None:
+        self._background = None
+        self._smooth = True
+        self.update()
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
         del event
+        size = self.size()
+        if self._background is None or self._background[0] != size:
+            self._background = (size, self._render_background(size))
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
-        rect = self.rect()
+        painter.drawPixmap(0, 0, self._background[1])
+
+    def _render_background(self, size: QSize) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        canvas = QPixmap(int(size.width() * ratio), int(size.height() * ratio))
+        canvas.setDevicePixelRatio(ratio)
+        painter = QPainter(canvas)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self._smooth)
+        rect = QRect(0, 0, size.width(), size.height())
         painter.fillRect(rect, QColor(THEME["bg_fallback"]))
 
         if not self._pixmap.isNull():
+            mode = Qt.TransformationMode.SmoothTransformation if self._smooth else Qt.TransformationMode.FastTransformation
             scaled = self._pixmap.scaled(
-                rect.size(),
+                size * ratio,
                 Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation,
+                mode,
             )
-            x = (rect.width() - scaled.width()) // 2
-            y = (rect.height() - scaled.height()) // 2
+            scaled.setDevicePixelRatio(ratio)
+            x = (rect.width() - round(scaled.width() / ratio)) // 2
+            y = (rect.height() - round(scaled.height() / ratio)) // 2
             painter.drawPixmap(x, y, scaled)
 
-        overlay = QLinearGradient(0, 0, 0, rect.height())
-        overlay.setColorAt(0.0, QColor(4, 10, 20, 128))
-        overlay.setColorAt(0.6, QColor(4, 10, 20, 192))
-        overlay.setColorAt(1.0, QColor(4, 10, 20, 234))
-        painter.fillRect(rect, overlay)
+        painter.drawPixmap(rect, self._overlay_strip(size.height()))
 
         # Decorative ambient circles for depth.
         painter.setPen(Qt.PenStyle.NoPen)
@@ -95,6 +271,24 @@ class StyledBackgroundWidget(QWidget):
         painter.drawEllipse(int(rect.width() * 0.66), -130, 420, 420)
         painter.setBrush(QColor(50, 210, 124, 32))
         painter.drawEllipse(-160, int(rect.height() * 0.54), 450, 450)
+        painter.end()
+        return canvas
+
+    def _overlay_strip(self, height: int) -> QPixmap:
+        # The overlay only varies vertically: render it one pixel wide and
+        # stretch it across the window.
+        if self._gradient_strip is None or self._gradient_strip.height() != height:
+            strip = QPixmap(1, max(height, 1))
+            strip.fill(Qt.GlobalColor.transparent)
+            overlay = QLinearGradient(0, 0, 0, height)
+            overlay.setColorAt(0.0, QColor(4, 10, 20, 128))
+            overlay.setColorAt(0.6, QColor(4, 10, 20, 192))
+            overlay.setColorAt(1.0, QColor(4, 10, 20, 234))
+            painter = QPainter(strip)
+            painter.fillRect(strip.rect(), overlay)
+            painter.end()
+            self._gradient_strip = strip
+        return self._gradient_strip
 
 
 class ListeningOverlay(QWidget):
@@ -125,7 +319,7 @@ class ListeningOverlay(QWidget):
         self.icon_label.setMinimumSize(56, 56)
         self.icon_label.setMaximumSize(56, 56)
         if icon_path and icon_path.exists():
-            pix = QPixmap(str(icon_path))
+            pix = _load_pixmap(str(icon_path))
             if not pix.isNull():
                 self.icon_label.setPixmap(
                     pix.scaled(
@@ -178,9 +372,57 @@ class ListeningOverlay(QWidget):
         self.adjustSize()
 
 
+class CopyButtonDelegate(QStyledItemDelegate):
+    copy_requested = Signal(str)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._buttons: dict[tuple[int, int, bool, float], QPixmap] = {}
+
+    def paint(self, painter: QPainter, option, index) -> None:  # type: ignore[override]
+        rect = option.rect.adjusted(6, 4, -6, -4)
+        hover = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        ratio = painter.device().devicePixelRatioF()
+        painter.drawPixmap(rect.topLeft(), self._button(rect.width(), rect.height(), hover, ratio))
+
+    def _button(self, width: int, height: int, hover: bool, ratio: float) -> QPixmap:
+        # Rendered once per size and state so repaints are plain blits instead
+        # of one QPushButton widget per history row.
+        key = (width, height, hover, ratio)
+        pixmap = self._buttons.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(max(int(width * ratio), 1), max(int(height * ratio), 1))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            area = QRect(0, 0, width, height)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(THEME["accent_hover"] if hover else THEME["accent"]))
+            painter.drawRoundedRect(area, 10, 10)
+            font = painter.font()
+            font.setWeight(QFont.Weight.DemiBold)
+            painter.setFont(font)
+            painter.setPen(QColor("#0B2318"))
+            painter.drawText(area, Qt.AlignmentFlag.AlignCenter, "Kopier")
+            painter.end()
+            self._buttons[key] = pixmap
+        return pixmap
+
+    def editorEvent(self, event, model, option, index) -> bool:  # type: ignore[override]
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and option.rect.contains(event.position().toPoint())
+        ):
+            self.copy_requested.emit(str(index.data(Qt.ItemDataRole.UserRole) or ""))
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class UiBridge(QObject):
     status_changed = Signal(str)
-    log_message = Signal(str)
+    log_pending = Signal()
     ready_changed = Signal(bool)
     model_init_finished = Signal()
     listening_overlay_state_changed = Signal(str)
@@ -214,14 +456,22 @@ class WordlistEditorDialog(QDialog):
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
-        for rule in self._data.replacements:
-            self._add(rule)
+        self.rules.setUpdatesEnabled(False)
+        self.rules.blockSignals(True)
+        self.rules.setRowCount(len(self._data.replacements))
+        for row, rule in enumerate(self._data.replacements):
+            self._fill_row(row, rule)
+        self.rules.blockSignals(False)
+        self.rules.setUpdatesEnabled(True)
         self.terms.setPlainText("\n".join(self._data.preferred_terms))
 
     def _add(self, rule: ReplacementRule | None = None) -> None:
         r = rule if isinstance(rule, ReplacementRule) else ReplacementRule("", "")
         row = self.rules.rowCount()
         self.rules.insertRow(row)
+        self._fill_row(row, r)
+
+    def _fill_row(self, row: int, r: ReplacementRule) -> None:
         self.rules.setItem(row, 0, QTableWidgetItem(r.source))
         self.rules.setItem(row, 1, QTableWidgetItem(r.target))
         for col, value in [(2, r.match_case), (3, r.whole_word)]:
@@ -236,20 +486,23 @@ class WordlistEditorDialog(QDialog):
 
     def to_wordlist_data(self) -> WordlistData:
         reps: list[ReplacementRule] = []
+        item = self.rules.item
+        checked = Qt.CheckState.Checked
         for row in range(self.rules.rowCount()):
-            src = (self.rules.item(row, 0).text() if self.rules.item(row, 0) else "").strip()
-            dst = (self.rules.item(row, 1).text() if self.rules.item(row, 1) else "").strip()
+            source_item = item(row, 0)
+            src = source_item.text().strip() if source_item else ""
             if not src:
                 continue
+            target_item = item(row, 1)
             reps.append(
                 ReplacementRule(
                     source=src,
-                    target=dst,
-                    match_case=self.rules.item(row, 2).checkState() == Qt.CheckState.Checked,
-                    whole_word=self.rules.item(row, 3).checkState() == Qt.CheckState.Checked,
+                    target=target_item.text().strip() if target_item else "",
+                    match_case=item(row, 2).checkState() == checked,
+                    whole_word=item(row, 3).checkState() == checked,
                 )
             )
-        terms = [t.strip() for t in self.terms.toPlainText().splitlines() if t.strip()]
+        terms = [term for line in self.terms.toPlainText().splitlines() if (term := line.strip())]
         return WordlistData(replacements=reps, preferred_terms=terms)
 
 
@@ -259,17 +512,38 @@ class MainWindow(QMainWindow):
         self.logger = logging.getLogger("sludre.ui")
         self.setWindowTitle("Sludre")
         self.resize(1020, 820)
+        # Guards only the check-and-set transitions (listen start/stop, starting a
+        # transcription); single flag writes and reads are atomic on their own.
         self._state_lock = threading.Lock()
         self._ready = False
         self._listening = False
         self._transcribing = False
         self._model_thread: threading.Thread | None = None
+        self._model_init_cancel = threading.Event()
+        # One long-lived daemon worker for transcription + post-processing;
+        # cycles are already serialized by the _transcribing flag. Daemon threads
+        # never hold up interpreter exit, unlike ThreadPoolExecutor workers.
+        self._stt_jobs: queue.SimpleQueue[Callable[[], None] | None] = queue.SimpleQueue()
+        threading.Thread(target=self._run_stt_jobs, name="sludre-stt", daemon=True).start()
+        # Warm-up gets its own thread: an LLM connect can block for the full
+        # timeout and must never delay transcription.
+        self._warmup_thread: threading.Thread | None = None
         self._model_init_in_progress = False
         self._log_visible = True
+        self._raw_dialog: tuple[QMessageBox, QPushButton] | None = None
 
         self.bridge = UiBridge()
         self.bridge.status_changed.connect(self._set_status_label)
-        self.bridge.log_message.connect(self._append_log)
+        self.bridge.log_pending.connect(self._schedule_log_flush)
+        # Filled from any thread by _ui_log; the UI thread drains it in batches.
+        self._pending_log: deque[str] = deque()
+        self._log_lock = threading.Lock()
+        self._log_signal_pending = False
+        self._clock = (-1, "")
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         self.bridge.ready_changed.connect(self._set_ready_state)
         self.bridge.model_init_finished.connect(self._on_model_init_finished)
         self.bridge.listening_overlay_state_changed.connect(self._set_listening_overlay_state)
@@ -282,9 +556,10 @@ class MainWindow(QMainWindow):
         self._secrets_migrated = False
         self._sync_runtime_secrets()
         self._prompt_presets = self._normalize_prompts(self.config.llm_prompt_presets)
+        self._prompt_index = {p["name"]: p for p in self._prompt_presets}
 
         self.audio_capture = AudioCapture(sample_rate=self.config.sample_rate, channels=self.config.channels, max_record_seconds=self.config.max_record_seconds, silence_trim=self.config.silence_trim)
-        self.text_inserter = TextInserter(restore_clipboard=self.config.restore_clipboard)
+        self.text_inserter = TextInserter(restore_clipboard=self.config.restore_clipboard, insert_mode=self.config.insert_mode)
         self.wordlist_store = WordlistStore(Path(self.config.wordlist_path))
         self.llm_refiner = LlmRefiner(log_callback=self._ui_log)
         self.post_processor = TranscriptionPostProcessor(self.wordlist_store, self.llm_refiner)
@@ -294,7 +569,7 @@ class MainWindow(QMainWindow):
         self._logo_path = self._find_asset(["sludre_logo.jpg", "sludre_logo.png"])
         self._background_path = self._find_asset(["sludre_background_stick.jpg", "sludre_background_stick.png", "background.jpg", "background.png"])
         if self._logo_path:
-            self.setWindowIcon(QIcon(str(self._logo_path)))
+            self.setWindowIcon(QIcon(_load_pixmap(str(self._logo_path))))
         self._build_ui()
         self._apply_theme()
         self.listening_overlay = ListeningOverlay(self._logo_path)
@@ -320,10 +595,11 @@ class MainWindow(QMainWindow):
     def _find_asset(candidates: list[str]) -> Path | None:
         roots = [assets_dir(), runtime_root(), Path("assets"), Path(".")]
         for root in roots:
+            files = _asset_files(str(root))
             for name in candidates:
-                candidate = root / name
-                if candidate.exists() and candidate.is_file():
-                    return candidate
+                found = files.get(name.casefold())
+                if found is not None:
+                    return Path(found)
         return None
 
     def _build_ui(self) -> None:
@@ -350,7 +626,7 @@ class MainWindow(QMainWindow):
         self.logo_label.setMaximumSize(78, 78)
         self.logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         if self._logo_path:
-            pix = QPixmap(str(self._logo_path))
+            pix = _load_pixmap(str(self._logo_path))
             if not pix.isNull():
                 self.logo_label.setPixmap(
                     pix.scaled(
@@ -380,6 +656,8 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(QLabel("Output historik:"))
         self.output_table = QTableWidget(0, 4, self); self.output_table.setHorizontalHeaderLabels(["Tid", "Transkribering", "Output", "Kopi"]); self.output_table.horizontalHeader().setStretchLastSection(False); self.output_table.setColumnWidth(0, 90); self.output_table.setColumnWidth(3, 80); main_layout.addWidget(self.output_table, 2)
         self.output_table.verticalHeader().setVisible(False)
+        self.copy_delegate = CopyButtonDelegate(self.output_table); self.copy_delegate.copy_requested.connect(QApplication.clipboard().setText)
+        self.output_table.setItemDelegateForColumn(3, self.copy_delegate); self.output_table.setMouseTracking(True)
         self.output_table.setAlternatingRowColors(True)
         self.output_table.setWordWrap(True)
         self.output_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
@@ -392,12 +670,13 @@ class MainWindow(QMainWindow):
         log_header.addStretch(1)
         log_header.addWidget(self.toggle_log_btn)
         main_layout.addLayout(log_header)
-        self.log_output = QTextEdit(); self.log_output.setReadOnly(True); main_layout.addWidget(self.log_output, 1)
+        self.log_output = QPlainTextEdit(); self.log_output.setReadOnly(True); self.log_output.setUndoRedoEnabled(False); self.log_output.setMaximumBlockCount(LOG_MAX_LINES); main_layout.addWidget(self.log_output, 1)
 
         s = QVBoxLayout(settings)
         model_row = QHBoxLayout(); self.manual_model_input = QLineEdit(self.config.manual_model_path); browse = QPushButton("Browse..."); browse.clicked.connect(self._browse_model_path); model_row.addWidget(self.manual_model_input); model_row.addWidget(browse); s.addLayout(model_row)
         self.hf_token_input = QLineEdit(self.config.hf_token); self.hf_token_input.setEchoMode(QLineEdit.EchoMode.Password); self.hf_token_input.setPlaceholderText("Optional Hugging Face token"); self.hf_token_input.textChanged.connect(self._update_model_controls); s.addWidget(self.hf_token_input)
         self.download_model_btn = QPushButton("Download model"); self.download_model_btn.clicked.connect(self._on_download_model_clicked); s.addWidget(self.download_model_btn)
+        quant = QFormLayout(); self.quantization = QComboBox(); [self.quantization.addItem(m, m) for m in QUANTIZATION_MODES]; self._set_combo(self.quantization, self.config.quantization_mode); quant.addRow("Kvantisering:", self.quantization); s.addLayout(quant)
         self.llm_enabled = QCheckBox("Enable LLM cleanup"); self.llm_enabled.setChecked(self.config.llm_enabled); s.addWidget(self.llm_enabled)
         llm = QFormLayout(); self.provider = QComboBox(); self.provider.addItem("OpenAI-compatible", "openai_compatible"); self.provider.addItem("Mistral API", "mistral_api")
         self.base_url = QLineEdit(self.config.llm_base_url); self.mistral_base = QLineEdit(self.config.mistral_base_url); self.api_key = QLineEdit(self.config.llm_api_key); self.api_key.setEchoMode(QLineEdit.EchoMode.Password); self.model_name = QLineEdit(self.config.llm_model)
@@ -437,119 +716,7 @@ class MainWindow(QMainWindow):
         self._secrets_migrated = migrated
 
     def _apply_theme(self) -> None:
-        self.setStyleSheet(
-            f"""
-            QWidget {{
-                color: {THEME["text"]};
-                font-family: "Segoe UI Variable";
-                font-size: 12px;
-            }}
-            #heroCard {{
-                border: 1px solid {THEME["border"]};
-                border-radius: 16px;
-                background: rgba(7, 20, 37, 176);
-            }}
-            #heroLogo {{
-                border-radius: 14px;
-                background: rgba(6, 16, 30, 210);
-                border: 1px solid rgba(173, 201, 233, 105);
-                font-size: 38px;
-                font-weight: 700;
-            }}
-            #heroTitle {{
-                font-size: 28px;
-                font-weight: 700;
-                letter-spacing: 0.8px;
-            }}
-            #heroSubtitle {{
-                color: {THEME["muted"]};
-                font-size: 13px;
-            }}
-            #statusLabel {{
-                font-size: 16px;
-                font-weight: 650;
-                color: #E5F8FF;
-                margin-top: 2px;
-            }}
-            #mainTabs::pane {{
-                border: 1px solid {THEME["border"]};
-                border-radius: 14px;
-                background: {THEME["card"]};
-                margin-top: 8px;
-            }}
-            #mainTabs QTabBar::tab {{
-                background: rgba(6, 14, 26, 145);
-                border: 1px solid {THEME["border"]};
-                border-bottom: none;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                padding: 8px 14px;
-                margin-right: 6px;
-                color: {THEME["muted"]};
-            }}
-            #mainTabs QTabBar::tab:selected {{
-                background: {THEME["card"]};
-                color: {THEME["text"]};
-            }}
-            QPushButton {{
-                background: {THEME["accent"]};
-                color: #0B2318;
-                border: none;
-                border-radius: 10px;
-                padding: 7px 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background: {THEME["accent_hover"]};
-            }}
-            QPushButton:disabled {{
-                background: rgba(140, 165, 190, 110);
-                color: rgba(11, 35, 24, 140);
-            }}
-            QLineEdit, QPlainTextEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QTableWidget {{
-                background: {THEME["input_bg"]};
-                border: 1px solid {THEME["border"]};
-                border-radius: 10px;
-                selection-background-color: rgba(50, 210, 124, 80);
-                alternate-background-color: rgba(12, 21, 34, 170);
-            }}
-            QComboBox {{
-                padding-right: 8px;
-            }}
-            QComboBox QAbstractItemView {{
-                background: rgba(7, 17, 30, 245);
-                color: {THEME["text"]};
-                border: 1px solid {THEME["border"]};
-                border-radius: 10px;
-                selection-background-color: rgba(50, 210, 124, 135);
-                selection-color: #061B12;
-                outline: 0;
-            }}
-            QComboBox QAbstractItemView::item {{
-                background: transparent;
-                color: {THEME["text"]};
-                min-height: 24px;
-                padding: 4px 8px;
-            }}
-            QComboBox QAbstractItemView::item:hover {{
-                background: rgba(50, 210, 124, 60);
-                color: {THEME["text"]};
-            }}
-            QComboBox QAbstractItemView::item:selected {{
-                background: rgba(50, 210, 124, 135);
-                color: #061B12;
-            }}
-            QHeaderView::section {{
-                background: rgba(5, 12, 24, 190);
-                color: {THEME["muted"]};
-                border: none;
-                padding: 6px;
-            }}
-            QCheckBox {{
-                spacing: 6px;
-            }}
-            """
-        )
+        self.setStyleSheet(_STYLESHEET)
 
     @staticmethod
     def _set_combo(combo: QComboBox, value: str) -> None:
@@ -559,38 +726,41 @@ class MainWindow(QMainWindow):
 
     def _refresh_prompt_combo(self, selected: str | None = None) -> None:
         current = selected or str(self.prompt_select.currentData() or "")
-        self.prompt_select.blockSignals(True); self.prompt_select.clear()
-        for p in self._prompt_presets: self.prompt_select.addItem(p["name"], p["name"])
-        if current: self._set_combo(self.prompt_select, current)
-        if self.prompt_select.currentIndex() < 0 and self.prompt_select.count() > 0: self.prompt_select.setCurrentIndex(0)
-        self.prompt_select.blockSignals(False)
+        with QSignalBlocker(self.prompt_select):
+            names = [p["name"] for p in self._prompt_presets]
+            self.prompt_select.clear(); self.prompt_select.addItems(names)
+            for i, name in enumerate(names): self.prompt_select.setItemData(i, name)
+            if current: self._set_combo(self.prompt_select, current)
+            if self.prompt_select.currentIndex() < 0 and self.prompt_select.count() > 0: self.prompt_select.setCurrentIndex(0)
 
     def _load_prompt(self) -> None:
         name = str(self.prompt_select.currentData() or "")
-        p = next((x for x in self._prompt_presets if x["name"] == name), self._prompt_presets[0])
+        p = self._prompt_index.get(name, self._prompt_presets[0])
         self.prompt_name.setText(p["name"]); self.prompt_text.setPlainText(p["prompt"])
 
     def _save_prompt(self) -> bool:
         name = self.prompt_name.text().strip(); prompt = self.prompt_text.toPlainText().strip()
         if not name or not prompt: QMessageBox.warning(self, "Prompt mangler", "Navn og prompt skal udfyldes."); return False
-        existing = next((x for x in self._prompt_presets if x["name"] == name), None)
+        existing = self._prompt_index.get(name)
         if existing: existing["prompt"] = prompt
-        else: self._prompt_presets.append({"name": name, "prompt": prompt})
+        else: self._prompt_presets.append({"name": name, "prompt": prompt}); self._prompt_index[name] = self._prompt_presets[-1]
         self._refresh_prompt_combo(name); self._ui_log(f"Prompt preset saved: {name}"); return True
 
     def _delete_prompt(self) -> None:
         selected = str(self.prompt_select.currentData() or "")
         if len(self._prompt_presets) <= 1: QMessageBox.information(self, "Kan ikke slette", "Mindst ét preset skal eksistere."); return
-        self._prompt_presets = [p for p in self._prompt_presets if p["name"] != selected]
+        removed = self._prompt_index.pop(selected, None)
+        if removed is not None: self._prompt_presets.remove(removed)
         self._refresh_prompt_combo(); self._load_prompt(); self._ui_log(f"Prompt preset deleted: {selected}")
 
     def _save_settings(self) -> None:
         if not self._save_prompt(): return
         selected = str(self.prompt_select.currentData() or self._prompt_presets[0]["name"])
-        selected_text = next((p["prompt"] for p in self._prompt_presets if p["name"] == selected), self.prompt_text.toPlainText().strip())
-        self.config.manual_model_path = self.manual_model_input.text().strip()
-        if self.config.manual_model_path:
-            manual_dir = Path(self.config.manual_model_path).expanduser()
+        preset = self._prompt_index.get(selected)
+        selected_text = preset["prompt"] if preset else self.prompt_text.toPlainText().strip()
+        manual_model_path = self.manual_model_input.text().strip()
+        if manual_model_path:
+            manual_dir = Path(manual_model_path).expanduser()
             try:
                 created = not manual_dir.exists()
                 manual_dir.mkdir(parents=True, exist_ok=True)
@@ -609,23 +779,31 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Kunne ikke gemme nøgler", f"Kunne ikke skrive .env filen.\n\n{exc}")
             self._ui_log(f"Failed to write secrets file: {exc}", level=logging.ERROR)
             return
-        self.config.hf_token = hf_token
-        self.config.llm_enabled = self.llm_enabled.isChecked()
-        self.config.llm_provider = str(self.provider.currentData())
-        self.config.llm_base_url = self.base_url.text().strip()
-        self.config.mistral_base_url = self.mistral_base.text().strip()
-        self.config.llm_api_key = llm_api_key
-        self.config.llm_model = self.model_name.text().strip()
-        self.config.mistral_model_preset = str(self.mistral_preset.currentData())
-        self.config.llm_timeout_seconds = int(self.timeout.value())
-        self.config.llm_temperature = float(self.temperature.value())
-        self.config.llm_prompt_presets = list(self._prompt_presets)
-        self.config.llm_selected_prompt_name = selected
-        self.config.llm_system_prompt = selected_text
-        self.config.wordlist_enabled = self.wordlist_enabled.isChecked()
-        self.config.wordlist_apply_replacements = self.wordlist_replace.isChecked()
-        self.config.wordlist_include_in_prompt = self.wordlist_prompt.isChecked()
-        self.config_store.save(self.config)
+        updated = replace(
+            self.config,
+            manual_model_path=manual_model_path,
+            hf_token=hf_token,
+            quantization_mode=str(self.quantization.currentData()),
+            llm_enabled=self.llm_enabled.isChecked(),
+            llm_provider=str(self.provider.currentData()),
+            llm_base_url=self.base_url.text().strip(),
+            mistral_base_url=self.mistral_base.text().strip(),
+            llm_api_key=llm_api_key,
+            llm_model=self.model_name.text().strip(),
+            mistral_model_preset=str(self.mistral_preset.currentData()),
+            llm_timeout_seconds=int(self.timeout.value()),
+            llm_temperature=float(self.temperature.value()),
+            # Copies, so later in-place preset edits still show up as a change.
+            llm_prompt_presets=[dict(p) for p in self._prompt_presets],
+            llm_selected_prompt_name=selected,
+            llm_system_prompt=selected_text,
+            wordlist_enabled=self.wordlist_enabled.isChecked(),
+            wordlist_apply_replacements=self.wordlist_replace.isChecked(),
+            wordlist_include_in_prompt=self.wordlist_prompt.isChecked(),
+        )
+        if updated != self.config:
+            self.config_store.save(updated)
+        self.config = updated
         self._ui_log("Indstillinger gemt (.env opdateret).")
         self._update_model_controls()
         self._start_model_init(allow_download=False)
@@ -633,15 +811,15 @@ class MainWindow(QMainWindow):
     def _on_provider_changed(self) -> None:
         if not all(hasattr(self, name) for name in ("base_url", "mistral_base", "mistral_preset")):
             return
-        is_mistral = str(self.provider.currentData()) == "mistral_api"
-        self.base_url.setEnabled(not is_mistral); self.mistral_base.setEnabled(is_mistral); self.mistral_preset.setEnabled(is_mistral)
+        base, mistral_base, preset = PROVIDER_FIELDS.get(str(self.provider.currentData()), PROVIDER_FIELDS["openai_compatible"])
+        self.base_url.setEnabled(base); self.mistral_base.setEnabled(mistral_base); self.mistral_preset.setEnabled(preset)
 
     def _register_hotkey(self) -> None:
         try: self.hotkey.register(); self._ui_log("Global hotkey active: hold Ctrl+Space to record.")
         except Exception as exc: self._ui_log(f"Global hotkey registration failed: {exc}", level=logging.ERROR)
 
     def _make_model_manager(self, config: AppConfig) -> ModelManager:
-        return ModelManager(repo_id=config.model_repo_id, cache_dir=Path(config.model_cache_dir), manual_model_path=config.manual_model_path.strip() or None, hf_token=self._resolve_hf_token(config), log_callback=self._ui_log)
+        return ModelManager(repo_id=config.model_repo_id, cache_dir=Path(config.model_cache_dir), manual_model_path=config.manual_model_path.strip() or None, hf_token=self._resolve_hf_token(config), log_callback=self._ui_log, quantization=config.quantization_mode)
 
     def _resolve_hf_token(self, config: AppConfig) -> str | None:
         token = (
@@ -705,6 +883,7 @@ class MainWindow(QMainWindow):
         self.model_manager = self._make_model_manager(self.config)
         mode = "download" if allow_download else "local-only"
         self._ui_log(f"Model init started ({mode}).")
+        cancel = self._model_init_cancel = threading.Event()
         def worker() -> None:
             try:
                 if allow_download:
@@ -713,9 +892,11 @@ class MainWindow(QMainWindow):
                 else:
                     self._ui_log("Model init worker: resolving existing local model only.")
                     model_path = self.model_manager.resolve_existing_model_path()
+                if cancel.is_set(): return
                 self._ui_log(f"Model init worker: loading transcriber from {model_path}")
-                t = Transcriber(model_path=model_path, device="cuda"); t.load()
-                with self._state_lock: self.transcriber = t
+                t = Transcriber(model_path=model_path, device="cuda"); t.load(); self.post_processor.prepare(self.config)
+                if cancel.is_set(): return
+                self.transcriber = t
                 self.bridge.status_changed.emit("Status: Ready"); self.bridge.ready_changed.emit(True); self._ui_log(f"Model loaded: {model_path}")
             except FileNotFoundError as exc:
                 self.bridge.status_changed.emit("Status: Waiting for model download"); self.bridge.ready_changed.emit(False); self._ui_log(str(exc))
@@ -732,7 +913,7 @@ class MainWindow(QMainWindow):
     def _open_wordlist_editor(self) -> None:
         dialog = WordlistEditorDialog(self.wordlist_store.load(), self)
         if dialog.exec() != QDialog.DialogCode.Accepted: return
-        data = dialog.to_wordlist_data(); self.wordlist_store.save(data); self._ui_log(f"Wordlist saved. rules={len(data.replacements)} terms={len(data.preferred_terms)}")
+        data = dialog.to_wordlist_data(); self.wordlist_store.save(data); self.post_processor.prepare(self.config); self._ui_log(f"Wordlist saved. rules={len(data.replacements)} terms={len(data.preferred_terms)}")
 
     def _browse_model_path(self) -> None:
         folder = QFileDialog.getExistingDirectory(self, "Select Model Folder", str(Path.home()))
@@ -744,8 +925,16 @@ class MainWindow(QMainWindow):
             self._listening = True
         try: self.audio_capture.start(); self.bridge.status_changed.emit("Status: Listening..."); self.bridge.listening_overlay_state_changed.emit("listening")
         except Exception as exc:
-            with self._state_lock: self._listening = False
+            self._listening = False
             self.bridge.status_changed.emit("Status: Audio error"); self.bridge.listening_overlay_state_changed.emit("hidden"); self._ui_log(f"Audio start failed: {exc}", level=logging.ERROR)
+            return
+        # Get post-processing ready while recording; skipped while a previous
+        # warm-up (e.g. a slow LLM connect) is still running.
+        if self._warmup_thread is None or not self._warmup_thread.is_alive(): self._warmup_thread = threading.Thread(target=self._warm_up, args=(self.config,), name="sludre-warmup", daemon=True); self._warmup_thread.start()
+
+    def _warm_up(self, config: AppConfig) -> None:
+        try: self.post_processor.warm_up(config)
+        except Exception as exc: self._ui_log(f"Post-processing warm-up failed: {exc}", level=logging.WARNING)
 
     def _on_listen_stop(self) -> None:
         with self._state_lock:
@@ -764,13 +953,16 @@ class MainWindow(QMainWindow):
         self.bridge.listening_overlay_state_changed.emit("transcribing")
         def worker() -> None:
             try:
-                with self._state_lock: t = self.transcriber
+                t = self.transcriber
                 stt = t.transcribe(audio=audio, sample_rate=self.config.sample_rate, language=self.config.language)
                 post = self.post_processor.process(raw_text=stt.text, config=self.config)
                 self.bridge.postprocess_ready.emit({"post_result": post})
             except Exception as exc:
                 self.bridge.postprocess_failed.emit(str(exc))
-        self._processing_thread = threading.Thread(target=worker, daemon=True); self._processing_thread.start()
+        self._stt_jobs.put(worker)
+
+    def _run_stt_jobs(self) -> None:
+        while (job := self._stt_jobs.get()) is not None: job()
 
     def _on_postprocess_ready(self, payload: object) -> None:
         post = payload.get("post_result") if isinstance(payload, dict) else None
@@ -782,24 +974,31 @@ class MainWindow(QMainWindow):
         self.text_inserter.insert_text_at_cursor(out); self.bridge.status_changed.emit("Status: Inserted"); self._append_output(post.raw_text, out, post.llm_used, True); self._finish_cycle()
 
     def _append_output(self, raw_text: str, final_text: str, llm_used: bool, inserted: bool) -> None:
-        row = self.output_table.rowCount(); self.output_table.insertRow(row)
-        self.output_table.setItem(row, 0, QTableWidgetItem(time.strftime("%H:%M:%S")))
-        self.output_table.setItem(row, 1, QTableWidgetItem(raw_text))
-        self.output_table.setItem(row, 2, QTableWidgetItem(final_text))
-        btn = QPushButton("Kopier"); btn.clicked.connect(lambda _, txt=final_text: QApplication.clipboard().setText(txt))
-        self.output_table.setCellWidget(row, 3, btn)
-        self.output_table.scrollToBottom()
+        copy_item = QTableWidgetItem(); copy_item.setFlags(Qt.ItemFlag.ItemIsEnabled); copy_item.setData(Qt.ItemDataRole.UserRole, final_text)
+        items = (QTableWidgetItem(self._clock_text()), QTableWidgetItem(raw_text), QTableWidgetItem(final_text), copy_item)
+        table = self.output_table
+        table.setUpdatesEnabled(False)
+        try:
+            row = table.rowCount(); table.insertRow(row)
+            for col, item in enumerate(items): table.setItem(row, col, item)
+        finally:
+            table.setUpdatesEnabled(True)
+        table.scrollToBottom()
 
     def _ask_raw(self, err: str) -> bool:
-        dlg = QMessageBox(self); dlg.setIcon(QMessageBox.Icon.Warning); dlg.setWindowTitle("LLM Cleanup Failed"); dlg.setText("LLM cleanup failed. Insert raw transcription?"); dlg.setInformativeText(err[:300] + ("..." if len(err) > 300 else ""))
-        yes = dlg.addButton("Insert raw transcription", QMessageBox.ButtonRole.AcceptRole); dlg.addButton("Cancel insertion", QMessageBox.ButtonRole.RejectRole); dlg.exec()
+        if self._raw_dialog is None:
+            dlg = QMessageBox(self); dlg.setIcon(QMessageBox.Icon.Warning); dlg.setWindowTitle("LLM Cleanup Failed"); dlg.setText("LLM cleanup failed. Insert raw transcription?")
+            yes = dlg.addButton("Insert raw transcription", QMessageBox.ButtonRole.AcceptRole); dlg.addButton("Cancel insertion", QMessageBox.ButtonRole.RejectRole)
+            self._raw_dialog = (dlg, yes)
+        dlg, yes = self._raw_dialog
+        dlg.setInformativeText(err[:300] + ("..." if len(err) > 300 else "")); dlg.exec()
         return dlg.clickedButton() is yes
 
     def _on_postprocess_failed(self, error_message: str) -> None:
         self.bridge.status_changed.emit("Status: Transcription error"); self._ui_log(f"Transcription failed: {error_message}", level=logging.ERROR); self._finish_cycle()
 
     def _finish_cycle(self) -> None:
-        with self._state_lock: self._transcribing = False
+        self._transcribing = False
         self.bridge.listening_overlay_state_changed.emit("hidden")
         if self._ready: self.bridge.status_changed.emit("Status: Ready")
 
@@ -835,8 +1034,28 @@ class MainWindow(QMainWindow):
         self._position_listening_overlay()
         self.listening_overlay.show()
 
-    def _append_log(self, text: str) -> None:
-        self.log_output.append(f"[{time.strftime('%H:%M:%S')}] {text}")
+    def _schedule_log_flush(self) -> None:
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _clock_text(self) -> str:
+        # strftime only runs when the minute changes; seconds are appended.
+        # Called from worker threads too; the (minute, prefix) pair is swapped
+        # as one tuple so readers never see a mismatched half.
+        now = time.time()
+        minute = int(now // 60)
+        clock = self._clock
+        if minute != clock[0]:
+            clock = self._clock = (minute, time.strftime("%H:%M:", time.localtime(now)))
+        return f"{clock[1]}{int(now) % 60:02d}"
+
+    def _flush_log(self) -> None:
+        with self._log_lock:
+            batch = "\n".join(self._pending_log)
+            self._pending_log.clear()
+            self._log_signal_pending = False
+        if batch:
+            self.log_output.appendPlainText(batch)
 
     def _toggle_log_visibility(self) -> None:
         self._log_visible = not self._log_visible
@@ -844,13 +1063,23 @@ class MainWindow(QMainWindow):
         self.toggle_log_btn.setText("Skjul log" if self._log_visible else "Vis log")
 
     def _ui_log(self, text: str, level: int = logging.INFO) -> None:
-        self.logger.log(level, text); self.bridge.log_message.emit(text)
+        self.logger.log(level, text)
+        # Only the first line of a burst crosses threads; the rest ride along
+        # with the same flush.
+        line = f"[{self._clock_text()}] {text}"
+        with self._log_lock:
+            self._pending_log.append(line)
+            notify = not self._log_signal_pending
+            self._log_signal_pending = True
+        if notify: self.bridge.log_pending.emit()
 
     def _set_ready_state(self, ready: bool) -> None:
-        with self._state_lock: self._ready = ready
+        self._ready = ready
         self._update_model_controls()
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
+        self._model_init_cancel.set()
+        self._stt_jobs.put(None)
         self.hotkey.unregister()
         if self.audio_capture.is_recording(): self.audio_capture.stop()
         self.listening_overlay.hide()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import json
+import os
+import tempfile
 import unittest
 from pathlib import Path
 import shutil
-import uuid
 from unittest.mock import patch
 
 from src.core.config import (
+    CONFIG_VERSION,
     AppConfig,
     ConfigStore,
     _default_model_cache_dir,
@@ -15,96 +18,211 @@ from src.core.config import (
 )
 
 
+TMP_ROOT = Path(tempfile.gettempdir()) / "sludre-tests"
+
+
 class ConfigStoreTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = TMP_ROOT / f"config_{os.getpid()}"
+        cls._tmp.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._tmp, ignore_errors=True)
+
     def test_load_creates_defaults_when_file_missing(self) -> None:
-        tmp = Path(".test_tmp") / f"config_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            config_path = tmp / "config.json"
-            store = ConfigStore(config_path)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        store = ConfigStore(config_path)
 
-            cfg = store.load()
+        cfg = store.load()
 
-            self.assertEqual(cfg.hotkey, "ctrl+space")
-            self.assertEqual(cfg.model_cache_dir, str(_default_model_cache_dir()))
-            self.assertGreaterEqual(len(cfg.llm_prompt_presets), 1)
-            self.assertTrue(config_path.exists())
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        self.assertEqual(cfg.hotkey, "ctrl+space")
+        self.assertEqual(cfg.model_cache_dir, str(_default_model_cache_dir()))
+        self.assertGreaterEqual(len(cfg.llm_prompt_presets), 1)
+        self.assertTrue(config_path.exists())
 
     def test_save_and_reload_round_trip(self) -> None:
-        tmp = Path(".test_tmp") / f"config_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            config_path = tmp / "config.json"
-            store = ConfigStore(config_path)
-            cfg = AppConfig.defaults()
-            cfg.language = "da"
-            cfg.manual_model_path = r"C:\models\hviske-v2"
-            cfg.hf_token = "secret-token"
-            cfg.llm_api_key = "llm-secret"
-            cfg.llm_prompt_presets = [
-                {"name": "Standard", "prompt": "default"},
-                {"name": "Formel", "prompt": "rewrite formally"},
-            ]
-            cfg.llm_selected_prompt_name = "Formel"
-            store.save(cfg)
-
-            loaded = store.load()
-            raw = config_path.read_text(encoding="utf-8")
-
-            self.assertEqual(loaded.language, "da")
-            self.assertEqual(loaded.manual_model_path, r"C:\models\hviske-v2")
-            self.assertEqual(loaded.hf_token, "")
-            self.assertEqual(loaded.llm_api_key, "")
-            self.assertEqual(loaded.llm_selected_prompt_name, "Formel")
-            self.assertEqual(loaded.llm_system_prompt, "rewrite formally")
-            self.assertEqual(len(loaded.llm_prompt_presets), 2)
-            self.assertNotIn("secret-token", raw)
-            self.assertNotIn("llm-secret", raw)
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        store = ConfigStore(config_path)
+        cfg = AppConfig.defaults()
+        cfg.language = "da"
+        cfg.manual_model_path = r"C:\models\hviske-v2"
+        cfg.hf_token = "secret-token"
+        cfg.llm_api_key = "llm-secret"
+        cfg.llm_prompt_presets = [
+            {"name": "Standard", "prompt": "default"},
+            {"name": "Formel", "prompt": "rewrite formally"},
+        ]
+        cfg.llm_selected_prompt_name = "Formel"
+        store.save(cfg)
+
+        loaded = store.load()
+        raw = config_path.read_text(encoding="utf-8")
+
+        self.assertEqual(loaded.language, "da")
+        self.assertEqual(loaded.manual_model_path, r"C:\models\hviske-v2")
+        self.assertEqual(loaded.hf_token, "")
+        self.assertEqual(loaded.llm_api_key, "")
+        self.assertEqual(loaded.llm_selected_prompt_name, "Formel")
+        self.assertEqual(loaded.llm_system_prompt, "rewrite formally")
+        self.assertEqual(len(loaded.llm_prompt_presets), 2)
+        self.assertNotIn("secret-token", raw)
+        self.assertNotIn("llm-secret", raw)
+
+    def test_load_returns_fresh_copy_and_picks_up_file_changes(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        store = ConfigStore(config_path)
+        first = store.load()
+        first.language = "en"
+
+        second = store.load()
+
+        self.assertEqual(second.language, "da")
+        self.assertIsNot(first, second)
+
+        cfg = AppConfig.defaults()
+        cfg.language = "sv-SE"
+        ConfigStore(config_path).save(cfg)
+
+        self.assertEqual(store.load().language, "sv-SE")
+
+    def test_load_after_save_sees_same_size_change_within_mtime_granularity(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        store = ConfigStore(config_path)
+        cfg = store.load()
+        stat = config_path.stat()
+        cfg.language = "en"
+        store.save(cfg)
+        # Pad the value so the rewrite matches the cached file's size.
+        cfg.language = "e" * (2 + stat.st_size - config_path.stat().st_size)
+
+        store.save(cfg)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(config_path.stat().st_size, stat.st_size)
+        self.assertEqual(store.load().language, cfg.language)
+
+    def test_load_stamps_sanitized_file_and_skips_rewrite_afterwards(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        config_path.write_text('{"language": "da"}', encoding="utf-8")
+
+        ConfigStore(config_path).load()
+        raw = json.loads(config_path.read_text(encoding="utf-8"))
+        written = config_path.stat().st_mtime_ns
+        loaded = ConfigStore(config_path).load()
+
+        self.assertEqual(raw["_version"], CONFIG_VERSION)
+        self.assertEqual(config_path.stat().st_mtime_ns, written)
+        self.assertEqual(loaded.model_cache_dir, str(_default_model_cache_dir()))
+
+    def test_fresh_loads_after_save_do_not_rewrite_file(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        cfg = ConfigStore(config_path).load()
+        cfg.language = "en"
+        ConfigStore(config_path).save(cfg)
+
+        with patch("src.core.config.json_io.write_atomic") as write_atomic:
+            ConfigStore(config_path).load()
+            ConfigStore(config_path).load()
+
+        write_atomic.assert_not_called()
+
+    def test_load_repairs_hand_edited_stamped_file(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "_version": CONFIG_VERSION,
+                    "quantization_mode": "int4",
+                    "llm_timeout_seconds": 600,
+                    "llm_prompt_presets": [{"name": "A", "prompt": "a"}, "broken"],
+                    "llm_selected_prompt_name": "Missing",
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        loaded = ConfigStore(config_path).load()
+        raw = json.loads(config_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(loaded.quantization_mode, "auto")
+        self.assertEqual(loaded.llm_timeout_seconds, 5)
+        self.assertEqual(loaded.llm_prompt_presets, [{"name": "A", "prompt": "a"}])
+        self.assertEqual(loaded.llm_selected_prompt_name, "A")
+        self.assertEqual(loaded.llm_system_prompt, "a")
+        self.assertEqual(raw["llm_timeout_seconds"], 5)
+        self.assertEqual(raw["quantization_mode"], "auto")
+        self.assertEqual(raw["llm_selected_prompt_name"], "A")
+
+    def test_load_resets_unknown_quantization_mode(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        config_path.write_text('{"quantization_mode": "int4"}', encoding="utf-8")
+        self.assertEqual(ConfigStore(config_path).load().quantization_mode, "auto")
+
+        config_path.write_text('{"quantization_mode": "int8"}', encoding="utf-8")
+        self.assertEqual(ConfigStore(config_path).load().quantization_mode, "int8")
+
+    def test_load_resets_unknown_insert_mode(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        config_path.write_text('{"insert_mode": "teleport"}', encoding="utf-8")
+        self.assertEqual(ConfigStore(config_path).load().insert_mode, "clipboard_paste")
+
+        config_path.write_text('{"insert_mode": "type_short"}', encoding="utf-8")
+        self.assertEqual(ConfigStore(config_path).load().insert_mode, "type_short")
 
     def test_migrates_legacy_model_cache_path(self) -> None:
-        tmp = Path(".test_tmp") / f"config_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            config_path = tmp / "config.json"
-            store = ConfigStore(config_path)
-            cfg = AppConfig.defaults()
-            cfg.model_cache_dir = str(_legacy_default_model_cache_dir())
-            store.save(cfg)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        config_path = tmp / "config.json"
+        store = ConfigStore(config_path)
+        cfg = AppConfig.defaults()
+        cfg.model_cache_dir = str(_legacy_default_model_cache_dir())
+        store.save(cfg)
 
-            loaded = store.load()
+        loaded = store.load()
 
-            self.assertEqual(loaded.model_cache_dir, str(_default_model_cache_dir()))
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        self.assertEqual(loaded.model_cache_dir, str(_default_model_cache_dir()))
 
     def test_default_store_migrates_legacy_config_to_runtime_root(self) -> None:
-        tmp = Path(".test_tmp") / f"config_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            runtime_config = tmp / "config.json"
-            legacy_config = tmp / "legacy" / "config.json"
-            legacy_config.parent.mkdir(parents=True, exist_ok=True)
-            legacy_config.write_text(
-                '{"language":"da","model_cache_dir":"","wordlist_path":""}',
-                encoding="utf-8",
-            )
-
-            with patch("src.core.config.config_path_default", return_value=runtime_config):
-                with patch("src.core.config._legacy_default_config_path", return_value=legacy_config):
-                    store = ConfigStore.default()
-                    loaded = store.load()
-
-            self.assertEqual(store.path, runtime_config)
-            self.assertTrue(runtime_config.exists())
-            self.assertEqual(loaded.language, "da")
-            self.assertEqual(loaded.model_cache_dir, str(_default_model_cache_dir()))
-            self.assertEqual(loaded.wordlist_path, str(_default_wordlist_path()))
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        runtime_config = tmp / "config.json"
+        legacy_config = tmp / "legacy" / "config.json"
+        legacy_config.parent.mkdir(parents=True, exist_ok=True)
+        legacy_config.write_text(
+            '{"language":"da","model_cache_dir":"","wordlist_path":""}',
+            encoding="utf-8",
+        )
+
+        with patch("src.core.config.config_path_default", return_value=runtime_config):
+            with patch("src.core.config._legacy_default_config_path", return_value=legacy_config):
+                store = ConfigStore.default()
+                loaded = store.load()
+
+        self.assertEqual(store.path, runtime_config)
+        self.assertTrue(runtime_config.exists())
+        self.assertEqual(loaded.language, "da")
+        self.assertEqual(loaded.model_cache_dir, str(_default_model_cache_dir()))
+        self.assertEqual(loaded.wordlist_path, str(_default_wordlist_path()))
 
 
 if __name__ == "__main__":
@@ -1,42 +1,92 @@
 from __future__ import annotations
 
+import os
 import shutil
+import tempfile
 import unittest
-import uuid
 from pathlib import Path
+from unittest.mock import patch
 
 from src.core.env_secrets import EnvSecretsStore
 
 
+TMP_ROOT = Path(tempfile.gettempdir()) / "sludre-tests"
+
+
 class EnvSecretsStoreTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = TMP_ROOT / f"env_{os.getpid()}"
+        cls._tmp.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._tmp, ignore_errors=True)
+
     def test_ensure_exists_creates_env_file(self) -> None:
-        tmp = Path(".test_tmp") / f"env_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            path = tmp / ".env"
-            store = EnvSecretsStore(path)
-            store.ensure_exists()
-            self.assertTrue(path.exists())
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / ".env"
+        store = EnvSecretsStore(path)
+        store.ensure_exists()
+        self.assertTrue(path.exists())
 
     def test_set_get_and_remove_secret(self) -> None:
-        tmp = Path(".test_tmp") / f"env_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            path = tmp / ".env"
-            store = EnvSecretsStore(path)
-            store.set_secret("LLM_API_KEY", "abc 123")
-            store.set_secret("HF_TOKEN", "hf_testtoken")
-            self.assertEqual(store.get_secret("LLM_API_KEY"), "abc 123")
-            self.assertEqual(store.get_secret("HF_TOKEN"), "hf_testtoken")
-
-            store.set_secret("HF_TOKEN", "")
-            self.assertEqual(store.get_secret("HF_TOKEN"), "")
-            self.assertIn("LLM_API_KEY", path.read_text(encoding="utf-8"))
-            self.assertNotIn("HF_TOKEN", path.read_text(encoding="utf-8"))
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / ".env"
+        store = EnvSecretsStore(path)
+        store.set_secret("LLM_API_KEY", "abc 123")
+        store.set_secret("HF_TOKEN", "hf_testtoken")
+        self.assertEqual(store.get_secret("LLM_API_KEY"), "abc 123")
+        self.assertEqual(store.get_secret("HF_TOKEN"), "hf_testtoken")
+
+        store.set_secret("HF_TOKEN", "")
+        self.assertEqual(store.get_secret("HF_TOKEN"), "")
+        self.assertIn("LLM_API_KEY", path.read_text(encoding="utf-8"))
+        self.assertNotIn("HF_TOKEN", path.read_text(encoding="utf-8"))
+
+    def test_get_after_same_size_update_within_mtime_granularity(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / ".env"
+        store = EnvSecretsStore(path)
+        store.set_secret("HF_TOKEN", "hf_old")
+        self.assertEqual(store.get_secret("HF_TOKEN"), "hf_old")
+        stat = path.stat()
+
+        store.set_secret("HF_TOKEN", "hf_new")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(path.stat().st_size, stat.st_size)
+        self.assertEqual(store.get_secret("HF_TOKEN"), "hf_new")
+
+    def test_set_new_secret_appends_after_unterminated_line(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / ".env"
+        path.write_text("# comment\nHF_TOKEN = 'hf abc'", encoding="utf-8")
+        store = EnvSecretsStore(path)
+
+        store.set_secret("LLM_API_KEY", "key")
+
+        self.assertEqual(store.get_secret("HF_TOKEN"), "hf abc")
+        self.assertEqual(store.get_secret("LLM_API_KEY"), "key")
+        self.assertTrue(path.read_text(encoding="utf-8").startswith("# comment\n"))
+
+    def test_get_secret_reuses_parsed_file_until_it_changes(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / ".env"
+        path.write_text("HF_TOKEN=first\n", encoding="utf-8")
+        store = EnvSecretsStore(path)
+        self.assertEqual(store.get_secret("HF_TOKEN"), "first")
+
+        with patch.object(EnvSecretsStore, "_decode_value", side_effect=AssertionError("re-parsed")):
+            self.assertEqual(store.get_secret("HF_TOKEN"), "first")
+
+        path.write_text("HF_TOKEN=second-token\n", encoding="utf-8")
+        self.assertEqual(store.get_secret("HF_TOKEN"), "second-token")
 
 
 if __name__ == "__main__":
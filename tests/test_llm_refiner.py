@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import unittest
-from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+from urllib.error import HTTPError
 
+from src.core import llm_refiner
 from src.core.config import AppConfig
 from src.core.llm_refiner import LlmRefineError, LlmRefiner
 
@@ -18,6 +22,93 @@ class _FakeResponse:
         return json.dumps(self._payload).encode("utf-8")
 
 
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.server.client_ports.append(self.client_address[1])
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._reply(200, b"moved")
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/error":
+            self._reply(500, b"boom")
+        elif self.path == "/redirect":
+            self._reply(302, b"", {"Location": "/moved"})
+        else:
+            self._reply(200, b"ok")
+        if self.path == "/drop":
+            # Close without announcing it, like a server dropping an idle
+            # keep-alive socket.
+            self.close_connection = True
+
+
+class LocalPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.client_ports = []
+        thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        for patcher in (
+            patch.dict(llm_refiner._CONNECTIONS, clear=True),
+            patch("src.core.llm_refiner.urllib.request.getproxies", return_value={}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self._close_pool)
+
+    @staticmethod
+    def _close_pool() -> None:
+        for connection in llm_refiner._CONNECTIONS.values():
+            connection.close()
+
+    def _post(self, path: str):
+        host, port = self.server.server_address
+        request = llm_refiner._request(f"http://{host}:{port}{path}", b"{}", {})
+        return llm_refiner._urlopen(request, timeout=5)
+
+    def test_reuses_pooled_connection(self) -> None:
+        self.assertEqual(self._post("/ok").read(), b"ok")
+        self.assertEqual(self._post("/ok").read(), b"ok")
+
+        self.assertEqual(len(self.server.client_ports), 2)
+        self.assertEqual(len(set(self.server.client_ports)), 1)
+
+    def test_retries_once_when_server_closed_pooled_socket(self) -> None:
+        self.assertEqual(self._post("/drop").read(), b"ok")
+        self.assertEqual(self._post("/ok").read(), b"ok")
+
+        self.assertEqual(len(set(self.server.client_ports)), 2)
+
+    def test_error_status_raises_http_error(self) -> None:
+        with self.assertRaises(HTTPError) as ctx:
+            self._post("/error")
+
+        self.assertEqual(ctx.exception.code, 500)
+        self.assertEqual(self._post("/ok").read(), b"ok")
+
+    def test_follows_redirects_like_urllib(self) -> None:
+        response = self._post("/redirect")
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.read(), b"moved")
+
+
 class LlmRefinerTests(unittest.TestCase):
     @patch("src.core.llm_refiner._urlopen")
     def test_openai_compatible_request(self, urlopen_mock) -> None:
@@ -86,6 +177,34 @@ class LlmRefinerTests(unittest.TestCase):
                 with self.assertRaises(LlmRefineError):
                     refiner.refine("hej", cfg, preferred_terms=[])
 
+    def test_preconnect_pools_connection_for_endpoint_host(self) -> None:
+        cfg = AppConfig.defaults()
+        cfg.llm_provider = "openai_compatible"
+        cfg.llm_base_url = "https://example.com/v1"
+        connection = Mock()
+        refiner = LlmRefiner()
+
+        with patch.dict(llm_refiner._CONNECTIONS, clear=True):
+            with patch("src.core.llm_refiner.urllib.request.getproxies", return_value={}):
+                with patch("src.core.llm_refiner._open_connection", return_value=connection) as open_mock:
+                    refiner.preconnect(cfg)
+                    refiner.preconnect(cfg)
+
+                    self.assertIs(llm_refiner._CONNECTIONS[("https", "example.com")], connection)
+
+        open_mock.assert_called_once_with("https", "example.com", cfg.llm_timeout_seconds)
+        connection.connect.assert_called_once_with()
+
+    def test_preconnect_ignores_missing_endpoint(self) -> None:
+        cfg = AppConfig.defaults()
+        cfg.llm_provider = "openai_compatible"
+        cfg.llm_base_url = ""
+
+        with patch("src.core.llm_refiner._open_connection") as open_mock:
+            LlmRefiner().preconnect(cfg)
+
+        open_mock.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
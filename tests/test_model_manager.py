@@ -1,339 +1,842 @@
 from __future__ import annotations
 
+import json
+import os
 import shutil
+import sys
+import tempfile
 import unittest
-import uuid
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
 
-from src.core.model_manager import INFERENCE_ALLOW_PATTERNS, ModelManager
+from src.core.model_manager import (
+    CONVERSION_MARKER,
+    INFERENCE_ALLOW_PATTERNS,
+    ModelManager,
+    _available_cli_bases,
+    _candidate_cli_bases,
+    _cli_base_available,
+)
 
 
-class ModelManagerTests(unittest.TestCase):
-    def test_uses_manual_model_path_when_present(self) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            manual = tmp / "manual"
-            manual.mkdir()
-            (manual / "model.bin").write_bytes(b"ok")
-            manager = ModelManager(
-                repo_id="syvai/hviske-v2",
-                cache_dir=tmp / "cache",
-                manual_model_path=str(manual),
-            )
-
-            resolved = manager.ensure_model_available()
+TMP_ROOT = Path(tempfile.gettempdir()) / "sludre-tests"
 
-            self.assertEqual(resolved, manual)
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
-
-    @patch("src.core.model_manager._subprocess_run")
-    @patch("src.core.model_manager._snapshot_download")
-    def test_downloads_to_manual_path_when_manual_folder_is_empty(
-        self, snapshot_mock, subprocess_run_mock
-    ) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            manual = tmp / "manual"
-            manual.mkdir(parents=True, exist_ok=True)
-
-            def _mock_cli_download(command, check, text, capture_output, env):
-                del check, text, capture_output, env
-                local_dir_index = command.index("--local-dir")
-                target = Path(command[local_dir_index + 1])
-                (target / "config.json").write_text("{}", encoding="utf-8")
-                (target / "model.safetensors.index.json").write_text(
-                    "{}", encoding="utf-8"
-                )
-                (target / "model.bin").write_bytes(b"ok")
-                return Mock(returncode=0, stdout="", stderr="")
 
-            subprocess_run_mock.side_effect = _mock_cli_download
-            manager = ModelManager(
-                repo_id="syvai/hviske-v2",
-                cache_dir=tmp / "cache",
-                manual_model_path=str(manual),
-                hf_token="test-token",
-            )
+class _FakeProcess:
+    def __init__(self, stdout, returncode: int, output: str = "") -> None:
+        stdout.write(output.encode("utf-8"))
+        stdout.flush()
+        self.returncode = returncode
 
-            resolved = manager.ensure_model_available()
+    def wait(self, timeout: float | None = None) -> int:
+        del timeout
+        return self.returncode
 
-            self.assertEqual(resolved, manual)
-            snapshot_mock.assert_not_called()
-            subprocess_run_mock.assert_called_once()
-            command = subprocess_run_mock.call_args[0][0]
-            self.assertIn("--local-dir", command)
-            self.assertIn(str(manual), command)
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
-
-    @patch("src.core.model_manager._subprocess_run")
-    @patch("src.core.model_manager._snapshot_download")
-    def test_reuses_cached_model_without_downloading(
-        self, snapshot_mock, subprocess_run_mock
-    ) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            cache_dir = tmp / "cache"
-            target = cache_dir / "syvai--hviske-v2"
-            target.mkdir(parents=True, exist_ok=True)
-            (target / "config.json").write_text("{}", encoding="utf-8")
-            (target / "model.safetensors.index.json").write_text(
-                "{}", encoding="utf-8"
-            )
-            (target / "model.bin").write_bytes(b"ok")
-            manager = ModelManager(
-                repo_id="syvai/hviske-v2",
-                cache_dir=cache_dir,
-                manual_model_path=None,
-                hf_token="test-token",
-            )
+    def poll(self) -> int:
+        return self.returncode
 
-            resolved = manager.ensure_model_available()
+    def kill(self) -> None:
+        pass
 
-            self.assertEqual(resolved, target)
-            snapshot_mock.assert_not_called()
-            subprocess_run_mock.assert_not_called()
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
 
-    @patch("src.core.model_manager._subprocess_run")
-    @patch("src.core.model_manager._snapshot_download")
-    def test_downloads_model_with_cli_when_missing_locally(
-        self, snapshot_mock, subprocess_run_mock
-    ) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            cache_dir = tmp / "cache"
-
-            def _mock_cli_download(command, check, text, capture_output, env):
-                del check, text, capture_output, env
-                local_dir_index = command.index("--local-dir")
-                target = Path(command[local_dir_index + 1])
-                target.mkdir(parents=True, exist_ok=True)
-                (target / "config.json").write_text("{}", encoding="utf-8")
-                (target / "model.safetensors.index.json").write_text(
-                    "{}", encoding="utf-8"
-                )
-                (target / "model.bin").write_bytes(b"ok")
-                return Mock(returncode=0, stdout="", stderr="")
+def _seed_model_dir(target: Path) -> Path:
+    target.mkdir(parents=True, exist_ok=True)
+    (target / "config.json").write_text("{}", encoding="utf-8")
+    (target / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
+    (target / "model.bin").write_bytes(b"ok")
+    return target
 
-            subprocess_run_mock.side_effect = _mock_cli_download
-            manager = ModelManager(
-                repo_id="syvai/hviske-v2",
-                cache_dir=cache_dir,
-                manual_model_path=None,
-                hf_token="test-token",
-            )
 
-            resolved = manager.ensure_model_available()
+class ModelManagerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = TMP_ROOT / f"model_{os.getpid()}"
+        cls._tmp.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._tmp, ignore_errors=True)
+
+    def setUp(self) -> None:
+        ModelManager._resolved_cli_base = None
+        ModelManager._ready_model_dirs.clear()
+        _available_cli_bases.cache_clear()
+        cli_patcher = patch(
+            "src.core.model_manager._cli_base_available", return_value=True
+        )
+        cli_patcher.start()
+        self.addCleanup(cli_patcher.stop)
+        self.addCleanup(_available_cli_bases.cache_clear)
+        download_patcher = patch.multiple(
+            "src.core.model_manager",
+            _subprocess_popen=DEFAULT,
+            _snapshot_download=DEFAULT,
+        )
+        mocks = download_patcher.start()
+        self.addCleanup(download_patcher.stop)
+        self.popen_mock = mocks["_subprocess_popen"]
+        self.snapshot_mock = mocks["_snapshot_download"]
+        # Anything that slips past the mocks must fail fast instead of
+        # reaching the Hugging Face API.
+        offline_patcher = patch.dict(os.environ, {"HF_HUB_OFFLINE": "1"})
+        offline_patcher.start()
+        self.addCleanup(offline_patcher.stop)
 
-            target = cache_dir / "syvai--hviske-v2"
-            self.assertEqual(resolved, target)
-            snapshot_mock.assert_not_called()
-            subprocess_run_mock.assert_called_once()
-            command = subprocess_run_mock.call_args[0][0]
-            self.assertGreaterEqual(len(command), 2)
-            self.assertEqual(command[1], "download")
-            self.assertIn("download", command)
-            self.assertIn("syvai/hviske-v2", command)
-            self.assertIn("--local-dir", command)
-            self.assertIn(str(cache_dir / "syvai--hviske-v2"), command)
-            self.assertIn("--token", command)
-            self.assertIn("test-token", command)
-            self.assertIn("--include", command)
-            include_index = command.index("--include")
+    def test_uses_manual_model_path_when_present(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manual = tmp / "manual"
+        manual.mkdir()
+        (manual / "model.bin").write_bytes(b"ok")
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=str(manual),
+        )
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, manual)
+
+    def test_downloads_to_manual_path_when_manual_folder_is_empty(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manual = tmp / "manual"
+        manual.mkdir(parents=True, exist_ok=True)
+
+        def _mock_snapshot_download(**kwargs):
+            target = Path(kwargs["local_dir"])
+            _seed_model_dir(target)
+            return str(target)
+
+        self.snapshot_mock.side_effect = _mock_snapshot_download
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=str(manual),
+            hf_token="test-token",
+        )
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, manual)
+        self.popen_mock.assert_not_called()
+        self.snapshot_mock.assert_called_once()
+        _, kwargs = self.snapshot_mock.call_args
+        self.assertEqual(kwargs["local_dir"], str(manual))
+
+    def test_reuses_cached_model_without_downloading(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        cache_dir = tmp / "cache"
+        target = _seed_model_dir(cache_dir / "syvai--hviske-v2")
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=cache_dir,
+            manual_model_path=None,
+            hf_token="test-token",
+        )
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, target)
+        self.snapshot_mock.assert_not_called()
+        self.popen_mock.assert_not_called()
+
+    def test_reuses_resolved_model_dir_until_directory_changes(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        target = tmp / "syvai--hviske-v2"
+        target.mkdir(parents=True, exist_ok=True)
+        (target / "model.bin").write_bytes(b"ok")
+        manager = ModelManager(repo_id="syvai/hviske-v2", cache_dir=tmp)
+        self.assertEqual(manager.resolve_existing_model_path(), target)
+
+        with patch.object(
+            ModelManager, "_scan_model_files", side_effect=AssertionError
+        ):
             self.assertEqual(
-                command[include_index + 1 : include_index + 1 + len(INFERENCE_ALLOW_PATTERNS)],
-                INFERENCE_ALLOW_PATTERNS,
+                ModelManager(
+                    repo_id="syvai/hviske-v2", cache_dir=tmp
+                ).resolve_existing_model_path(),
+                target,
             )
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
 
-    @patch("src.core.model_manager._subprocess_run")
-    @patch("src.core.model_manager._snapshot_download")
-    def test_falls_back_to_sdk_when_cli_fails(
-        self, snapshot_mock, subprocess_run_mock
-    ) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            cache_dir = tmp / "cache"
-            target = cache_dir / "syvai--hviske-v2"
-            subprocess_run_mock.return_value = Mock(
-                returncode=1, stdout="", stderr="cli error"
+        (target / "model.bin").unlink()
+        os.utime(target, ns=(0, 0))
+        with self.assertRaises(FileNotFoundError):
+            manager.resolve_existing_model_path()
+
+    def test_ready_marker_skips_scan_after_restart(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        target = tmp / "syvai--hviske-v2"
+        target.mkdir(parents=True, exist_ok=True)
+        (target / "model.bin").write_bytes(b"ok")
+        self.assertEqual(
+            ModelManager(repo_id="syvai/hviske-v2", cache_dir=tmp).resolve_existing_model_path(),
+            target,
+        )
+        ModelManager._ready_model_dirs.clear()
+
+        with patch.object(
+            ModelManager, "_scan_model_files", side_effect=AssertionError
+        ):
+            self.assertEqual(
+                ModelManager(
+                    repo_id="syvai/hviske-v2", cache_dir=tmp
+                ).resolve_existing_model_path(),
+                target,
             )
 
-            def _mock_snapshot_download(**kwargs):
-                model_path = Path(kwargs["local_dir"])
-                model_path.mkdir(parents=True, exist_ok=True)
-                (model_path / "model.bin").write_bytes(b"ok")
-                return str(model_path)
+        ModelManager._ready_model_dirs.clear()
+        (target / "model.bin").unlink()
+        os.utime(target, ns=(0, 0))
+        with self.assertRaises(FileNotFoundError):
+            ModelManager(repo_id="syvai/hviske-v2", cache_dir=tmp).resolve_existing_model_path()
 
-            snapshot_mock.side_effect = _mock_snapshot_download
-            manager = ModelManager(
+    @patch("src.core.model_manager._supported_compute_types", return_value=frozenset({"int8"}))
+    @patch("src.core.model_manager._cuda_available", return_value=False)
+    @patch("src.core.model_manager._module_available", return_value=True)
+    @patch("src.core.model_manager._create_transformers_converter")
+    def test_ready_marker_matches_auto_quantization_after_restart(
+        self, converter_factory_mock, *_mocks
+    ) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manual = tmp / "manual"
+        manual.mkdir()
+        (manual / "config.json").write_text("{}", encoding="utf-8")
+        (manual / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
+
+        class _FakeConverter:
+            def convert(self, output_dir: str, quantization: str, force: bool) -> None:
+                del quantization, force
+                (Path(output_dir) / "model.bin").write_bytes(b"ok")
+
+        converter_factory_mock.return_value = _FakeConverter()
+
+        def _manager() -> ModelManager:
+            return ModelManager(
                 repo_id="syvai/hviske-v2",
-                cache_dir=cache_dir,
-                manual_model_path=None,
-                hf_token="test-token",
+                cache_dir=tmp / "cache",
+                manual_model_path=str(manual),
+                quantization="auto",
             )
 
-            resolved = manager.ensure_model_available()
-
-            self.assertEqual(resolved, target)
-            snapshot_mock.assert_called_once()
-            self.assertGreaterEqual(subprocess_run_mock.call_count, 1)
-            _, kwargs = snapshot_mock.call_args
-            self.assertEqual(kwargs["token"], "test-token")
-            self.assertEqual(kwargs["local_dir"], str(target))
-            self.assertEqual(kwargs["allow_patterns"], INFERENCE_ALLOW_PATTERNS)
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
-
-    @patch("src.core.model_manager._subprocess_run")
-    @patch("src.core.model_manager._snapshot_download")
-    def test_tries_next_cli_entrypoint_on_missing_module_error(
-        self, snapshot_mock, subprocess_run_mock
+        first = _manager()
+        resolved = first.ensure_model_available()
+        self.assertEqual(resolved, manual / "ctranslate2-int8")
+        self.assertEqual(first.quantization, "auto")
+        self.assertEqual(first.resolve_existing_model_path(), resolved)
+        ModelManager._ready_model_dirs.clear()
+
+        with patch.object(
+            ModelManager, "_scan_model_files", side_effect=AssertionError
+        ):
+            self.assertEqual(_manager().resolve_existing_model_path(), resolved)
+
+    def test_revalidate_checks_hub_even_when_cached(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        cache_dir = tmp / "cache"
+        target = cache_dir / "syvai--hviske-v2"
+        target.mkdir(parents=True, exist_ok=True)
+        (target / "model.bin").write_bytes(b"ok")
+        self.snapshot_mock.return_value = str(target)
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=cache_dir,
+            manual_model_path=None,
+        )
+
+        self.assertEqual(manager.ensure_model_available(), target)
+        self.snapshot_mock.assert_not_called()
+        self.assertEqual(manager.ensure_model_available(revalidate=True), target)
+        self.snapshot_mock.assert_called_once()
+
+    @patch("src.core.model_manager._hf_hub_download")
+    @patch("src.core.model_manager._model_info")
+    def test_downloads_planned_files_in_parallel(
+        self, model_info_mock, hub_download_mock
     ) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            cache_dir = tmp / "cache"
-            target = cache_dir / "syvai--hviske-v2"
-            call_count = {"n": 0}
-
-            def _mock_cli_download(command, check, text, capture_output, env):
-                del check, text, capture_output, env
-                call_count["n"] += 1
-                if call_count["n"] == 1:
-                    return Mock(
-                        returncode=1,
-                        stdout="",
-                        stderr="No module named huggingface_hub.commands",
-                    )
-                local_dir_index = command.index("--local-dir")
-                output_dir = Path(command[local_dir_index + 1])
-                output_dir.mkdir(parents=True, exist_ok=True)
-                (output_dir / "config.json").write_text("{}", encoding="utf-8")
-                (output_dir / "model.safetensors.index.json").write_text(
-                    "{}", encoding="utf-8"
-                )
-                (output_dir / "model.bin").write_bytes(b"ok")
-                return Mock(returncode=0, stdout="", stderr="")
-
-            subprocess_run_mock.side_effect = _mock_cli_download
-            manager = ModelManager(
-                repo_id="syvai/hviske-v2",
-                cache_dir=cache_dir,
-                manual_model_path=None,
-                hf_token="test-token",
-            )
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        target = tmp / "cache" / "syvai--hviske-v2"
+        planned = ["config.json", "model.bin", "tokenizer.json"]
+        model_info_mock.return_value = SimpleNamespace(
+            sha="abc123",
+            siblings=[
+                SimpleNamespace(rfilename=name, size=2)
+                for name in [*planned, "README.md"]
+            ],
+        )
+
+        def _mock_hub_download(**kwargs):
+            path = Path(kwargs["local_dir"]) / kwargs["filename"]
+            path.write_bytes(b"ok")
+            return str(path)
+
+        hub_download_mock.side_effect = _mock_hub_download
+        messages: list[str] = []
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=None,
+            log_callback=messages.append,
+        )
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, target)
+        self.snapshot_mock.assert_not_called()
+        model_info_mock.assert_called_once()
+        self.assertEqual(
+            sorted(call.kwargs["filename"] for call in hub_download_mock.call_args_list),
+            planned,
+        )
+        self.assertIn("Download progress: 100% (6 B / 6 B)", messages)
+
+    @patch("src.core.model_manager._model_info")
+    def test_download_plan_is_cached_and_skips_downloaded_files(
+        self, model_info_mock
+    ) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        target = tmp / "target"
+        metadata_dir = target / ".cache" / "huggingface" / "download"
+        metadata_dir.mkdir(parents=True, exist_ok=True)
+        (target / "config.json").write_text("{}", encoding="utf-8")
+        (metadata_dir / "config.json.metadata").write_text(
+            "abc123\netag\n0\n", encoding="utf-8"
+        )
+        model_info_mock.return_value = SimpleNamespace(
+            sha="abc123",
+            siblings=[
+                SimpleNamespace(rfilename="config.json", size=2),
+                SimpleNamespace(rfilename="model.bin", size=10),
+            ],
+        )
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp,
+            log_callback=lambda _message: None,
+        )
+
+        first = manager._prepare_download_progress_plan(target)
+        second = manager._prepare_download_progress_plan(target)
+        revalidated = manager._prepare_download_progress_plan(
+            target, use_cached_plan=False
+        )
+
+        self.assertEqual(first, {"model.bin": 10})
+        self.assertEqual(second, first)
+        self.assertEqual(revalidated, first)
+        self.assertEqual(model_info_mock.call_count, 2)
+        self.assertTrue((tmp / ".plan.json").exists())
 
+    @patch("src.core.model_manager._module_available", return_value=True)
+    def test_retries_sdk_download_without_hf_transfer(
+        self, _module_available_mock
+    ) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        target = tmp / "cache" / "syvai--hviske-v2"
+        transfer_flags: list[str | None] = []
+
+        def _mock_snapshot_download(**kwargs):
+            transfer_flags.append(os.environ.get("HF_HUB_ENABLE_HF_TRANSFER"))
+            if len(transfer_flags) == 1:
+                raise RuntimeError("hf_transfer error")
+            model_path = Path(kwargs["local_dir"])
+            (model_path / "model.bin").write_bytes(b"ok")
+            return str(model_path)
+
+        self.snapshot_mock.side_effect = _mock_snapshot_download
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=None,
+        )
+
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("HF_HUB_ENABLE_HF_TRANSFER", None)
             resolved = manager.ensure_model_available()
-
-            self.assertEqual(resolved, target)
-            snapshot_mock.assert_not_called()
-            self.assertGreaterEqual(subprocess_run_mock.call_count, 2)
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+            leaked = os.environ.get("HF_HUB_ENABLE_HF_TRANSFER")
+
+        self.assertEqual(resolved, target)
+        self.assertEqual(transfer_flags, ["1", "0"])
+        self.assertIsNone(leaked)
+
+    def test_downloads_model_with_cli_when_sdk_fails(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        cache_dir = tmp / "cache"
+
+        def _mock_cli_download(command, stdout, stderr, env):
+            del stderr, env
+            local_dir_index = command.index("--local-dir")
+            target = Path(command[local_dir_index + 1])
+            _seed_model_dir(target)
+            return _FakeProcess(stdout, 0)
+
+        self.popen_mock.side_effect = _mock_cli_download
+        self.snapshot_mock.side_effect = RuntimeError("sdk error")
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=cache_dir,
+            manual_model_path=None,
+            hf_token="test-token",
+        )
+
+        resolved = manager.ensure_model_available()
+
+        target = cache_dir / "syvai--hviske-v2"
+        self.assertEqual(resolved, target)
+        self.snapshot_mock.assert_called_once()
+        self.popen_mock.assert_called_once()
+        command = self.popen_mock.call_args[0][0]
+        self.assertGreaterEqual(len(command), 2)
+        self.assertEqual(command[1], "download")
+        self.assertIn("download", command)
+        self.assertIn("syvai/hviske-v2", command)
+        self.assertIn("--local-dir", command)
+        self.assertIn(str(cache_dir / "syvai--hviske-v2"), command)
+        self.assertIn("--token", command)
+        self.assertIn("test-token", command)
+        self.assertIn("--include", command)
+        include_index = command.index("--include")
+        self.assertEqual(
+            command[include_index + 1 : include_index + 1 + len(INFERENCE_ALLOW_PATTERNS)],
+            INFERENCE_ALLOW_PATTERNS,
+        )
+
+    def test_downloads_with_sdk_before_cli(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        cache_dir = tmp / "cache"
+        target = cache_dir / "syvai--hviske-v2"
+
+        def _mock_snapshot_download(**kwargs):
+            model_path = Path(kwargs["local_dir"])
+            model_path.mkdir(parents=True, exist_ok=True)
+            (model_path / "model.bin").write_bytes(b"ok")
+            return str(model_path)
+
+        self.snapshot_mock.side_effect = _mock_snapshot_download
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=cache_dir,
+            manual_model_path=None,
+            hf_token="test-token",
+        )
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, target)
+        self.snapshot_mock.assert_called_once()
+        self.popen_mock.assert_not_called()
+        _, kwargs = self.snapshot_mock.call_args
+        self.assertEqual(kwargs["token"], "test-token")
+        self.assertEqual(kwargs["local_dir"], str(target))
+        self.assertEqual(kwargs["allow_patterns"], INFERENCE_ALLOW_PATTERNS)
+
+    def test_reports_both_errors_when_sdk_and_cli_fail(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        self.snapshot_mock.side_effect = RuntimeError("sdk error")
+        self.popen_mock.side_effect = lambda command, stdout, stderr, env: _FakeProcess(
+            stdout, 1, "cli error"
+        )
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=None,
+        )
+
+        with self.assertRaises(RuntimeError) as ctx:
+            manager.ensure_model_available()
+
+        self.assertIn("sdk error", str(ctx.exception))
+        self.assertIn("cli error", str(ctx.exception))
+
+    def test_tries_next_cli_entrypoint_on_missing_module_error(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        cache_dir = tmp / "cache"
+        target = cache_dir / "syvai--hviske-v2"
+        call_count = {"n": 0}
+
+        def _mock_cli_download(command, stdout, stderr, env):
+            del stderr, env
+            call_count["n"] += 1
+            if call_count["n"] == 1:
+                return _FakeProcess(
+                    stdout, 1, "No module named huggingface_hub.commands"
+                )
+            local_dir_index = command.index("--local-dir")
+            output_dir = Path(command[local_dir_index + 1])
+            _seed_model_dir(output_dir)
+            return _FakeProcess(stdout, 0)
+
+        self.popen_mock.side_effect = _mock_cli_download
+        self.snapshot_mock.side_effect = RuntimeError("sdk error")
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=cache_dir,
+            manual_model_path=None,
+            hf_token="test-token",
+        )
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, target)
+        self.assertGreaterEqual(self.popen_mock.call_count, 2)
+
+    def test_reuses_resolved_cli_entrypoint_on_next_download(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        commands: list[list[str]] = []
+        broken_cli = list(_candidate_cli_bases()[0])
+
+        def _mock_cli_download(command, stdout, stderr, env):
+            del stderr, env
+            commands.append(command)
+            if command[: len(broken_cli)] == broken_cli:
+                return _FakeProcess(
+                    stdout, 1, "No module named huggingface_hub.commands"
+                )
+            local_dir_index = command.index("--local-dir")
+            output_dir = Path(command[local_dir_index + 1])
+            _seed_model_dir(output_dir)
+            return _FakeProcess(stdout, 0)
+
+        self.popen_mock.side_effect = _mock_cli_download
+        self.snapshot_mock.side_effect = RuntimeError("sdk error")
+        ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "first",
+        ).ensure_model_available()
+        self.assertEqual(len(commands), 2)
+        commands.clear()
+
+        ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "second",
+        ).ensure_model_available()
+
+        self.assertEqual(len(commands), 1)
+        self.assertEqual(
+            ModelManager._resolved_cli_base,
+            tuple(commands[0][: commands[0].index("download")]),
+        )
+
+    def test_forgets_resolved_cli_entrypoint_when_it_disappears(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        candidates = _candidate_cli_bases()
+        ModelManager._resolved_cli_base = candidates[-1]
+
+        def _mock_cli_download(command, stdout, stderr, env):
+            del stderr, env
+            if tuple(command[: len(candidates[-1])]) == candidates[-1]:
+                raise FileNotFoundError(command[0])
+            output_dir = Path(command[command.index("--local-dir") + 1])
+            _seed_model_dir(output_dir)
+            return _FakeProcess(stdout, 0)
+
+        self.popen_mock.side_effect = _mock_cli_download
+        self.snapshot_mock.side_effect = RuntimeError("sdk error")
+        ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp,
+        ).ensure_model_available()
+
+        self.assertEqual(self.popen_mock.call_count, 2)
+        self.assertEqual(ModelManager._resolved_cli_base, candidates[0])
+
+    def test_uses_ctranslate2_mirror_for_known_transformers_repo(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manager = ModelManager(
+            repo_id="openai/whisper-large-v3",
+            cache_dir=tmp / "cache",
+        )
+        manual = ModelManager(
+            repo_id="openai/whisper-large-v3",
+            cache_dir=tmp / "cache",
+            manual_model_path="manual",
+        )
+
+        self.assertEqual(manager.repo_id, "Systran/faster-whisper-large-v3")
+        self.assertEqual(manager.download_dir.name, "Systran--faster-whisper-large-v3")
+        self.assertEqual(manual.repo_id, "openai/whisper-large-v3")
+
+    def test_keeps_original_repo_when_its_cache_is_already_complete(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        existing = tmp / "openai--whisper-large-v3"
+        existing.mkdir()
+        (existing / "model.bin").write_bytes(b"ok")
+
+        manager = ModelManager(repo_id="openai/whisper-large-v3", cache_dir=tmp)
+
+        self.assertEqual(manager.repo_id, "openai/whisper-large-v3")
+        self.assertEqual(manager.ensure_model_available(), existing)
+        self.snapshot_mock.assert_not_called()
+        self.popen_mock.assert_not_called()
+
+    def test_cli_download_accepts_ctranslate2_mirror_layout(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+
+        def _mock_cli_download(command, stdout, stderr, env):
+            del stderr, env
+            target = Path(command[command.index("--local-dir") + 1])
+            target.mkdir(parents=True, exist_ok=True)
+            (target / "config.json").write_text("{}", encoding="utf-8")
+            (target / "model.bin").write_bytes(b"ok")
+            return _FakeProcess(stdout, 0)
+
+        self.popen_mock.side_effect = _mock_cli_download
+        self.snapshot_mock.side_effect = RuntimeError("sdk error")
+        manager = ModelManager(repo_id="openai/whisper-large-v3", cache_dir=tmp)
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, tmp / "Systran--faster-whisper-large-v3")
+
+    def test_cli_candidates_are_filtered_by_availability(self) -> None:
+        missing_tool = str(TMP_ROOT.resolve() / f"missing_{os.getpid()}")
+
+        self.assertFalse(_cli_base_available((missing_tool,)))
+        self.assertTrue(_cli_base_available((sys.executable,)))
+        self.assertFalse(
+            _cli_base_available((sys.executable, "-m", "missing_pkg_for_sludre.cli"))
+        )
+        self.assertTrue(_cli_base_available((sys.executable, "-m", "json.tool")))
+
+    def test_format_command_for_log_redacts_token_and_quotes_parts(self) -> None:
+        formatted = ModelManager._format_command_for_log(
+            ["hf", "download", "--local-dir", "C:/my models", "--token", "secret", "--x=secret"],
+            "secret",
+        )
+
+        self.assertEqual(
+            formatted,
+            "hf download --local-dir 'C:/my models' --token ***REDACTED*** ***REDACTED***",
+        )
+
+    def test_cli_progress_is_parsed_from_streamed_output(self) -> None:
+        logs: list[str] = []
+        self.popen_mock.side_effect = lambda command, stdout, stderr, env: _FakeProcess(
+            stdout,
+            0,
+            "model.bin:  90%|#########\rFetching 4 files:  50%|#####\n",
+        )
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=TMP_ROOT,
+            log_callback=logs.append,
+        )
+
+        result = manager._run_cli_process(["hf", "download"], None, target_dir=None)
+
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Download progress: 50% (huggingface-cli)", logs)
+        self.assertFalse(any("90%" in line and "progress" in line for line in logs))
 
     def test_resolve_existing_model_path_raises_when_missing_local_model(self) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            cache_dir = tmp / "cache"
-            target = cache_dir / "syvai--hviske-v2"
-            manager = ModelManager(
-                repo_id="syvai/hviske-v2",
-                cache_dir=cache_dir,
-                manual_model_path=None,
-            )
-
-            with self.assertRaises(FileNotFoundError):
-                manager.resolve_existing_model_path()
-            self.assertTrue(target.exists())
-            self.assertTrue(target.is_dir())
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        cache_dir = tmp / "cache"
+        target = cache_dir / "syvai--hviske-v2"
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=cache_dir,
+            manual_model_path=None,
+        )
+
+        with self.assertRaises(FileNotFoundError):
+            manager.resolve_existing_model_path()
+        self.assertTrue(target.exists())
+        self.assertTrue(target.is_dir())
 
     def test_missing_manual_model_path_is_created(self) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            missing_manual = tmp / "manual-missing"
-            manager = ModelManager(
-                repo_id="syvai/hviske-v2",
-                cache_dir=tmp / "cache",
-                manual_model_path=str(missing_manual),
-            )
-
-            with self.assertRaises(FileNotFoundError):
-                manager.resolve_existing_model_path()
-            self.assertTrue(missing_manual.exists())
-            self.assertTrue(missing_manual.is_dir())
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
-
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        missing_manual = tmp / "manual-missing"
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=str(missing_manual),
+        )
+
+        with self.assertRaises(FileNotFoundError):
+            manager.resolve_existing_model_path()
+        self.assertTrue(missing_manual.exists())
+        self.assertTrue(missing_manual.is_dir())
+
+    @patch("src.core.model_manager._cuda_available", return_value=True)
     @patch("src.core.model_manager._module_available", return_value=True)
     @patch("src.core.model_manager._create_transformers_converter")
     def test_converts_transformers_model_to_ctranslate2(
-        self, converter_factory_mock, _module_available_mock
+        self, converter_factory_mock, _module_available_mock, _cuda_available_mock
     ) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            manual = tmp / "manual"
-            manual.mkdir(parents=True, exist_ok=True)
-            (manual / "config.json").write_text("{}", encoding="utf-8")
-            (manual / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
-
-            class _FakeConverter:
-                def convert(self, output_dir: str, quantization: str, force: bool) -> None:
-                    del quantization, force
-                    out = Path(output_dir)
-                    out.mkdir(parents=True, exist_ok=True)
-                    (out / "model.bin").write_bytes(b"ok")
-
-            converter_factory_mock.return_value = _FakeConverter()
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manual = tmp / "manual"
+        manual.mkdir(parents=True, exist_ok=True)
+        (manual / "config.json").write_text("{}", encoding="utf-8")
+        (manual / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
+        (manual / "tokenizer.json").write_text('{"v": 1}', encoding="utf-8")
+        (manual / ".ctranslate2-int8_float16-interrupted").mkdir()
+
+        quantizations: list[str] = []
+
+        class _FakeConverter:
+            def convert(self, output_dir: str, quantization: str, force: bool) -> None:
+                del force
+                quantizations.append(quantization)
+                out = Path(output_dir)
+                out.mkdir(parents=True, exist_ok=True)
+                (out / "model.bin").write_bytes(b"ok")
+
+        converter_factory_mock.return_value = _FakeConverter()
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=str(manual),
+        )
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, manual / "ctranslate2-int8_float16")
+        self.assertEqual(quantizations, ["int8_float16"])
+        converter_factory_mock.assert_called_once()
+        self.assertEqual(
+            (resolved / "tokenizer.json").read_text(encoding="utf-8"), '{"v": 1}'
+        )
+        self.assertFalse((resolved / "vocab.json").exists())
+        self.assertEqual(list(manual.glob(".ctranslate2-*")), [])
+        marker = json.loads((resolved / CONVERSION_MARKER).read_text(encoding="utf-8"))
+        self.assertEqual(marker["quant"], "int8_float16")
+
+    @patch("src.core.model_manager._create_transformers_converter")
+    def test_reuses_legacy_converted_model_without_reconverting(
+        self, converter_factory_mock
+    ) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manual = tmp / "manual"
+        (manual / "ctranslate2").mkdir(parents=True, exist_ok=True)
+        (manual / "config.json").write_text("{}", encoding="utf-8")
+        (manual / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
+        (manual / "ctranslate2" / "model.bin").write_bytes(b"ok")
+
+        for quantization in ("auto", "float16"):
+            ModelManager._ready_model_dirs.clear()
             manager = ModelManager(
                 repo_id="syvai/hviske-v2",
                 cache_dir=tmp / "cache",
                 manual_model_path=str(manual),
+                quantization=quantization,
             )
 
             resolved = manager.ensure_model_available()
 
             self.assertEqual(resolved, manual / "ctranslate2")
-            converter_factory_mock.assert_called_once()
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        converter_factory_mock.assert_not_called()
 
-    @patch("src.core.model_manager._module_available", return_value=False)
-    def test_conversion_reports_missing_dependencies(self, _module_available_mock) -> None:
-        tmp = Path(".test_tmp") / f"model_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            manual = tmp / "manual"
-            manual.mkdir(parents=True, exist_ok=True)
-            (manual / "config.json").write_text("{}", encoding="utf-8")
-            (manual / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
-            manager = ModelManager(
+    @patch("src.core.model_manager._module_available", return_value=True)
+    @patch("src.core.model_manager._create_transformers_converter")
+    def test_converts_next_to_legacy_model_for_other_quantization(
+        self, converter_factory_mock, _module_available_mock
+    ) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manual = tmp / "manual"
+        (manual / "ctranslate2").mkdir(parents=True, exist_ok=True)
+        (manual / "config.json").write_text("{}", encoding="utf-8")
+        (manual / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
+        (manual / "ctranslate2" / "model.bin").write_bytes(b"legacy")
+
+        class _FakeConverter:
+            def convert(self, output_dir: str, quantization: str, force: bool) -> None:
+                del quantization, force
+                (Path(output_dir) / "model.bin").write_bytes(b"int8")
+
+        converter_factory_mock.return_value = _FakeConverter()
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=str(manual),
+            quantization="int8",
+        )
+
+        resolved = manager.ensure_model_available()
+
+        self.assertEqual(resolved, manual / "ctranslate2-int8")
+        self.assertEqual((resolved / "model.bin").read_bytes(), b"int8")
+        converter_factory_mock.assert_called_once()
+
+    @patch("src.core.model_manager._module_available", return_value=True)
+    @patch("src.core.model_manager._create_transformers_converter")
+    def test_reconverts_when_conversion_marker_is_missing(
+        self, converter_factory_mock, _module_available_mock
+    ) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manual = tmp / "manual"
+        stale = manual / "ctranslate2-int8"
+        stale.mkdir(parents=True, exist_ok=True)
+        (manual / "config.json").write_text("{}", encoding="utf-8")
+        (manual / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
+        (stale / "model.bin").write_bytes(b"old")
+
+        class _FakeConverter:
+            def convert(self, output_dir: str, quantization: str, force: bool) -> None:
+                del quantization, force
+                (Path(output_dir) / "model.bin").write_bytes(b"new")
+
+        converter_factory_mock.return_value = _FakeConverter()
+
+        def _manager() -> ModelManager:
+            return ModelManager(
                 repo_id="syvai/hviske-v2",
                 cache_dir=tmp / "cache",
                 manual_model_path=str(manual),
+                quantization="int8",
             )
 
-            with self.assertRaises(RuntimeError) as ctx:
-                manager.ensure_model_available()
+        resolved = _manager().ensure_model_available()
+        again = _manager().ensure_model_available()
+
+        self.assertEqual(resolved, stale)
+        self.assertEqual(again, stale)
+        self.assertEqual((stale / "model.bin").read_bytes(), b"new")
+        self.assertEqual(list(manual.glob(".ctranslate2-int8-*")), [])
+        converter_factory_mock.assert_called_once()
 
-            self.assertIn("Missing dependencies for conversion", str(ctx.exception))
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+    @patch("src.core.model_manager._module_available", return_value=False)
+    def test_conversion_reports_missing_dependencies(self, _module_available_mock) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        manual = tmp / "manual"
+        manual.mkdir(parents=True, exist_ok=True)
+        (manual / "config.json").write_text("{}", encoding="utf-8")
+        (manual / "model.safetensors.index.json").write_text("{}", encoding="utf-8")
+        manager = ModelManager(
+            repo_id="syvai/hviske-v2",
+            cache_dir=tmp / "cache",
+            manual_model_path=str(manual),
+        )
+
+        with self.assertRaises(RuntimeError) as ctx:
+            manager.ensure_model_available()
+
+        self.assertIn("Missing dependencies for conversion", str(ctx.exception))
 
 
 if __name__ == "__main__":
@@ -1,70 +1,159 @@
 from __future__ import annotations
 
+import os
 import shutil
+import tempfile
 import unittest
-import uuid
 from pathlib import Path
-from unittest.mock import Mock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 from src.core.config import AppConfig
+from src.core import text_cleaner
 from src.core.pipeline import TranscriptionPostProcessor
 from src.core.wordlist_store import ReplacementRule, WordlistData, WordlistStore
 
 
+TMP_ROOT = Path(tempfile.gettempdir()) / "sludre-tests"
+
+
+def _fail_if_called(name: str):
+    def _call(*args, **kwargs):
+        raise AssertionError(f"{name} called")
+
+    return _call
+
+
+class _FakeWordlistStore:
+    def __init__(self, data: WordlistData | None = None) -> None:
+        self.version = 0
+        self.save(data or WordlistData())
+
+    def load_versioned(self) -> tuple[int, WordlistData]:
+        return self.version, self._data
+
+    def save(self, data: WordlistData) -> None:
+        self._data = data
+        self.version += 1
+
+
 class PipelineTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = TMP_ROOT / f"pipeline_{os.getpid()}"
+        cls._tmp.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._tmp, ignore_errors=True)
+
     def test_wordlist_replacements_apply_without_llm(self) -> None:
-        tmp = Path(".test_tmp") / f"pipeline_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            store = WordlistStore(tmp / "wordlist.json")
-            store.save(
-                WordlistData(
-                    replacements=[
-                        ReplacementRule(source="gpu", target="GPU", whole_word=True)
-                    ],
-                    preferred_terms=[],
-                )
+        store = _FakeWordlistStore(
+            WordlistData(
+                replacements=[
+                    ReplacementRule(source="gpu", target="GPU", whole_word=True)
+                ],
+                preferred_terms=[],
             )
-            llm_refiner = Mock()
-            cfg = AppConfig.defaults()
-            cfg.wordlist_path = str(tmp / "wordlist.json")
-            cfg.wordlist_enabled = True
-            cfg.wordlist_apply_replacements = True
-            cfg.llm_enabled = False
-            processor = TranscriptionPostProcessor(store, llm_refiner)
+        )
+        llm_refiner = SimpleNamespace(refine=_fail_if_called("refine"))
+        cfg = AppConfig.defaults()
+        cfg.wordlist_enabled = True
+        cfg.wordlist_apply_replacements = True
+        cfg.llm_enabled = False
+        processor = TranscriptionPostProcessor(store, llm_refiner)
+
+        result = processor.process("gpu test", cfg)
+
+        self.assertEqual(result.text, "GPU test")
+        self.assertEqual(result.replacement_hits, 1)
 
+    def test_returns_stripped_text_without_touching_wordlist_when_disabled(self) -> None:
+        store = SimpleNamespace(load_versioned=_fail_if_called("load_versioned"))
+        llm_refiner = SimpleNamespace(refine=_fail_if_called("refine"))
+        cfg = AppConfig.defaults()
+        cfg.wordlist_enabled = False
+        cfg.llm_enabled = False
+        processor = TranscriptionPostProcessor(store, llm_refiner)
+
+        result = processor.process("  hej  ", cfg)
+
+        self.assertEqual(result.raw_text, "hej")
+        self.assertEqual(result.text, "hej")
+
+    def test_prepare_compiles_replacements_before_first_process(self) -> None:
+        store = _FakeWordlistStore(WordlistData(replacements=[ReplacementRule("gpu", "GPU")]))
+        cfg = AppConfig.defaults()
+        processor = TranscriptionPostProcessor(store, SimpleNamespace())
+
+        processor.prepare(cfg)
+        with patch(
+            "src.core.pipeline.compile_wordlist_replacements",
+            side_effect=AssertionError("compiled on the dictation path"),
+        ):
             result = processor.process("gpu test", cfg)
 
-            self.assertEqual(result.text, "GPU test")
-            self.assertEqual(result.replacement_hits, 1)
-            llm_refiner.refine.assert_not_called()
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        self.assertEqual(result.text, "GPU test")
+
+    def test_warm_up_preconnects_llm_only_when_enabled(self) -> None:
+        store = SimpleNamespace(load_versioned=_fail_if_called("load_versioned"))
+        llm_refiner = Mock()
+        cfg = AppConfig.defaults()
+        cfg.wordlist_enabled = False
+        processor = TranscriptionPostProcessor(store, llm_refiner)
+
+        cfg.llm_enabled = False
+        processor.warm_up(cfg)
+        llm_refiner.preconnect.assert_not_called()
+
+        cfg.llm_enabled = True
+        processor.warm_up(cfg)
+        llm_refiner.preconnect.assert_called_once_with(cfg)
 
     def test_llm_failure_sets_error_and_keeps_pre_llm_text(self) -> None:
-        tmp = Path(".test_tmp") / f"pipeline_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            store = WordlistStore(tmp / "wordlist.json")
-            store.save(WordlistData())
-            llm_refiner = Mock()
-            llm_refiner.refine.side_effect = RuntimeError("timeout")
-            cfg = AppConfig.defaults()
-            cfg.wordlist_path = str(tmp / "wordlist.json")
-            cfg.llm_enabled = True
-            cfg.llm_provider = "openai_compatible"
-            cfg.llm_base_url = "https://example.com/v1"
-            cfg.llm_api_key = "secret"
-            cfg.llm_model = "model"
-            processor = TranscriptionPostProcessor(store, llm_refiner)
-
-            result = processor.process("raw text", cfg)
-
-            self.assertEqual(result.raw_text, "raw text")
-            self.assertEqual(result.text, "raw text")
-            self.assertIsNotNone(result.llm_error)
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        store = _FakeWordlistStore()
+        llm_refiner = Mock()
+        llm_refiner.refine.side_effect = RuntimeError("timeout")
+        cfg = AppConfig.defaults()
+        cfg.llm_enabled = True
+        cfg.llm_provider = "openai_compatible"
+        cfg.llm_base_url = "https://example.com/v1"
+        cfg.llm_api_key = "secret"
+        cfg.llm_model = "model"
+        processor = TranscriptionPostProcessor(store, llm_refiner)
+
+        result = processor.process("raw text", cfg)
+
+        self.assertEqual(result.raw_text, "raw text")
+        self.assertEqual(result.text, "raw text")
+        self.assertIsNotNone(result.llm_error)
+
+    def test_compiled_replacements_are_reused_until_wordlist_changes(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        store = WordlistStore(tmp / "wordlist.json")
+        store.save(
+            WordlistData(replacements=[ReplacementRule(source="gpu", target="GPU")])
+        )
+        cfg = AppConfig.defaults()
+        cfg.wordlist_enabled = True
+        cfg.wordlist_apply_replacements = True
+        cfg.llm_enabled = False
+        processor = TranscriptionPostProcessor(store, SimpleNamespace())
+
+        with patch(
+            "src.core.pipeline.compile_wordlist_replacements",
+            wraps=text_cleaner.compile_wordlist_replacements,
+        ) as compile_mock:
+            processor.process("gpu one", cfg)
+            processor.process("gpu two", cfg)
+            store.save(
+                WordlistData(replacements=[ReplacementRule(source="gpu", target="CUDA")])
+            )
+            result = processor.process("gpu three", cfg)
+
+        self.assertEqual(compile_mock.call_count, 2)
+        self.assertEqual(result.text, "CUDA three")
 
 
 if __name__ == "__main__":
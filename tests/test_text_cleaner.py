@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import unittest
+from unittest.mock import patch
 
+from src.core import text_cleaner
 from src.core.text_cleaner import apply_wordlist_replacements
 from src.core.wordlist_store import ReplacementRule
 
@@ -31,5 +33,116 @@ class TextCleanerTests(unittest.TestCase):
         self.assertEqual(result.replacement_hits, 1)
 
 
+    def test_applies_rules_in_one_pass_with_literal_targets(self) -> None:
+        rules = [
+            ReplacementRule(source="sludre", target="Sludre"),
+            ReplacementRule(source="AI", target=r"A\I", match_case=True),
+            ReplacementRule(source="gpu", target="GPU"),
+        ]
+
+        result = apply_wordlist_replacements("sludre bruger gpu og AI, ikke ai", rules)
+
+        self.assertEqual(result.text, r"Sludre bruger GPU og A\I, ikke ai")
+        self.assertEqual(result.replacement_hits, 3)
+
+    def test_overlapping_rules_apply_in_list_order(self) -> None:
+        rules = [
+            ReplacementRule(source="York", target="Yorkshire"),
+            ReplacementRule(source="New York", target="NYC"),
+        ]
+
+        result = apply_wordlist_replacements("New York", rules)
+
+        self.assertEqual(result.text, "New Yorkshire")
+        self.assertEqual(result.replacement_hits, 1)
+
+    def test_later_rules_apply_to_earlier_output(self) -> None:
+        rules = [
+            ReplacementRule(source="a", target="b"),
+            ReplacementRule(source="b", target="c"),
+        ]
+
+        result = apply_wordlist_replacements("a b", rules)
+
+        self.assertEqual(result.text, "c c")
+        self.assertEqual(result.replacement_hits, 3)
+
+    def test_earlier_rules_do_not_rewrite_later_output_across_buckets(self) -> None:
+        rules = [
+            ReplacementRule(source="gpu", target="GPU"),
+            ReplacementRule(source="cat", target="dog", whole_word=False),
+            ReplacementRule(source="pet", target="cat"),
+        ]
+
+        result = apply_wordlist_replacements("gpu pet", rules)
+
+        self.assertEqual(result.text, "GPU cat")
+        self.assertEqual(result.replacement_hits, 2)
+
+    def test_whole_word_rules_sharing_edge_letters_share_one_bucket(self) -> None:
+        rules = [
+            ReplacementRule(source="kubernetes", target="Kubernetes"),
+            ReplacementRule(source="slack", target="Slack"),
+            ReplacementRule(source="github", target="GitHub"),
+            ReplacementRule(source="python", target="Python"),
+        ]
+
+        compiled = text_cleaner.compile_wordlist_replacements(rules)
+        result = apply_wordlist_replacements("kubernetes slack github python", rules)
+
+        self.assertEqual(len(compiled.buckets), 1)
+        self.assertEqual(result.text, "Kubernetes Slack GitHub Python")
+        self.assertEqual(result.replacement_hits, 4)
+
+    def test_whole_word_rules_overlapping_across_a_space_apply_in_list_order(self) -> None:
+        rules = [
+            ReplacementRule(source="new york", target="NYC"),
+            ReplacementRule(source="york city", target="YC"),
+        ]
+
+        compiled = text_cleaner.compile_wordlist_replacements(rules)
+        result = apply_wordlist_replacements("new york city", rules)
+
+        self.assertEqual(len(compiled.buckets), 2)
+        self.assertEqual(result.text, "NYC city")
+
+    def test_skips_regex_scan_when_no_source_occurs(self) -> None:
+        rules = [
+            ReplacementRule(source="strasse", target="Straße"),
+            ReplacementRule(source="GPU", target="gpu", match_case=True),
+        ]
+
+        with patch.object(
+            text_cleaner,
+            "_substitute_with_regex",
+            wraps=text_cleaner._substitute_with_regex,
+        ) as regex_mock:
+            untouched = apply_wordlist_replacements("ingen regler her, gpu", rules)
+            self.assertEqual(regex_mock.call_count, 0)
+            result = apply_wordlist_replacements("STRASSE", rules)
+
+        self.assertEqual(untouched.text, "ingen regler her, gpu")
+        self.assertEqual(result.text, "Straße")
+        self.assertEqual(regex_mock.call_count, 1)
+
+    def test_prefilter_keeps_dotted_and_dotless_i_matches(self) -> None:
+        dotless = [ReplacementRule(source="\u0131", target="X", whole_word=False)]
+        dotted = [ReplacementRule(source="\u0130stanbul", target="Istanbul")]
+
+        self.assertEqual(apply_wordlist_replacements("if", dotless).text, "Xf")
+        self.assertEqual(apply_wordlist_replacements("istanbul", dotted).text, "Istanbul")
+
+    def test_reuses_compiled_rules_across_calls(self) -> None:
+        text_cleaner._compile_rules.cache_clear()
+        self.addCleanup(text_cleaner._compile_rules.cache_clear)
+
+        apply_wordlist_replacements("gpu one", [ReplacementRule(source="gpu", target="GPU")])
+        result = apply_wordlist_replacements("gpu two", [ReplacementRule(source="gpu", target="GPU")])
+
+        self.assertEqual(result.text, "GPU two")
+        self.assertEqual(text_cleaner._compile_rules.cache_info().misses, 1)
+        self.assertGreaterEqual(text_cleaner._compile_rules.cache_info().hits, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
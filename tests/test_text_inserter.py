@@ -6,30 +6,83 @@ from unittest.mock import Mock, patch
 from src.core.text_inserter import TextInserter
 
 
+class _FakeClock:
+    # Sleeping advances the clock instead of blocking, so settle loops still
+    # reach their deadline.
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
 class TextInserterTests(unittest.TestCase):
-    @patch("src.core.text_inserter.time.sleep", return_value=None)
+    @classmethod
+    def setUpClass(cls) -> None:
+        time_patcher = patch("src.core.text_inserter.time", _FakeClock())
+        time_patcher.start()
+        cls.addClassCleanup(time_patcher.stop)
+
     @patch("src.core.text_inserter._keyboard")
     @patch("src.core.text_inserter._pyperclip")
     def test_insert_text_uses_clipboard_and_restores(
-        self,
-        pyperclip_factory,
-        keyboard_factory,
-        _sleep_mock,
+        self, pyperclip_factory, keyboard_factory
     ) -> None:
+        text = " ".join(["hej verden"] * 30)
         pyperclip_mock = Mock()
-        pyperclip_mock.paste.return_value = "old-value"
+        pyperclip_mock.paste.side_effect = ["old-value", text]
         keyboard_mock = Mock()
         pyperclip_factory.return_value = pyperclip_mock
         keyboard_factory.return_value = keyboard_mock
         inserter = TextInserter(restore_clipboard=True)
 
-        inserter.insert_text_at_cursor("hej verden")
+        inserter.insert_text_at_cursor(text)
 
         keyboard_mock.send.assert_called_once_with("ctrl+v")
+        keyboard_mock.write.assert_not_called()
         self.assertEqual(pyperclip_mock.copy.call_count, 2)
-        pyperclip_mock.copy.assert_any_call("hej verden")
+        pyperclip_mock.copy.assert_any_call(text)
         pyperclip_mock.copy.assert_any_call("old-value")
 
+    @patch("src.core.text_inserter._keyboard")
+    @patch("src.core.text_inserter._pyperclip")
+    def test_insert_types_short_text_without_clipboard(
+        self, pyperclip_factory, keyboard_factory
+    ) -> None:
+        pyperclip_mock = Mock()
+        keyboard_mock = Mock()
+        pyperclip_factory.return_value = pyperclip_mock
+        keyboard_factory.return_value = keyboard_mock
+        inserter = TextInserter(restore_clipboard=True, insert_mode="type_short")
+
+        inserter.insert_text_at_cursor("hej verden")
+
+        keyboard_mock.write.assert_called_once_with("hej verden", delay=0)
+        keyboard_mock.send.assert_not_called()
+        pyperclip_mock.copy.assert_not_called()
+        pyperclip_mock.paste.assert_not_called()
+
+    @patch("src.core.text_inserter._keyboard")
+    @patch("src.core.text_inserter._pyperclip")
+    def test_insert_pastes_short_text_in_clipboard_mode(
+        self, pyperclip_factory, keyboard_factory
+    ) -> None:
+        pyperclip_mock = Mock()
+        pyperclip_mock.paste.side_effect = ["old-value", "hej verden"]
+        keyboard_mock = Mock()
+        pyperclip_factory.return_value = pyperclip_mock
+        keyboard_factory.return_value = keyboard_mock
+        inserter = TextInserter(restore_clipboard=True)
+
+        inserter.insert_text_at_cursor("hej verden")
+
+        keyboard_mock.send.assert_called_once_with("ctrl+v")
+        keyboard_mock.write.assert_not_called()
+        pyperclip_mock.copy.assert_any_call("hej verden")
+
     @patch("src.core.text_inserter._keyboard")
     @patch("src.core.text_inserter._pyperclip")
     def test_insert_skips_empty_text(self, pyperclip_factory, keyboard_factory) -> None:
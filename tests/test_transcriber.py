@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import numpy as np
+
 from src.core.transcriber import Transcriber
 
 
+TMP_ROOT = Path(tempfile.gettempdir()) / "sludre-tests"
+
+
 class _FakeSegment:
     def __init__(self, text: str) -> None:
         self.text = text
@@ -22,8 +31,10 @@ class _FakeModel:
         self.device = device
         self.compute_type = compute_type
 
-    def transcribe(self, audio, language, beam_size, vad_filter):
-        del audio, language, beam_size, vad_filter
+    def transcribe(self, audio, language, **options):
+        del language
+        self.audio = audio
+        self.options = options
         return [_FakeSegment(" hej"), _FakeSegment(" verden ")], _FakeInfo()
 
 
@@ -34,6 +45,15 @@ class _FakeAudio:
 
 
 class TranscriberTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = TMP_ROOT / f"transcriber_{os.getpid()}"
+        cls._tmp.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._tmp, ignore_errors=True)
+
     @patch("src.core.transcriber._import_whisper_model", return_value=_FakeModel)
     def test_transcribe_returns_joined_text(self, _import_mock) -> None:
         transcriber = Transcriber(Path("model"), device="cuda")
@@ -44,6 +64,56 @@ class TranscriberTests(unittest.TestCase):
         self.assertEqual(result.text, "hej verden")
         self.assertEqual(result.language, "da")
         self.assertGreaterEqual(result.duration_sec, 1.0)
+        self.assertEqual(transcriber._model.options["beam_size"], 1)
+        self.assertFalse(transcriber._model.options["condition_on_previous_text"])
+
+    @patch("src.core.transcriber._import_whisper_model", return_value=_FakeModel)
+    def test_load_warms_up_model_with_silence(self, _import_mock) -> None:
+        transcriber = Transcriber(Path("model"), device="cuda")
+
+        transcriber.load()
+
+        self.assertEqual(transcriber._model.audio.shape, (16000,))
+        self.assertFalse(transcriber._model.audio.any())
+        self.assertFalse(transcriber._model.options["vad_filter"])
+
+    def test_transcribe_reports_duration_after_vad(self) -> None:
+        class _VadModel(_FakeModel):
+            def transcribe(self, audio, language, **options):
+                segments, _info = super().transcribe(audio, language, **options)
+                return segments, SimpleNamespace(
+                    language="da", duration=2.0, duration_after_vad=0.5
+                )
+
+        with patch("src.core.transcriber._import_whisper_model", return_value=_VadModel):
+            transcriber = Transcriber(Path("model"), device="cuda")
+            result = transcriber.transcribe(audio=_FakeAudio(32000), sample_rate=16000)
+
+        self.assertEqual(result.duration_sec, 0.5)
+        self.assertEqual(result.raw_duration_sec, 2.0)
+
+    @patch("src.core.transcriber._import_whisper_model", return_value=_FakeModel)
+    def test_long_recordings_use_batched_pipeline_on_cuda(self, _import_mock) -> None:
+        class _FakeBatchedPipeline:
+            def __init__(self, model) -> None:
+                self.model = model
+                self.calls: list[dict] = []
+
+            def transcribe(self, audio, **options):
+                self.calls.append(options)
+                return [_FakeSegment(" lang")], _FakeInfo()
+
+        with patch(
+            "src.core.transcriber._import_batched_pipeline",
+            return_value=_FakeBatchedPipeline,
+        ):
+            transcriber = Transcriber(Path("model"), device="cuda")
+            short = transcriber.transcribe(audio=_FakeAudio(16000), sample_rate=16000)
+            long = transcriber.transcribe(audio=_FakeAudio(16000 * 45), sample_rate=16000)
+
+        self.assertEqual(short.text, "hej verden")
+        self.assertEqual(long.text, "lang")
+        self.assertEqual(transcriber._batched.calls[0]["batch_size"], 8)
 
     @patch("src.core.transcriber._import_whisper_model", return_value=_FakeModel)
     def test_transcribe_rejects_non_16khz(self, _import_mock) -> None:
@@ -53,6 +123,86 @@ class TranscriberTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             transcriber.transcribe(audio=audio, sample_rate=8000, language="da")
 
+    def test_load_tries_auto_first_and_keeps_resolved_compute_type(self) -> None:
+        attempts: list[str] = []
+
+        class _ResolvingModel(_FakeModel):
+            def __init__(self, model_path, device, compute_type) -> None:
+                attempts.append(compute_type)
+                super().__init__(model_path, device, compute_type)
+                self.model = SimpleNamespace(compute_type="int8_float16")
+
+        with patch(
+            "src.core.transcriber._import_whisper_model", return_value=_ResolvingModel
+        ):
+            transcriber = Transcriber(Path("model"), device="cuda")
+            transcriber.load()
+
+        self.assertEqual(attempts, ["auto"])
+        self.assertEqual(transcriber.compute_type, "int8_float16")
+
+    def test_load_falls_back_and_logs_when_warm_up_fails(self) -> None:
+        class _BrokenKernelModel(_FakeModel):
+            def transcribe(self, audio, language, **options):
+                if self.compute_type == "auto":
+                    raise RuntimeError("cuDNN failed to initialize")
+                return super().transcribe(audio, language, **options)
+
+        with patch(
+            "src.core.transcriber._import_whisper_model", return_value=_BrokenKernelModel
+        ):
+            transcriber = Transcriber(Path("model"), device="cuda")
+            with self.assertLogs("sludre.transcriber", level="WARNING") as logs:
+                transcriber.load()
+
+        self.assertEqual(transcriber.compute_type, "int8_float16")
+        self.assertEqual(transcriber._model.compute_type, "int8_float16")
+        self.assertIn("cuDNN failed to initialize", logs.output[0])
+
+    def test_load_remembers_working_compute_type_next_to_model(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        (tmp / "model.bin").write_bytes(b"ok")
+        attempts: list[str] = []
+
+        class _PickyModel(_FakeModel):
+            def __init__(self, model_path, device, compute_type) -> None:
+                attempts.append(compute_type)
+                if compute_type != "float16":
+                    raise RuntimeError("unsupported")
+                super().__init__(model_path, device, compute_type)
+
+        with patch(
+            "src.core.transcriber._import_whisper_model", return_value=_PickyModel
+        ):
+            Transcriber(tmp, device="cuda").load()
+            first_attempts = list(attempts)
+            attempts.clear()
+            Transcriber(tmp, device="cuda").load()
+            cached_attempts = list(attempts)
+            attempts.clear()
+            os.utime(tmp / "model.bin", ns=(0, 0))
+            Transcriber(tmp, device="cuda").load()
+
+        self.assertEqual(first_attempts, ["auto", "int8_float16", "float16"])
+        self.assertEqual(cached_attempts, ["float16"])
+        self.assertEqual(attempts, ["auto", "int8_float16", "float16"])
+
+    @patch("src.core.transcriber._import_whisper_model", return_value=_FakeModel)
+    def test_transcribe_passes_contiguous_float32_audio(self, _import_mock) -> None:
+        transcriber = Transcriber(Path("model"), device="cuda")
+        pcm = np.array([0, 16384, -32768, 0] * 8000, dtype=np.int16)
+
+        transcriber.transcribe(audio=pcm[::2], sample_rate=16000)
+        converted = transcriber._model.audio
+        float_audio = np.zeros(16000, dtype=np.float32)
+        transcriber.transcribe(audio=float_audio, sample_rate=16000)
+
+        self.assertEqual(converted.dtype, np.float32)
+        self.assertTrue(converted.flags["C_CONTIGUOUS"])
+        self.assertEqual(converted[:2].tolist(), [0.0, -1.0])
+        self.assertIs(transcriber._model.audio, float_audio)
+
 
 if __name__ == "__main__":
     unittest.main()
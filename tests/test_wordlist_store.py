@@ -1,54 +1,140 @@
 from __future__ import annotations
 
+import os
 import shutil
+import tempfile
+import threading
 import unittest
-import uuid
 from pathlib import Path
 
 from src.core.wordlist_store import ReplacementRule, WordlistData, WordlistStore
 
 
+TMP_ROOT = Path(tempfile.gettempdir()) / "sludre-tests"
+
+
 class WordlistStoreTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = TMP_ROOT / f"wordlist_{os.getpid()}"
+        cls._tmp.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._tmp, ignore_errors=True)
+
     def test_load_creates_default_file(self) -> None:
-        tmp = Path(".test_tmp") / f"wordlist_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            path = tmp / "wordlist.json"
-            store = WordlistStore(path)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / "wordlist.json"
+        store = WordlistStore(path)
+
+        data = store.load()
+
+        self.assertEqual(data.replacements, [])
+        self.assertTrue(path.exists())
 
-            data = store.load()
+    def test_load_treats_empty_file_as_empty_wordlist(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / "wordlist.json"
+        path.write_bytes(b"")
 
-            self.assertEqual(data.replacements, [])
-            self.assertTrue(path.exists())
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        data = WordlistStore(path).load()
+
+        self.assertEqual(data.replacements, [])
+        self.assertEqual(data.preferred_terms, [])
+        self.assertEqual(path.read_bytes(), b"")
 
     def test_save_and_load_roundtrip(self) -> None:
-        tmp = Path(".test_tmp") / f"wordlist_{uuid.uuid4().hex}"
-        tmp.mkdir(parents=True, exist_ok=True)
-        try:
-            path = tmp / "wordlist.json"
-            store = WordlistStore(path)
-            expected = WordlistData(
-                replacements=[
-                    ReplacementRule(
-                        source="wrong",
-                        target="right",
-                        match_case=False,
-                        whole_word=True,
-                    )
-                ],
-                preferred_terms=["Hviske", "CUDA"],
-            )
-
-            store.save(expected)
-            loaded = store.load()
-
-            self.assertEqual(len(loaded.replacements), 1)
-            self.assertEqual(loaded.replacements[0].source, "wrong")
-            self.assertEqual(loaded.preferred_terms, ["Hviske", "CUDA"])
-        finally:
-            shutil.rmtree(tmp, ignore_errors=True)
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / "wordlist.json"
+        store = WordlistStore(path)
+        expected = WordlistData(
+            replacements=[
+                ReplacementRule(
+                    source="wrong",
+                    target="right",
+                    match_case=False,
+                    whole_word=True,
+                )
+            ],
+            preferred_terms=["Hviske", "CUDA", "Ærø"],
+        )
+
+        store.save(expected)
+        loaded = store.load()
+
+        self.assertEqual(len(loaded.replacements), 1)
+        self.assertEqual(loaded.replacements[0].source, "wrong")
+        self.assertEqual(loaded.preferred_terms, ["Hviske", "CUDA", "Ærø"])
+        self.assertIn("Ærø", path.read_text(encoding="utf-8"))
+
+    def test_load_reuses_parsed_wordlist_until_file_changes(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / "wordlist.json"
+        store = WordlistStore(path)
+        store.save(WordlistData(preferred_terms=["Hviske"]))
+
+        first = store.load()
+        version = store.version
+        second = store.load()
+
+        path.write_text('{"preferred_terms": ["CUDA", "Sludre"]}', encoding="utf-8")
+        os.utime(path, ns=(0, 0))
+        third = store.load()
+
+        self.assertIs(first, second)
+        self.assertEqual(third.preferred_terms, ["CUDA", "Sludre"])
+        self.assertEqual(store.version, version + 1)
+
+    def test_save_skips_rewrite_when_nothing_changed(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        path = tmp / "wordlist.json"
+        store = WordlistStore(path)
+        store.save(WordlistData(preferred_terms=["Hviske"]))
+        os.utime(path, ns=(0, 0))
+        store._signature = store._file_signature()
+        version = store.version
+
+        store.save(WordlistData(preferred_terms=["Hviske"]))
+
+        self.assertEqual(path.stat().st_mtime_ns, 0)
+        self.assertEqual(store.version, version)
+
+        store.save(WordlistData(preferred_terms=["CUDA"]))
+
+        self.assertNotEqual(path.stat().st_mtime_ns, 0)
+        self.assertEqual(store.version, version + 1)
+
+    def test_load_versioned_pairs_each_version_with_one_wordlist(self) -> None:
+        tmp = self._tmp / self._testMethodName
+        tmp.mkdir()
+        store = WordlistStore(tmp / "wordlist.json")
+        store.save(WordlistData(preferred_terms=["0"]))
+        seen: dict[int, set[tuple[str, ...]]] = {}
+        done = threading.Event()
+
+        def reader() -> None:
+            while not done.is_set():
+                version, data = store.load_versioned()
+                seen.setdefault(version, set()).add(tuple(data.preferred_terms))
+
+        readers = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in readers:
+            thread.start()
+        for index in range(1, 20):
+            store.save(WordlistData(preferred_terms=[str(index)]))
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertTrue(seen)
+        for version, wordlists in seen.items():
+            self.assertEqual(len(wordlists), 1, version)
 
 
 if __name__ == "__main__":